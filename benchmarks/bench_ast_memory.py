@@ -0,0 +1,50 @@
+"""
+Peak memory, time and garbage collections of compiling with and without the syntax tree.
+
+    python -m benchmarks.bench_ast_memory [--sizes 0.25 1]
+
+Sizes are in MiB of generated source.
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from src.compiler.compiler import Compiler
+from benchmarks.bench_parser import generate_source
+
+
+def measure(source: str, parser: str, build_ast: bool) -> tuple[float, int, int]:
+    """Compiles once and returns (seconds, peak traced bytes, collections run)."""
+    session = Compiler(parser=parser, build_ast=build_ast)
+    gc.collect()
+    collections = sum(stats["collections"] for stats in gc.get_stats())
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    program = session.compile(source)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del program
+    return seconds, peak, sum(stats["collections"] for stats in gc.get_stats()) - collections
+
+
+def main(argv=None) -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", type=float, nargs="+", default=[0.25, 1],
+                            help="source sizes in MiB")
+    args = arg_parser.parse_args(argv)
+
+    print(f"{'size':>8} {'parser':>8} {'ast':>5} {'seconds':>9} {'peak MiB':>9} {'gc runs':>8}")
+    for size in args.sizes:
+        source = generate_source(int(size * 1024 * 1024))
+        for parser in ("ply", "descent"):
+            for build_ast in (True, False):
+                seconds, peak, collections = measure(source, parser, build_ast)
+                print(f"{size:>6g}Mi {parser:>8} {'yes' if build_ast else 'no':>5} "
+                      f"{seconds:>9.3f} {peak / 2**20:>9.1f} {collections:>8}")
+
+
+if __name__ == "__main__":
+    main()
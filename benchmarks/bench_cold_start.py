@@ -0,0 +1,117 @@
+"""
+Cold-start budget of the runtime-only entry point.
+
+    python -m benchmarks.bench_cold_start                  # check the default budget
+    python -m benchmarks.bench_cold_start --runs 30 --budget 0.04
+
+A small program is compiled to an artifact, then run `--runs` times in fresh processes
+with `python -m src.runtime` and with `python -m src.cli run`. Each row gives the median
+wall time and the time on top of a bare interpreter start (`python -c pass`). The
+command exits with 1 when the runtime entry point takes more than `--budget` seconds
+over the interpreter, or when importing it loads a compiler module.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from src.compiler.compiler import Compiler
+from src.virtual_machine.artifact import write_artifact
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET = 0.060   # seconds on top of the interpreter start
+
+# modules that only the compiler needs
+COMPILER_MODULES = (
+    "ply", "dataclasses", "argparse", "tempfile",
+    "src.lexer", "src.parser", "src.syntax_tree", "src.compiler", "src.cli",
+    "src.semantic.function_dir", "src.semantic.var_table", "src.semantic.semantic_cube",
+    "src.intermediate_generation.intermediate_generator",
+    "src.intermediate_generation.constants_table",
+    "src.intermediate_generation.quadruples_list",
+)
+
+PROGRAM = """
+program hello;
+var i: int;
+main {
+    i = 0;
+    while (i < 3) do {
+        i = i + 1;
+    };
+    print("hello", i);
+}
+end
+"""
+
+
+def timed_runs(command: list[str], runs: int) -> list[float]:
+    """Wall time of each run of the command in a fresh process."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=REPO_ROOT, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def runtime_modules() -> list[str]:
+    """The modules a fresh process has loaded after importing the runtime entry point."""
+    code = "import sys, src.runtime; print('\\n'.join(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return output.split()
+
+
+def compiler_modules(modules: list[str]) -> list[str]:
+    """The modules in the list that only the compiler should need."""
+    return [
+        module for module in modules
+        if any(module == prefix or module.startswith(prefix + ".") for prefix in COMPILER_MODULES)
+    ]
+
+
+def measure(artifact: str, runs: int) -> dict[str, float]:
+    """Median start-to-exit time of each way of running the artifact, in seconds."""
+    commands = {
+        "interpreter": [sys.executable, "-c", "pass"],
+        "runtime": [sys.executable, "-m", "src.runtime", artifact],
+        "cli run": [sys.executable, "-m", "src.cli", "run", artifact],
+    }
+    return {name: statistics.median(timed_runs(command, runs)) for name, command in commands.items()}
+
+
+def main(argv=None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--runs", type=int, default=15)
+    arg_parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                            help="seconds the runtime may take on top of the interpreter start")
+    args = arg_parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        artifact = os.path.join(directory, "hello.bdo")
+        write_artifact(Compiler().compile(PROGRAM).to_image(), artifact)
+        results = measure(artifact, args.runs)
+
+    interpreter = results["interpreter"]
+    print(f"{'':<12} {'median s':>9} {'over python':>12}")
+    for name, seconds in results.items():
+        print(f"{name:<12} {seconds:>9.4f} {seconds - interpreter:>12.4f}")
+
+    failures = []
+    loaded = compiler_modules(runtime_modules())
+    if loaded:
+        failures.append(f"the runtime imports compiler modules: {', '.join(loaded)}")
+    overhead = results["runtime"] - interpreter
+    if overhead > args.budget:
+        failures.append(f"the runtime takes {overhead:.4f} s over the interpreter, budget {args.budget:.4f} s")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
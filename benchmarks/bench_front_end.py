@@ -0,0 +1,166 @@
+"""
+Front-end throughput across program sizes: tokens per second of the lexers, reductions
+per second of the PLY parser and quadruples per second of the intermediate generator.
+
+The generator is timed on its own through the codegen phase of CompileMetrics, the
+reductions and the "quadruples" rows are against the whole compilation.
+
+    python -m benchmarks.bench_front_end                    # 1 KiB to 1 MiB
+    python -m benchmarks.bench_front_end --full             # 1 KiB to 100 MiB
+    python -m benchmarks.bench_front_end --sizes 1K 64K 4M --json curves.json
+
+For every measure the report adds the scaling exponent against the previous size,
+log(time ratio) / log(size ratio): about 1.0 is linear, anything clearly above it
+is superlinear and is flagged with "!".
+"""
+import argparse
+import copy
+import json
+import math
+import time
+from src.compiler.compiler import Compiler
+from src.lexer.lexer import lexer as ply_lexer
+from src.lexer.scanner import Scanner
+from benchmarks.bench_parser import FUNCTION, STATEMENTS, GROUPS_PER_FUNCTION
+
+DEFAULT_SIZES = ["1K", "10K", "100K", "1M"]
+FULL_SIZES = DEFAULT_SIZES + ["10M", "100M"]
+SUPERLINEAR = 1.15
+UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parse_size(text: str) -> int:
+    """'64K' -> 65536"""
+    unit = UNITS.get(text[-1:].upper())
+    return int(float(text[:-1]) * unit) if unit else int(text)
+
+
+def generate_source(size_bytes: int) -> str:
+    """
+    Like bench_parser.generate_source, but the last function only gets the statement
+    groups that fit, so small sizes stay close to the requested one.
+    """
+    groups = max(1, (size_bytes - len(FUNCTION)) // len(STATEMENTS))
+    functions = []
+    while groups > 0:
+        count = min(groups, GROUPS_PER_FUNCTION)
+        functions.append(FUNCTION.format(n=len(functions), statements=STATEMENTS * count))
+        groups -= count
+    return "program bench;\n" + "".join(functions) + "main {\n    f0(1);\n}\nend\n"
+
+
+def count_reductions(session: Compiler) -> list[int]:
+    """
+    Makes the session's parser count its reductions. The productions are copied, so
+    the module-level parser and other sessions are not affected.
+    """
+    counter = [0]
+    productions = []
+    for production in session.parser.productions:
+        production = copy.copy(production)
+        if production.callable is not None:
+            def counting(p, action=production.callable):
+                counter[0] += 1
+                action(p)
+            production.callable = counting
+        productions.append(production)
+    session.parser.productions = productions
+    return counter
+
+
+def time_lexer(lexer, source: str) -> tuple[int, float]:
+    lexer.lineno = 1
+    lexer.input(source)
+    token = lexer.token
+    count = 0
+    start = time.perf_counter()
+    while token() is not None:
+        count += 1
+    return count, time.perf_counter() - start
+
+
+def time_compile(session: Compiler, source: str) -> tuple[int, float]:
+    start = time.perf_counter()
+    program = session.compile(source)
+    return len(program.quadruples), time.perf_counter() - start
+
+
+def measure(source: str) -> dict:
+    """Returns {measure: (work items, seconds)} for one source."""
+    results = {
+        "ply lexer tokens": time_lexer(ply_lexer.clone(), source),
+        "scanner tokens": time_lexer(Scanner(), source),
+    }
+
+    # reductions are counted and the generator is timed in a separate, instrumented
+    # run, the wrappers would skew the end-to-end timing
+    counting = Compiler(collect_metrics=True)
+    reductions = count_reductions(counting)
+    program = counting.compile(source)
+    results["generator quadruples"] = (len(program.quadruples), program.metrics.phases["codegen"].wall_time)
+
+    quadruples, seconds = time_compile(Compiler(), source)
+    results["ply parser reductions"] = (reductions[0], seconds)
+    results["ply quadruples"] = (quadruples, seconds)
+    results["descent quadruples"] = time_compile(Compiler(scanner="fast", parser="descent"), source)
+    return results
+
+
+def scaling_exponents(sizes: list[int], seconds: list[float]) -> list[float | None]:
+    """
+    The local log-log slope of time against size between consecutive points, None for
+    the first point and where it is undefined.
+    """
+    exponents = [None]
+    for size_a, time_a, size_b, time_b in zip(sizes, seconds, sizes[1:], seconds[1:]):
+        if size_b == size_a or time_a <= 0 or time_b <= 0:
+            exponents.append(None)
+        else:
+            exponents.append(math.log(time_b / time_a) / math.log(size_b / size_a))
+    return exponents
+
+
+def main(argv=None) -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", nargs="+", help="source sizes, e.g. 1K 512K 8M")
+    arg_parser.add_argument("--full", action="store_true", help=f"use the sizes {' '.join(FULL_SIZES)}")
+    arg_parser.add_argument("--json", metavar="PATH", help="write the curves to a JSON file")
+    args = arg_parser.parse_args(argv)
+
+    labels = args.sizes or (FULL_SIZES if args.full else DEFAULT_SIZES)
+    sizes, rows = [], []
+    for label in labels:
+        source = generate_source(parse_size(label))
+        sizes.append(len(source))
+        rows.append(measure(source))
+        print(f"measured {label} ({len(source):,} bytes)", flush=True)
+
+    curves = {}
+    for name in rows[0]:
+        counts = [row[name][0] for row in rows]
+        seconds = [row[name][1] for row in rows]
+        curves[name] = {
+            "sizes": sizes,
+            "items": counts,
+            "seconds": seconds,
+            "items_per_second": [count / elapsed for count, elapsed in zip(counts, seconds)],
+            "scaling_exponent": scaling_exponents(sizes, seconds),
+        }
+
+    for name, curve in curves.items():
+        print(f"\n{name}")
+        print(f"{'bytes':>12} {'items':>12} {'seconds':>9} {'items/s':>12} {'exponent':>9}")
+        for size, count, elapsed, rate, exponent in zip(
+                curve["sizes"], curve["items"], curve["seconds"], curve["items_per_second"],
+                curve["scaling_exponent"]):
+            flag = "!" if exponent is not None and exponent > SUPERLINEAR else ""
+            exponent_text = "" if exponent is None else f"{exponent:.2f}{flag}"
+            print(f"{size:>12,} {count:>12,} {elapsed:>9.3f} {rate:>12,.0f} {exponent_text:>9}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(curves, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
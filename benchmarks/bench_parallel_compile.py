@@ -0,0 +1,47 @@
+"""
+Compile time of the two-phase parallel compiler against the number of workers.
+
+    python -m benchmarks.bench_parallel_compile [--functions 2000] [--workers 1 2 4 8] [--repeat 3]
+
+Each row gives the best time of a warm pool and the speedup over a full compilation
+in this process. The speedup is bounded by the cores of the machine.
+"""
+import argparse
+import os
+import time
+from benchmarks.program_generator import GeneratorOptions, generate_program
+from src.compiler.compiler import Compiler
+from src.compiler.parallel_compiler import ParallelCompiler
+
+
+def best_time(repeat: int, compile_function, source: str) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compile_function(source)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None) -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--functions", type=int, default=2000)
+    arg_parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    source = "".join(generate_program(GeneratorOptions(seed=1, functions=args.functions)))
+    full = best_time(args.repeat, lambda text: Compiler().compile(text).to_image(), source)
+
+    print(f"{args.functions} functions, {len(source) / 1024:,.0f} KiB, {os.cpu_count()} cores")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    print(f"{'full':>8} {full:>9.3f} {1:>7.2f}x")
+    for workers in args.workers:
+        with ParallelCompiler(workers) as compiler:
+            compiler.compile(source)    # starts the pool
+            seconds = best_time(args.repeat, compiler.compile, source)
+        print(f"{workers:>8} {seconds:>9.3f} {full / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
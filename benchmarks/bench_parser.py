@@ -0,0 +1,74 @@
+"""
+Compile throughput of the PLY parser and the recursive-descent parser.
+
+    python -m benchmarks.bench_parser [--sizes 0.25 1] [--repeat 3]
+
+Sizes are in MiB of generated source.
+"""
+import argparse
+import time
+from src.compiler.compiler import Compiler
+
+FUNCTION = """\
+void f{n}(p: int) [
+    var i, total, a, b: int;
+        ratio: float;
+    {{
+{statements}    }}
+];
+"""
+
+STATEMENTS = """\
+        total = total + i * 2 - (ratio / 3.5);
+        print("value", total, p);
+        if (a != b) { a = 1; } else { b = a; };
+        while (i < 100) do { i = i + 1; };
+"""
+
+# statement groups per function, the temporaries are reset at each function end
+GROUPS_PER_FUNCTION = 40
+
+# (scanner, parser) pairs to compare, the first one is the baseline
+FRONT_ENDS = [("ply", "ply"), ("ply", "descent"), ("fast", "descent")]
+
+
+def generate_source(size_bytes: int) -> str:
+    """A valid program of roughly `size_bytes` characters."""
+    function_size = len(FUNCTION) + GROUPS_PER_FUNCTION * len(STATEMENTS)
+    functions = [
+        FUNCTION.format(n=n, statements=STATEMENTS * GROUPS_PER_FUNCTION)
+        for n in range(max(1, size_bytes // function_size))
+    ]
+    return "program bench;\n" + "".join(functions) + "main {\n    f0(1);\n}\nend\n"
+
+
+def best_time(repeat: int, scanner: str, parser: str, source: str) -> float:
+    session = Compiler(scanner=scanner, parser=parser)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        session.compile(source)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None) -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", type=float, nargs="+", default=[0.25, 1],
+                            help="source sizes in MiB")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    print(f"{'size':>8} {'scanner':>8} {'parser':>8} {'seconds':>9} {'KiB/s':>9} {'speedup':>8}")
+    for size in args.sizes:
+        source = generate_source(int(size * 1024 * 1024))
+        baseline = None
+        for scanner, parser in FRONT_ENDS:
+            seconds = best_time(args.repeat, scanner, parser, source)
+            baseline = baseline or seconds
+            print(f"{size:>6g}Mi {scanner:>8} {parser:>8} {seconds:>9.3f} "
+                  f"{len(source) / 1024 / seconds:>9,.0f} {baseline / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Tokens per second of the PLY lexer and the hand-written scanner on large sources.
+
+    python -m benchmarks.bench_scanner [--sizes 1 8 32] [--repeat 3]
+
+Sizes are in MiB of generated source.
+"""
+import argparse
+import time
+from src.lexer.lexer import lexer as ply_lexer
+from src.lexer.scanner import Scanner
+
+STATEMENTS = """\
+    total = total + i * 2 - (ratio / 3.5);
+    print("value", total, 10);
+    if (a != b) { a = 1; } else { b = a; };
+    while (i < 100) do { i = i + 1; };
+"""
+
+
+def generate_source(size_bytes: int) -> str:
+    """A syntactically plausible program of roughly `size_bytes` characters."""
+    repeats = max(1, size_bytes // len(STATEMENTS))
+    return "program bench;\nvar i, total, a, b: int;\n    ratio: float;\nmain {\n" \
+        + STATEMENTS * repeats + "}\nend\n"
+
+
+def count_tokens(lexer, source: str) -> tuple[int, float]:
+    """Scans the whole source and returns (tokens, seconds)."""
+    lexer.lineno = 1
+    lexer.input(source)
+    token = lexer.token
+    count = 0
+    start = time.perf_counter()
+    while token() is not None:
+        count += 1
+    return count, time.perf_counter() - start
+
+
+def best_of(repeat: int, make_lexer, source: str) -> tuple[int, float]:
+    runs = [count_tokens(make_lexer(), source) for _ in range(repeat)]
+    return min(runs, key=lambda run: run[1])
+
+
+def main(argv=None) -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", type=float, nargs="+", default=[1, 8, 32],
+                            help="source sizes in MiB")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    print(f"{'size':>8} {'tokens':>11} {'ply tok/s':>12} {'scanner tok/s':>14} {'speedup':>8}")
+    for size in args.sizes:
+        source = generate_source(int(size * 1024 * 1024))
+        ply_count, ply_time = best_of(args.repeat, ply_lexer.clone, source)
+        fast_count, fast_time = best_of(args.repeat, Scanner, source)
+        assert ply_count == fast_count, "the scanners disagree on the token count"
+
+        print(f"{size:>6g}Mi {ply_count:>11,} {ply_count / ply_time:>12,.0f} "
+              f"{fast_count / fast_time:>14,.0f} {ply_time / fast_time:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Virtual machine benchmark suite with regression baselines.
+
+    python -m benchmarks.bench_vm                       # compare with the baseline
+    python -m benchmarks.bench_vm --update-baseline     # record a new baseline
+    python -m benchmarks.bench_vm --only fibonacci_tr nested_loops --runs 5
+
+Each workload in benchmarks/workloads is compiled once, then run `--runs` times with
+its output discarded. The report gives instructions per second (best run), the median
+wall time, the peak traced memory and the deepest call stack of the run. The command
+exits with 1 when a workload is slower, or uses more memory, than the baseline by more
+than `--threshold`. Baselines depend on the machine: record them where they are checked.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from src.compiler.compiler import Compiler
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKLOADS_DIR = os.path.join(BENCHMARKS_DIR, "workloads")
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baselines", "vm.json")
+DEFAULT_THRESHOLD = 0.20
+WORKLOAD_SUFFIX = ".bd"
+
+
+def workload_names() -> list[str]:
+    return sorted(name[:-len(WORKLOAD_SUFFIX)] for name in os.listdir(WORKLOADS_DIR)
+                  if name.endswith(WORKLOAD_SUFFIX))
+
+
+def traced_run(image) -> tuple[int, int]:
+    """Runs the program once under tracemalloc, returns (peak bytes, max call depth)."""
+    vm = VirtualMachine.from_image(image)
+    call_stack = vm.memory.call_stack
+    push = vm.memory.push_pending_call_entry
+    max_depth = len(call_stack.stack)
+
+    def push_and_measure(return_index: int) -> None:
+        nonlocal max_depth
+        push(return_index)
+        max_depth = max(max_depth, len(call_stack.stack))
+
+    vm.memory.push_pending_call_entry = push_and_measure
+
+    tracemalloc.start()
+    try:
+        vm.run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak, max_depth
+
+
+def measure(name: str, runs: int, compiler: Compiler) -> dict:
+    """Runs one workload and returns its metrics."""
+    image = compiler.compile_file(os.path.join(WORKLOADS_DIR, name + WORKLOAD_SUFFIX)).to_image()
+
+    times = []
+    instructions = 0
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(runs):
+            vm = VirtualMachine.from_image(image)
+            start = time.perf_counter()
+            instructions = vm.run()
+            times.append(time.perf_counter() - start)
+        peak_memory, call_depth = traced_run(image)
+
+    return {
+        "instructions": instructions,
+        "instructions_per_second": instructions / min(times),
+        "wall_time": statistics.median(times),
+        "peak_memory": peak_memory,
+        "call_depth": call_depth,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Returns a description of every regression of `results` against `baseline`."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["instructions"] != previous["instructions"]:
+            regressions.append(f"{name}: executes {current['instructions']} instructions, "
+                               f"baseline {previous['instructions']}")
+        if current["instructions_per_second"] < previous["instructions_per_second"] * (1 - threshold):
+            regressions.append(f"{name}: {current['instructions_per_second']:,.0f} instr/s, "
+                               f"baseline {previous['instructions_per_second']:,.0f}")
+        if current["peak_memory"] > previous["peak_memory"] * (1 + threshold):
+            regressions.append(f"{name}: peak memory {current['peak_memory']:,} bytes, "
+                               f"baseline {previous['peak_memory']:,}")
+    return regressions
+
+
+def load_baseline(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["workloads"]
+
+
+def write_baseline(path: str, results: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "workloads": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--only", nargs="+", choices=workload_names(), metavar="WORKLOAD")
+    arg_parser.add_argument("--runs", type=int, default=3)
+    arg_parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    arg_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                            help="tolerated slowdown or memory growth, as a fraction")
+    arg_parser.add_argument("--update-baseline", action="store_true")
+    args = arg_parser.parse_args(argv)
+
+    compiler = Compiler()
+    results = {}
+    print(f"{'workload':<16} {'instructions':>12} {'instr/s':>12} {'wall s':>8} {'peak KiB':>9} {'depth':>6}")
+    for name in args.only or workload_names():
+        result = results[name] = measure(name, args.runs, compiler)
+        print(f"{name:<16} {result['instructions']:>12} {result['instructions_per_second']:>12,.0f} "
+              f"{result['wall_time']:>8.3f} {result['peak_memory'] / 1024:>9.1f} {result['call_depth']:>6}")
+
+    if args.update_baseline:
+        if args.only and os.path.exists(args.baseline):
+            results = {**load_baseline(args.baseline), **results}
+        write_baseline(args.baseline, results)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, run with --update-baseline", file=sys.stderr)
+        return 0
+
+    regressions = compare(results, load_baseline(args.baseline), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+"""
+Seeded generator of valid Baby Duck programs for scale and stress testing.
+
+    python -m benchmarks.program_generator -o big.bd --size 200M --seed 7
+    python -m benchmarks.program_generator -o deep.bd --functions 50 --nesting 4 --recursion 0.5
+
+The same options and seed always produce the same program. Functions are written as
+they are generated, so the size of the output is not bounded by memory.
+
+Generated programs compile and run to completion:
+- every variable is assigned before it is read, and divisors are non-zero constants
+- functions only call the ones declared before them or themselves, always behind an
+  `if (d > 0)` guard that passes `d - 1`, so `call_depth` bounds the call tree
+- loops count a dedicated variable up to `loop_iterations`
+- int variables stay bounded: locals are computed from parameters, loop counters and
+  constants, only multiplied by constants, and globals only accumulate locals
+- float expressions start with a float, so float variables never hold ints and they
+  overflow to inf instead of growing without bound
+- constants come from small pools, and each function stays under `TEMP_BUDGET`
+  temporaries
+"""
+import argparse
+import random
+import sys
+from dataclasses import dataclass
+from typing import Iterator, TextIO
+from benchmarks.bench_front_end import parse_size
+
+INT_CONSTANTS = [str(n) for n in range(1, 50)]
+FLOAT_CONSTANTS = [f"{n}.5" for n in range(0, 20)]
+STRINGS = [f'"label {n}"' for n in range(20)]
+
+ARITHMETIC = ["+", "-", "*", "/"]
+RELATIONAL = ["<", ">", "!="]
+
+# statement kinds and their weights, the blocks are only drawn below `nesting`
+STATEMENT_WEIGHTS = {"assign": 6, "print": 1, "if": 2, "while": 1}
+BLOCK_STATEMENTS = ("if", "while")
+
+INDENT = "    "
+
+# temporaries a generated function may use, counting all types together; it keeps the
+# frames of generated programs small whatever the address space allows
+TEMP_BUDGET = 2000
+
+
+@dataclass
+class GeneratorOptions:
+    seed: int = 0
+    functions: int = 10
+    # stop adding functions once the output reaches this many bytes (overrides `functions`)
+    size: int | None = None
+    variables: int = 3              # of each type, per scope
+    parameters: int = 2             # int parameters besides the depth budget `d`
+    statements: int = 20            # per function, counting the nested ones
+    nesting: int = 2                # of if / while blocks
+    expression_length: int = 4      # operands per expression
+    fan_out: int = 2                # guarded calls per function
+    recursion: float = 0.2          # fraction of the calls that are recursive
+    call_depth: int = 3             # depth budget passed by main
+    loop_iterations: int = 3
+
+    def validate(self) -> None:
+        if self.functions < 0 or (self.size is not None and self.size < 0):
+            raise ValueError("functions and size must not be negative")
+        if not 1 <= self.variables <= TEMP_BUDGET // 2:
+            raise ValueError(f"variables must be between 1 and {TEMP_BUDGET // 2}")
+        if min(self.parameters, self.statements, self.nesting, self.fan_out,
+               self.call_depth, self.loop_iterations) < 0:
+            raise ValueError("counts must not be negative")
+        if self.fan_out > TEMP_BUDGET // 4:
+            raise ValueError(f"fan_out must be at most {TEMP_BUDGET // 4}")
+        if self.expression_length < 1:
+            raise ValueError("expression_length must be at least 1")
+        if not 0 <= self.recursion <= 1:
+            raise ValueError("recursion must be between 0 and 1")
+
+
+class ProgramGenerator:
+    """
+    Generates one program as a stream of text chunks, one per function.
+    """
+
+    def __init__(self, options: GeneratorOptions):
+        options.validate()
+        self.options = options
+        self.random = random.Random(options.seed)
+        self.functions_generated = 0
+
+        self.global_ints = [f"gi{n}" for n in range(options.variables)]
+        self.global_floats = [f"gf{n}" for n in range(options.variables)]
+        self.params = [f"a{n}" for n in range(options.parameters)]
+        self.local_ints = [f"li{n}" for n in range(options.variables)]
+        self.local_floats = [f"lf{n}" for n in range(options.variables)]
+        self.counters = [f"w{n}" for n in range(options.nesting)]
+
+        # per function state
+        self.temps_left = 0
+        self.statements_left = 0
+
+    # ────────────────────────────────────────────────────────────────
+    # Program structure
+    # ────────────────────────────────────────────────────────────────
+    def chunks(self) -> Iterator[str]:
+        """Yields the program text, one function at a time."""
+        options = self.options
+        written = 0
+        header = (f"program generated{options.seed};\nvar "
+                  f"{', '.join(self.global_ints)}: int;\n    {', '.join(self.global_floats)}: float;\n\n")
+        yield header
+        written += len(header)
+
+        while (written < options.size if options.size is not None
+               else self.functions_generated < options.functions):
+            function = self.function(self.functions_generated)
+            self.functions_generated += 1
+            written += len(function)
+            yield function
+
+        yield self.main()
+
+    def function(self, index: int) -> str:
+        options = self.options
+        # every guarded call takes two temporaries: `d > 0` and `d - 1`
+        self.temps_left = TEMP_BUDGET - 2 * options.fan_out
+        self.statements_left = options.statements
+
+        params = ", ".join(f"{name}: int" for name in ["d"] + self.params)
+        lines = [f"void f{index}({params}) [",
+                 f"{INDENT}var {', '.join(self.local_ints + self.counters)}: int;",
+                 f"{INDENT}    {', '.join(self.local_floats)}: float;",
+                 f"{INDENT}{{"]
+        depth = 2
+        for name in self.local_ints + self.counters:
+            lines.append(f"{INDENT * depth}{name} = {self.int_constant()};")
+        for name in self.local_floats:
+            lines.append(f"{INDENT * depth}{name} = {self.float_constant()};")
+
+        body = self.block(depth, 0, options.statements)
+        # the calls go between the top level statements
+        for _ in range(options.fan_out):
+            body.insert(self.random.randint(0, len(body)), self.guarded_call(index, depth))
+        for statement in body:
+            lines.extend(statement)
+
+        lines.append(f"{INDENT}}}")
+        lines.append("];\n\n")
+        return "\n".join(lines)
+
+    def main(self) -> str:
+        lines = ["main {"]
+        for name in self.global_ints:
+            lines.append(f"{INDENT}{name} = {self.int_constant()};")
+        for name in self.global_floats:
+            lines.append(f"{INDENT}{name} = {self.float_constant()};")
+        for index in range(self.functions_generated):
+            args = [str(self.options.call_depth)] + [self.int_constant() for _ in self.params]
+            lines.append(f"{INDENT}f{index}({', '.join(args)});")
+        lines.append(f"{INDENT}print({', '.join(self.global_ints + self.global_floats)});")
+        lines.append("}\nend\n")
+        return "\n".join(lines)
+
+    # ────────────────────────────────────────────────────────────────
+    # Statements, each one as a list of lines
+    # ────────────────────────────────────────────────────────────────
+    def block(self, depth: int, level: int, count: int) -> list[list[str]]:
+        statements = []
+        while count > 0 and self.statements_left > 0:
+            self.statements_left -= 1
+            count -= 1
+            kinds = [kind for kind in STATEMENT_WEIGHTS if kind not in BLOCK_STATEMENTS
+                     or (level < self.options.nesting and self.temps_left >= 2)]
+            kind = self.random.choices(kinds, [STATEMENT_WEIGHTS[kind] for kind in kinds])[0]
+            statements.append(getattr(self, f"{kind}_statement")(depth, level))
+        return statements
+
+    def nested(self, depth: int, level: int) -> list[str]:
+        lines = []
+        for statement in self.block(depth + 1, level + 1, self.random.randint(1, 3)):
+            lines.extend(statement)
+        return lines
+
+    def assign_statement(self, depth: int, level: int) -> list[str]:
+        indent = INDENT * depth
+        draw = self.random.random()
+        if draw < 0.1:
+            target = self.random.choice(self.global_ints)
+            return [f"{indent}{target} = {target} + {self.int_expression(self.local_ints + self.params)};"]
+        if draw < 0.2:
+            target = self.random.choice(self.global_floats)
+            return [f"{indent}{target} = {target} + {self.float_expression()};"]
+        if draw < 0.6:
+            target = self.random.choice(self.local_ints)
+            return [f"{indent}{target} = {self.int_expression(self.params + self.counters + ['d'])};"]
+        return [f"{indent}{self.random.choice(self.local_floats)} = {self.float_expression()};"]
+
+    def print_statement(self, depth: int, level: int) -> list[str]:
+        return [f"{INDENT * depth}print({self.random.choice(STRINGS)}, {self.float_expression()});"]
+
+    def if_statement(self, depth: int, level: int) -> list[str]:
+        indent = INDENT * depth
+        # the relational operator takes one temporary
+        self.temps_left -= 1
+        condition = f"{self.float_expression()} {self.random.choice(RELATIONAL)} {self.float_expression()}"
+        lines = [f"{indent}if ({condition}) {{", *self.nested(depth, level)]
+        if self.statements_left > 0 and self.random.random() < 0.5:
+            lines += [f"{indent}}} else {{", *self.nested(depth, level)]
+        lines.append(f"{indent}}};")
+        return lines
+
+    def while_statement(self, depth: int, level: int) -> list[str]:
+        indent = INDENT * depth
+        counter = self.counters[level]
+        self.temps_left -= 2
+        return [
+            f"{indent}{counter} = 0;",
+            f"{indent}while ({counter} < {self.options.loop_iterations}) do {{",
+            *self.nested(depth, level),
+            f"{indent}{INDENT}{counter} = {counter} + 1;",
+            f"{indent}}};",
+        ]
+
+    def guarded_call(self, index: int, depth: int) -> list[str]:
+        if index == 0 or self.random.random() < self.options.recursion:
+            callee = index
+        else:
+            callee = self.random.randrange(index)
+        args = ["d - 1"] + [self.random.choice(self.local_ints + self.params + self.counters)
+                            for _ in self.params]
+        indent = INDENT * depth
+        return [f"{indent}if (d > 0) {{", f"{indent}{INDENT}f{callee}({', '.join(args)});", f"{indent}}};"]
+
+    # ────────────────────────────────────────────────────────────────
+    # Expressions
+    # ────────────────────────────────────────────────────────────────
+    def int_constant(self) -> str:
+        return self.random.choice(INT_CONSTANTS)
+
+    def float_constant(self) -> str:
+        return self.random.choice(FLOAT_CONSTANTS)
+
+    def expression_length(self) -> int:
+        """Each operator takes one temporary, the length shrinks to the ones left."""
+        length = min(self.random.randint(1, self.options.expression_length), self.temps_left + 1)
+        self.temps_left -= length - 1
+        return length
+
+    def int_expression(self, names: list[str]) -> str:
+        """Sums of `names` and constants, only multiplied by constants."""
+        parts = [self.random.choice(names)]
+        for _ in range(self.expression_length() - 1):
+            operator = self.random.choice(["+", "-", "*"])
+            right = self.int_constant() if operator == "*" or self.random.random() < 0.3 \
+                else self.random.choice(names)
+            parts.append(f"{operator} {right}")
+        return " ".join(parts)
+
+    def float_expression(self) -> str:
+        """Any numeric operands after a leading float, divisors are non-zero constants."""
+        floats = self.local_floats + self.global_floats
+        names = floats + self.local_ints + self.params + self.counters + self.global_ints
+        parts = [self.random.choice(floats) if self.random.random() < 0.7 else self.float_constant()]
+        length = self.expression_length()
+        for _ in range(length - 1):
+            operator = self.random.choice(ARITHMETIC)
+            if operator == "/":
+                right = self.int_constant()
+            elif self.random.random() < 0.7:
+                right = self.random.choice(names)
+            else:
+                right = self.random.choice([self.int_constant, self.float_constant])()
+            parts.append(f"{operator} {right}")
+        text = " ".join(parts)
+        if length > 2 and self.random.random() < 0.3:
+            text = f"({text})"
+        return text
+
+
+def generate_program(options: GeneratorOptions) -> Iterator[str]:
+    """Yields the text of the program described by `options` in chunks."""
+    return ProgramGenerator(options).chunks()
+
+
+def write_program(options: GeneratorOptions, output: TextIO) -> int:
+    """Writes the program to `output` and returns the number of characters written."""
+    written = 0
+    for chunk in generate_program(options):
+        output.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def main(argv=None) -> None:
+    defaults = GeneratorOptions()
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("-o", "--output", help="output file, stdout by default")
+    arg_parser.add_argument("--size", help="approximate output size, e.g. 64K or 200M")
+    for name, value in vars(defaults).items():
+        if name != "size":
+            arg_parser.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value)
+    args = vars(arg_parser.parse_args(argv))
+
+    output_path = args.pop("output")
+    size = args.pop("size")
+    options = GeneratorOptions(**args, size=parse_size(size) if size else None)
+
+    if output_path is None:
+        write_program(options, sys.stdout)
+        return
+    with open(output_path, "w", encoding="utf-8") as f:
+        written = write_program(options, f)
+    print(f"wrote {written:,} bytes to {output_path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+from .cli import main, load_program, warm_compiler
+
+__all__ = [
+    "main",
+    "load_program",
+    "warm_compiler",
+]
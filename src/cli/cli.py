@@ -0,0 +1,208 @@
+"""
+Command-line driver of the Baby Duck compiler.
+
+    python -m src.cli compile program.bd [-o program.bdo] [--metrics metrics.json] [-g] [--module] [--shake]
+    python -m src.cli link program.bd library.bdm ... [-o program.bdo] [--entry NAME] [--shake]
+    python -m src.cli run program.bd|program.bdo
+    python -m src.cli bench program.bd|program.bdo [-n 20] [--warmup 2]
+    python -m src.cli profile program.bd|program.bdo [--top 10]
+
+Sources are compiled with one compiler per process (see `warm_compiler`), so the
+parser tables are loaded once however many programs a job compiles.
+"""
+import argparse
+import contextlib
+import functools
+import os
+import statistics
+import sys
+import time
+from src.compiler.compiler import Compiler, SCANNERS, PARSERS
+from src.compiler.program_layout import ProgramLayoutError
+from src.compiler.linker import link_modules
+from src.compiler.module_object import compile_module, write_module, load_module, is_module, MODULE_SUFFIX
+from src.compiler.tree_shaker import shake_image
+from src.errors.error import Error
+from src.errors.internal_compiler_error import CompilerBug
+from src.errors.semantic_errors import SemanticError
+from src.virtual_machine.artifact import write_artifact, load_artifact, is_artifact
+from src.virtual_machine.program_image import ProgramImage
+from src.virtual_machine.profiler import profile_image
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+PROG = "baby-duck"
+ARTIFACT_SUFFIX = ".bdo"
+PERCENTILES = (50, 90, 99)
+
+# reported as a message with exit status 1 (RuntimeError covers running out of addresses)
+REPORTED_ERRORS = (Error, SemanticError, SyntaxError, ProgramLayoutError, CompilerBug,
+                   RuntimeError, OSError, ZeroDivisionError)
+
+
+@functools.lru_cache(maxsize=None)
+def warm_compiler(scanner: str = "ply", parser: str = "ply", collect_metrics: bool = False,
+                  record_lines: bool = False) -> Compiler:
+    """Returns the process-wide compiler for the given options, created on first use."""
+    return Compiler(scanner=scanner, parser=parser, collect_metrics=collect_metrics,
+                    record_lines=record_lines)
+
+
+def load_program(path: str, scanner: str = "ply", parser: str = "ply",
+                 record_lines: bool = False) -> ProgramImage:
+    """Loads a compiled artifact, or compiles a source file."""
+    if is_artifact(path):
+        return load_artifact(path)
+    return warm_compiler(scanner, parser, record_lines=record_lines).compile_file(path).to_image()
+
+
+def percentile(sorted_values: list[float], percent: int) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, -(-percent * len(sorted_values) // 100))
+    return sorted_values[rank - 1]
+
+
+# ---------------------------------------------------------------------------
+#  Subcommands
+
+def command_compile(args) -> int:
+    if args.module:
+        return compile_module_file(args)
+    output = args.output or os.path.splitext(args.source)[0] + ARTIFACT_SUFFIX
+    compiler = warm_compiler(args.scanner, args.parser, collect_metrics=args.metrics is not None,
+                             record_lines=args.lines)
+    program = compiler.compile_file(args.source)
+    image = program.to_image()
+    write_artifact(shake_image(image) if args.shake else image, output)
+
+    if args.metrics is not None:
+        program.metrics.write_json(args.metrics)
+    print(f"{args.source} -> {output} ({len(program.quadruples)} quadruples)", file=sys.stderr)
+    return 0
+
+
+def compile_module_file(args) -> int:
+    output = args.output or os.path.splitext(args.source)[0] + MODULE_SUFFIX
+    with open(args.source, encoding="utf-8") as f:
+        module = compile_module(f.read())
+    write_module(module, output)
+    print(f"{args.source} -> {output} ({len(module.code)} quadruples, "
+          f"{len(module.exports)} exported functions)", file=sys.stderr)
+    return 0
+
+
+def command_link(args) -> int:
+    output = args.output or os.path.splitext(args.inputs[0])[0] + ARTIFACT_SUFFIX
+    # like a linker command line, each source may call the modules listed after it
+    modules = []
+    for path in reversed(args.inputs):
+        if is_module(path):
+            modules.insert(0, load_module(path))
+        else:
+            with open(path, encoding="utf-8") as f:
+                modules.insert(0, compile_module(f.read(), modules))
+    image = link_modules(modules, args.entry)
+    if args.shake:
+        image = shake_image(image)
+    write_artifact(image, output)
+    print(f"{len(modules)} modules -> {output} ({len(image.quadruples)} quadruples)", file=sys.stderr)
+    return 0
+
+
+def command_run(args) -> int:
+    image = load_program(args.program, args.scanner, args.parser)
+    VirtualMachine.from_image(image).run()
+    return 0
+
+
+def command_bench(args) -> int:
+    image = load_program(args.program, args.scanner, args.parser)
+
+    times = []
+    instructions = 0
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for run in range(args.warmup + args.runs):
+            vm = VirtualMachine.from_image(image)
+            start = time.perf_counter()
+            instructions = vm.run()
+            elapsed = time.perf_counter() - start
+            if run >= args.warmup:
+                times.append(elapsed)
+
+    times.sort()
+    print(f"{args.program}: {args.runs} runs, {instructions} instructions per run")
+    print(f"{'':>8} {'seconds':>10} {'instr/s':>14}")
+    for percent in PERCENTILES:
+        seconds = percentile(times, percent)
+        print(f"{f'p{percent}':>8} {seconds:>10.4f} {instructions / seconds:>14,.0f}")
+    mean = statistics.fmean(times)
+    print(f"{'mean':>8} {mean:>10.4f} {instructions / mean:>14,.0f}")
+    return 0
+
+
+def command_profile(args) -> int:
+    image = load_program(args.program, args.scanner, args.parser, record_lines=True)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        profile = profile_image(image)
+    print(profile.report(args.top))
+    return 0
+
+
+# ---------------------------------------------------------------------------
+#  Entry point
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(prog=PROG, description="Baby Duck compiler and virtual machine.")
+    front_end = argparse.ArgumentParser(add_help=False)
+    front_end.add_argument("--scanner", choices=sorted(SCANNERS), default="ply")
+    front_end.add_argument("--parser", choices=sorted(PARSERS), default="ply")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser("compile", parents=[front_end], help="compile a source file to an artifact")
+    compile_parser.add_argument("source")
+    compile_parser.add_argument("-o", "--output", help=f"artifact path (default: source with {ARTIFACT_SUFFIX})")
+    compile_parser.add_argument("--metrics", metavar="JSON", help="write the compile-phase metrics to a JSON file")
+    compile_parser.add_argument("-g", "--lines", action="store_true",
+                                help="store the source line of each quadruple (shown by profile)")
+    compile_parser.add_argument("--module", action="store_true",
+                                help=f"write a module object ({MODULE_SUFFIX}) to link with others")
+    compile_parser.add_argument("--shake", action="store_true",
+                                help="drop the functions, globals and constants the program never uses")
+    compile_parser.set_defaults(handler=command_compile)
+
+    link_parser = commands.add_parser("link", help="link sources and module objects into an artifact")
+    link_parser.add_argument("inputs", nargs="+", help="sources and module objects, the program first")
+    link_parser.add_argument("-o", "--output", help=f"artifact path (default: first input with {ARTIFACT_SUFFIX})")
+    link_parser.add_argument("--entry", help="module whose main runs (default: the first one)")
+    link_parser.add_argument("--shake", action="store_true",
+                             help="drop the functions, globals and constants the program never uses")
+    link_parser.set_defaults(handler=command_link)
+
+    run_parser = commands.add_parser("run", parents=[front_end], help="run a source file or an artifact")
+    run_parser.add_argument("program")
+    run_parser.set_defaults(handler=command_run)
+
+    bench_parser = commands.add_parser("bench", parents=[front_end], help="time repeated runs of a program")
+    bench_parser.add_argument("program")
+    bench_parser.add_argument("-n", "--runs", type=int, default=20)
+    bench_parser.add_argument("--warmup", type=int, default=2)
+    bench_parser.set_defaults(handler=command_bench)
+
+    profile_parser = commands.add_parser("profile", parents=[front_end], help="count the hottest quadruples and functions")
+    profile_parser.add_argument("program")
+    profile_parser.add_argument("--top", type=int, default=10)
+    profile_parser.set_defaults(handler=command_profile)
+
+    return arg_parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    if getattr(args, "runs", 1) < 1:
+        print(f"{PROG}: error: --runs must be at least 1", file=sys.stderr)
+        return 2
+
+    try:
+        return args.handler(args)
+    except REPORTED_ERRORS as error:
+        print(f"{PROG}: error: {error}", file=sys.stderr)
+        return 1
@@ -0,0 +1,8 @@
+from .compile_cache import CODE_OPTIONS, CompileCache, cache_key, normalize_options
+
+__all__ = [
+    "CODE_OPTIONS",
+    "CompileCache",
+    "cache_key",
+    "normalize_options",
+]
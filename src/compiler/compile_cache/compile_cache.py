@@ -0,0 +1,165 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import tempfile
+from src.compiler.compiler import Compiler, COMPILER_VERSION
+from src.virtual_machine.program_image import ProgramImage
+
+ENTRY_SUFFIX = ".image"
+TEMP_PREFIX = ".tmp-"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Compiler parameters that can change the image; the others (metrics, syntax tree)
+# only change what is collected along the way
+CODE_OPTIONS = ("scanner", "parser", "segment_capacity", "record_lines")
+_COMPILER_DEFAULTS = {
+    name: parameter.default
+    for name, parameter in inspect.signature(Compiler.__init__).parameters.items()
+    if name != "self"
+}
+
+
+def normalize_options(options: dict | None) -> dict:
+    """
+    Returns the code-affecting compile options, with the defaults filled in,
+    so that equivalent option sets share a key.
+    """
+    options = options or {}
+    unknown = sorted(set(options) - set(_COMPILER_DEFAULTS))
+    if unknown:
+        raise ValueError(f"Unknown compile options {unknown}, expected some of {sorted(_COMPILER_DEFAULTS)}")
+    return {name: options.get(name, _COMPILER_DEFAULTS[name]) for name in CODE_OPTIONS}
+
+
+def cache_key(source: str, options: dict | None = None, version: str = COMPILER_VERSION) -> str:
+    """
+    Returns the content address of a compilation: a hash of the source text, the
+    compiler version and the code-affecting compile options.
+    """
+    digest = hashlib.sha256()
+    for part in (version, json.dumps(normalize_options(options), sort_keys=True), source):
+        encoded = part.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "little"))  # keep the parts unambiguous
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class CompileCache:
+    """
+    A content-addressed on-disk cache of compiled program images.
+
+    Entries are written atomically (temporary file + rename), so several processes can
+    share a directory: readers only ever see complete entries, and an entry removed by
+    another process is simply a miss. Hits refresh the entry's modification time, which
+    is used to evict the least recently used entries once the directory grows beyond
+    `max_bytes`. Entries are pickles, so the directory must only be writable by trusted users.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+
+    def get(self, key: str) -> ProgramImage | None:
+        """
+        Returns the cached image for the key, or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                image = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # unreadable entry (e.g. written by an incompatible version), drop it
+            self._remove(path)
+            return None
+
+        # mark the entry as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return image
+
+
+    def put(self, key: str, image: ProgramImage) -> None:
+        """
+        Stores an image under the key, then evicts old entries if needed.
+        """
+        fd, temp_path = tempfile.mkstemp(prefix=TEMP_PREFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(image, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            self._remove(temp_path)
+            raise
+
+        self.evict()
+
+
+    def compile(self, source: str, options: dict | None = None) -> ProgramImage:
+        """
+        Returns the image of the program, compiling it only on a cache miss.
+        """
+        key = cache_key(source, options)
+        image = self.get(key)
+        if image is None:
+            image = Compiler(**(options or {})).compile(source).to_image()
+            self.put(key, image)
+        return image
+
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache fits in `max_bytes`.
+        """
+        entries = []
+        total = 0
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # removed by another process
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        entries.sort()  # oldest first
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        for entry in self._entries():
+            self._remove(entry.path)
+
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._entries())
+
+
+    def _entries(self):
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(ENTRY_SUFFIX) and not entry.name.startswith(TEMP_PREFIX):
+                    yield entry
+
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,8 @@
+from .compile_metrics import CompileMetrics, PhaseMetrics, MeteredLexer, PHASES
+
+__all__ = [
+    "CompileMetrics",
+    "PhaseMetrics",
+    "MeteredLexer",
+    "PHASES",
+]
@@ -0,0 +1,212 @@
+import functools
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+
+# phases of a compilation, in the order they are reported
+PHASES = ("lexing", "parsing", "semantic", "codegen", "optimization")
+
+# methods that run each phase, wrapped while a compilation is measured
+SEMANTIC_METHODS = (
+    "add_function", "add_var_to_function", "get_function", "get_var", "get_var_minimal",
+    "get_var_table", "add_to_signature", "validate_signature_argument",
+    "validate_signature_length", "set_frame_resources",
+)
+CODEGEN_METHODS = (
+    "push_initial_quadruple", "mark_loop_start", "add_function_to_dir",
+    "handle_function_called_start", "handle_function_call_finished", "handle_new_param",
+    "generate_gotof_for_statement", "assign_goto_destination", "register_parameter",
+    "handle_function_end", "handle_else", "close_loop", "push_fake_bottom",
+    "create_assignment_quadruple", "create_print_quadruple", "pop_until_bottom",
+    "push_operand", "push_operator",
+)
+
+
+@dataclass
+class PhaseMetrics:
+    """
+    Resources used by one phase. Time spent in a nested phase is not counted twice.
+
+    `net_allocated_blocks` is the growth of live memory blocks, not a count of
+    allocations: a phase that allocates and frees a million objects reports about 0.
+    CPython does not expose a gross allocation counter.
+    """
+    calls: int = 0
+    wall_time: float = 0.0          # seconds
+    cpu_time: float = 0.0           # seconds of process CPU time
+    net_allocated_blocks: int = 0   # blocks allocated minus blocks freed (sys.getallocatedblocks)
+    peak_memory: int = 0            # highest traced memory in bytes, only when tracing
+
+
+class CompileMetrics:
+    """
+    Per-phase metrics of a compilation.
+
+    Phases nest: when the parser calls into code generation, which looks a variable up
+    in the function directory, the time goes to "semantic" until the lookup returns, then
+    back to "codegen", then to "parsing". Each phase is charged exclusively, so the phases
+    add up to the total. Peak memory needs `tracemalloc`, which slows the compilation down
+    a lot, so it is only measured with `trace_memory`.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.phases = {name: PhaseMetrics() for name in PHASES}
+        self.total = PhaseMetrics()
+        self._outside = PhaseMetrics()     # charged while no phase is running
+
+        self._stack: list[PhaseMetrics] = []
+        self._started_tracing = False
+        self._marks = (0.0, 0.0, 0)
+
+
+    # -----------------------------------------------------------------------
+    #  Measuring
+
+    def start(self) -> None:
+        """Starts measuring the whole compilation."""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._stack = [self._outside]
+        self._marks = self._now()
+
+
+    def stop(self) -> None:
+        """Stops measuring, the total covers everything since `start`."""
+        self._charge()
+        self._stack = []
+
+        charged = [self._outside, *self.phases.values()]
+        self.total.calls += 1
+        self.total.wall_time = sum(metrics.wall_time for metrics in charged)
+        self.total.cpu_time = sum(metrics.cpu_time for metrics in charged)
+        self.total.net_allocated_blocks = sum(metrics.net_allocated_blocks for metrics in charged)
+        self.total.peak_memory = max(metrics.peak_memory for metrics in charged)
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+    def enter(self, phase: str) -> None:
+        """Starts charging the given phase, until the matching `exit`."""
+        self._charge()
+        metrics = self.phases[phase]
+        metrics.calls += 1
+        self._stack.append(metrics)
+
+
+    def exit(self) -> None:
+        """Goes back to the phase that was running before the last `enter`."""
+        self._charge()
+        self._stack.pop()
+
+
+    def _now(self) -> tuple[float, float, int]:
+        return time.perf_counter(), time.process_time(), sys.getallocatedblocks()
+
+
+    def _charge(self) -> None:
+        """Charges the resources used since the last mark to the running phase."""
+        now = self._now()
+        running = self._stack[-1]
+        running.wall_time += now[0] - self._marks[0]
+        running.cpu_time += now[1] - self._marks[1]
+        running.net_allocated_blocks += now[2] - self._marks[2]
+
+        if self.trace_memory:
+            running.peak_memory = max(running.peak_memory, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        self._marks = now
+
+
+    # -----------------------------------------------------------------------
+    #  Instrumenting
+
+    def measured(self, phase: str, function):
+        """Returns `function` wrapped so that its calls are charged to `phase`."""
+        enter, exit = self.enter, self.exit
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            enter(phase)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                exit()
+
+        return wrapper
+
+
+    def instrument(self, obj, phase: str, method_names) -> list:
+        """
+        Wraps methods of `obj` (on the instance only) to charge them to `phase`.
+        Returns the wrapped names, to be given to `uninstrument`.
+        """
+        wrapped = []
+        for name in method_names:
+            setattr(obj, name, self.measured(phase, getattr(obj, name)))
+            wrapped.append((obj, name))
+        return wrapped
+
+
+    def instrument_session(self, function_dir, intermediate_generator) -> list:
+        """Charges the function directory to "semantic" and the generator to "codegen"."""
+        return self.instrument(function_dir, "semantic", SEMANTIC_METHODS) \
+            + self.instrument(intermediate_generator, "codegen", CODEGEN_METHODS)
+
+
+    @staticmethod
+    def uninstrument(wrapped: list) -> None:
+        """Removes the wrappers installed by `instrument`."""
+        for obj, name in wrapped:
+            delattr(obj, name)
+
+
+    # -----------------------------------------------------------------------
+    #  Reporting
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_memory": self.trace_memory,
+            "total": asdict(self.total),
+            "phases": {name: asdict(metrics) for name, metrics in self.phases.items()},
+        }
+
+
+    def write_json(self, path: str) -> None:
+        """Writes the metrics to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+    def __str__(self) -> str:
+        lines = [f"{'phase':<14}{'calls':>10}{'wall s':>10}{'cpu s':>10}{'net blocks':>12}{'peak KiB':>10}"]
+        for name, metrics in list(self.phases.items()) + [("total", self.total)]:
+            lines.append(f"{name:<14}{metrics.calls:>10}{metrics.wall_time:>10.4f}{metrics.cpu_time:>10.4f}"
+                         f"{metrics.net_allocated_blocks:>12}{metrics.peak_memory / 1024:>10.1f}")
+        return "\n".join(lines)
+
+
+class MeteredLexer:
+    """Wraps a lexer so that producing tokens is charged to the "lexing" phase."""
+
+    def __init__(self, lexer, metrics: CompileMetrics):
+        self.lexer = lexer
+        self.metrics = metrics
+
+
+    def input(self, data: str) -> None:
+        self.lexer.input(data)
+
+
+    def token(self):
+        self.metrics.enter("lexing")
+        try:
+            return self.lexer.token()
+        finally:
+            self.metrics.exit()
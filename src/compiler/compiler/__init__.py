@@ -0,0 +1,10 @@
+from .compiler import Compiler, CompiledProgram, compile_source, COMPILER_VERSION, SCANNERS, PARSERS
+
+__all__ = [
+    "Compiler",
+    "CompiledProgram",
+    "compile_source",
+    "COMPILER_VERSION",
+    "SCANNERS",
+    "PARSERS",
+]
@@ -0,0 +1,203 @@
+import copy
+import functools
+import mmap
+import os
+import tempfile
+from dataclasses import dataclass
+from src.lexer.lexer import lexer as base_lexer
+from src.lexer.scanner import Scanner
+from src.lexer.streaming_lexer import StreamingLexer, DEFAULT_CHUNK_SIZE
+from src.lexer.line_tracking_lexer import LineTrackingLexer
+from src.parser.parser import parser as base_parser
+from src.parser.descent_parser import DescentParser
+from src.syntax_tree.node import Node
+from src.intermediate_generation.memory_manager import MemoryManager, BLOCK_SIZE
+from src.intermediate_generation.intermediate_generator import IntermediateGenerator
+from src.intermediate_generation.quadruples_list import QuadruplesList
+from src.intermediate_generation.quadruple_stream import QuadrupleStream
+from src.intermediate_generation.constants_table import ConstantsTable
+from src.semantic.function_dir import FunctionDir
+from src.semantic.constants import GLOBAL_FUNC_NAME
+from src.virtual_machine.program_image import ProgramImage
+from src.virtual_machine.artifact import write_artifact
+from src.compiler.compile_metrics import CompileMetrics, MeteredLexer
+
+# bump when a change alters the generated code (invalidates compile caches)
+COMPILER_VERSION = "1.1.0"
+
+# lexers a compiler can scan with, both produce the same tokens
+SCANNERS = {
+    "ply": base_lexer.clone,
+    "fast": Scanner,
+}
+
+# parsers a compiler can use, both generate the same program
+PARSERS = {
+    "ply": lambda: copy.copy(base_parser),
+    "descent": DescentParser,
+}
+
+
+@dataclass
+class CompiledProgram:
+    """Everything produced by a single compilation."""
+    quadruples: QuadruplesList
+    constants_table: ConstantsTable
+    function_dir: FunctionDir
+    syntax_tree: Node | None    # only built on request, see Compiler
+    metrics: CompileMetrics | None = None
+
+    def to_image(self) -> ProgramImage:
+        """Returns the runtime view of the program."""
+        image = ProgramImage.from_compilation(self.quadruples, self.constants_table, self.function_dir)
+        if self.quadruples.lines:
+            image.line_table = list(self.quadruples.lines)
+        return image
+
+
+class Compiler:
+    """
+    A compilation session.
+
+    Each compiler owns its lexer clone, its parser state, and the function directory,
+    memory manager and intermediate generator used by the grammar actions. The parsing
+    tables are shared (read-only) with the module-level parser, so creating a compiler
+    is cheap and several of them can run concurrently, e.g. one per thread-pool task.
+    A single compiler must not be used from two threads at the same time.
+
+    `scanner` selects the lexer: the PLY one ("ply") or the hand-written `Scanner` ("fast").
+    `parser` selects the front end: the PLY LALR parser ("ply") or the hand-written
+    `DescentParser` ("descent"). The syntax tree is only built with `build_ast`: code is
+    generated directly by the grammar actions, so compiling does not need it.
+    With `collect_metrics` each compiled program carries its per-phase `CompileMetrics`,
+    `trace_memory` adds the peak traced memory of each phase (and implies it).
+    `segment_capacity` bounds the addresses of each segment and type (`BLOCK_SIZE` at most).
+    With `record_lines` the source line of each quadruple goes to the image's line table.
+    With `spool_window`, code generation keeps at most that many quadruples in memory and
+    writes the others to a temporary file (see `QuadrupleStream`).
+    """
+
+    def __init__(self, scanner: str = "ply", parser: str = "ply", build_ast: bool = False,
+                 collect_metrics: bool = False, trace_memory: bool = False,
+                 segment_capacity: int = BLOCK_SIZE, record_lines: bool = False,
+                 spool_window: int | None = None):
+        if scanner not in SCANNERS:
+            raise ValueError(f"Unknown scanner '{scanner}', expected one of {sorted(SCANNERS)}")
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown parser '{parser}', expected one of {sorted(PARSERS)}")
+
+        # the lexer and parser keep their position and stacks in the instance,
+        # copying them gives this session its own state over the shared tables
+        self.lexer = SCANNERS[scanner]()
+        self.parser = PARSERS[parser]()
+        self.build_ast = build_ast
+        self.collect_metrics = collect_metrics or trace_memory
+        self.trace_memory = trace_memory
+        self.segment_capacity = segment_capacity
+        self.record_lines = record_lines
+        self.spool_window = spool_window
+        self.reset()
+
+
+    def reset(self) -> None:
+        """
+        Prepares a fresh state for the next compilation.
+        """
+        self.memory_manager = MemoryManager(self.segment_capacity)
+        self.function_dir = FunctionDir(self.memory_manager)
+        line_of = (lambda: self._token_lines.previous_line) if self.record_lines else None
+        quadruples_factory = QuadruplesList
+        if self.spool_window is not None:
+            # the file is removed once the program is garbage collected
+            quadruples_factory = functools.partial(QuadrupleStream, tempfile.TemporaryFile(),
+                                                   window=self.spool_window)
+        self.intermediate_generator = IntermediateGenerator(self.function_dir, self.memory_manager,
+                                                            line_of, quadruples_factory)
+
+        self.lexer.lineno = 1
+        self.lexer.begin("INITIAL")
+
+        # attributes read by the grammar actions through p.parser
+        self.parser.memory_manager = self.memory_manager
+        self.parser.function_dir = self.function_dir
+        self.parser.intermediate_generator = self.intermediate_generator
+        self.parser.current_function = GLOBAL_FUNC_NAME
+        self.parser.current_type = None
+        self.parser.build_ast = self.build_ast
+
+
+    def compile(self, source: str) -> CompiledProgram:
+        """
+        Compiles a Baby Duck program and returns its intermediate representation.
+        """
+        self.reset()
+        return self._parse(source, self.lexer)
+
+
+    def compile_stream(self, stream, chunk_size: int = DEFAULT_CHUNK_SIZE) -> CompiledProgram:
+        """
+        Compiles a program read incrementally from a binary stream (an open file, an mmap, ...).
+        """
+        self.reset()
+        streaming_lexer = StreamingLexer(stream, self.lexer, chunk_size)
+        return self._parse(None, streaming_lexer)
+
+
+    def compile_file(self, source_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> CompiledProgram:
+        """
+        Compiles a source file, scanning it through a read-only memory map.
+        """
+        with open(source_path, "rb") as f:
+            # empty files cannot be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return self.compile_stream(f, chunk_size)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                return self.compile_stream(source, chunk_size)
+
+
+    def compile_to_file(self, source_path: str, artifact_path: str) -> CompiledProgram:
+        """
+        Compiles a source file and writes the program in the binary format.
+        """
+        program = self.compile_file(source_path)
+        write_artifact(program.to_image(), artifact_path)
+        return program
+
+
+    def _parse(self, source: str | None, lexer) -> CompiledProgram:
+        """Runs the parser (and the code generation it drives) over the lexer's tokens."""
+        if self.record_lines:
+            lexer = self._token_lines = LineTrackingLexer(lexer)
+        if not self.collect_metrics:
+            return self._compiled_program(self.parser.parse(source, lexer=lexer))
+
+        metrics = CompileMetrics(self.trace_memory)
+        wrapped = metrics.instrument_session(self.function_dir, self.intermediate_generator)
+        metrics.start()
+        try:
+            metrics.enter("parsing")
+            syntax_tree = self.parser.parse(source, lexer=MeteredLexer(lexer, metrics))
+            metrics.exit()
+        finally:
+            metrics.stop()
+            CompileMetrics.uninstrument(wrapped)
+
+        program = self._compiled_program(syntax_tree)
+        program.metrics = metrics
+        return program
+
+
+    def _compiled_program(self, syntax_tree: Node | None) -> CompiledProgram:
+        quadruples = self.intermediate_generator.get_quadruples()
+        quadruples.finish()
+        return CompiledProgram(
+            quadruples=quadruples,
+            constants_table=self.intermediate_generator.get_constants_table(),
+            function_dir=self.function_dir,
+            syntax_tree=syntax_tree,
+        )
+
+
+def compile_source(source: str) -> CompiledProgram:
+    """Compiles a program in a new session."""
+    return Compiler().compile(source)
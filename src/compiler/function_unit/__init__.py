@@ -0,0 +1,8 @@
+from .function_unit import FunctionUnit, compile_unit, compile_globals, link_units
+
+__all__ = [
+    "FunctionUnit",
+    "compile_unit",
+    "compile_globals",
+    "link_units",
+]
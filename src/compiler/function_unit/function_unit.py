@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from src.compiler.compiler import Compiler
+from src.compiler.program_layout import ProgramLayout, FunctionSegment
+from src.intermediate_generation.constants_table import ConstantsTable
+from src.intermediate_generation.memory_manager import MemoryManager
+from src.intermediate_generation.quadruple import Quadruple, FUNCTION_OPERATORS, JUMP_OPERATORS
+from src.semantic.constants import GLOBAL_FUNC_NAME
+from src.types import AddressType, ValueType, VarType
+from src.virtual_machine.frame_resources import FrameResources
+from src.virtual_machine.function_runtime_info_map import FunctionRuntimeInfo
+from src.virtual_machine.program_image import ProgramImage
+
+QuadrupleTuple = tuple  # (operator, left, right, result)
+
+
+@dataclass
+class FunctionUnit:
+    """
+    The code of one function (or of main) in position-independent form.
+
+    Jump targets are relative to the first quadruple of the unit, calls refer to
+    functions by name, and constants are unit-local addresses listed in `constants`
+    (in allocation order) so that the linker can give them their final address.
+    """
+    name: str
+    quadruples: list[QuadrupleTuple]
+    constants: list[tuple[AddressType, ValueType, VarType]]   # (unit address, value, type)
+    frame_resources: FrameResources
+    signature: list[VarType]
+
+
+def _stub(name: str, signature: list[VarType]) -> str:
+    """An empty function with the given signature."""
+    params = ", ".join(f"p{idx}: {param_type}" for idx, param_type in enumerate(signature))
+    return f"void {name}({params}) [ {{ }} ];\n"
+
+
+def _unit_source(layout: ProgramLayout, segment: FunctionSegment, declared: dict[str, list[VarType]]) -> str:
+    """
+    A program made of the global declarations, stubs for the functions called by the
+    segment (among those declared before it) and the segment itself.
+    """
+    stubs = "".join(
+        _stub(name, declared[name])
+        for name in segment.calls
+        if name in declared and name != segment.name
+    )
+    main = "" if segment is layout.main else "main { } end\n"
+    return f"program unit;\n{layout.globals_text}\n{stubs}{segment.text}\n{main}"
+
+
+def compile_globals(layout: ProgramLayout) -> list[AddressType]:
+    """Returns the addresses of the global variables."""
+    program = Compiler().compile(f"program unit;\n{layout.globals_text}\nmain {{ }} end\n")
+    return [var.address for var in program.function_dir.get_var_table(GLOBAL_FUNC_NAME).get_vars()]
+
+
+def compile_unit(layout: ProgramLayout, segment: FunctionSegment,
+                 declared: dict[str, list[VarType]]) -> FunctionUnit:
+    """
+    Compiles one segment of the layout on its own. `declared` holds the signatures of
+    the functions declared before it, the only ones the segment may call.
+    """
+    program = Compiler().compile(_unit_source(layout, segment, declared))
+    quadruples = program.quadruples
+
+    if segment is layout.main:
+        func = program.function_dir.get_function(GLOBAL_FUNC_NAME)
+        start, end_operator = quadruples[0].result, "END_PROG"
+    else:
+        func = program.function_dir.get_function(segment.name)
+        start, end_operator = func.initial_quad_index, "END_FUNC"
+
+    if func.frame_resources is None or start is None:
+        raise ValueError(f"Could not compile '{segment.name}'")
+
+    # the unit ends at the first end quadruple after its start
+    end = start
+    while quadruples[end].operator != end_operator:
+        end += 1
+
+    code = []
+    for operator, left, right, result in quadruples.quadruples[start:end + 1]:
+        if operator in JUMP_OPERATORS:
+            result -= start
+        code.append((operator, left, right, result))
+
+    constants = [
+        (addr, value, const_type)
+        for (value, const_type), addr in program.constants_table.value_addr_map.items()
+    ]
+    return FunctionUnit(segment.name, code, constants, func.frame_resources, list(func.signature))
+
+
+def link_units(functions: list[FunctionUnit], main: FunctionUnit,
+               global_addresses: list[AddressType]) -> ProgramImage:
+    """
+    Lays the units out after the initial GOTO (functions first, then main), gives the
+    constants their final addresses in order of appearance and resolves the jumps.
+    """
+    constants_table = ConstantsTable(MemoryManager())
+    quadruples = [Quadruple("GOTO", None, None, None)]
+    runtime_infos = {GLOBAL_FUNC_NAME: None}
+
+    for unit in functions + [main]:
+        start = len(quadruples)
+        relocated = {
+            addr: constants_table.get_or_add(value, const_type)
+            for addr, value, const_type in unit.constants
+        }
+
+        for operator, left, right, result in unit.quadruples:
+            left = relocated.get(left, left)
+            right = relocated.get(right, right)
+            if operator in JUMP_OPERATORS:
+                result += start
+            elif operator not in FUNCTION_OPERATORS and operator != "PARAM":
+                result = relocated.get(result, result)
+            quadruples.append(Quadruple(operator, left, right, result))
+
+        if unit is main:
+            quadruples[0].result = start
+            runtime_infos[GLOBAL_FUNC_NAME] = FunctionRuntimeInfo(unit.frame_resources, [], None)
+        else:
+            runtime_infos[unit.name] = FunctionRuntimeInfo(unit.frame_resources, unit.signature, start)
+
+    return ProgramImage(
+        quadruples=quadruples,
+        constants={addr: value for (value, _), addr in constants_table.value_addr_map.items()},
+        global_addresses=list(global_addresses),
+        functions=runtime_infos,
+    )
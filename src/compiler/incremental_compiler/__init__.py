@@ -0,0 +1,3 @@
+from .incremental_compiler import IncrementalCompiler
+
+__all__ = ["IncrementalCompiler"]
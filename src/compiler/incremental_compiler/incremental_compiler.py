@@ -0,0 +1,98 @@
+import hashlib
+from src.compiler.compiler import Compiler, COMPILER_VERSION
+from src.compiler.program_layout import ProgramLayout, FunctionSegment, ProgramLayoutError, split_program
+from src.compiler.function_unit import FunctionUnit, compile_unit, compile_globals, link_units
+from src.types import AddressType, VarType
+from src.virtual_machine.program_image import ProgramImage
+
+
+class IncrementalCompiler:
+    """
+    Rebuilds a program recompiling only the functions that changed.
+
+    Each function (and main) is compiled on its own into a position-independent
+    `FunctionUnit` and cached under a key made of everything its code depends on:
+    its own text, the global declarations and the signatures of the functions it
+    calls. A build splits the source, compiles the units whose key is new and
+    relinks all of them, which produces the same program as a full compilation.
+    """
+
+    def __init__(self):
+        self._units: dict[str, FunctionUnit] = {}            # unit key -> unit
+        self._globals: dict[str, list[AddressType]] = {}     # globals key -> addresses
+
+        # names of the units compiled / reused by the last build
+        self.recompiled: list[str] = []
+        self.reused: list[str] = []
+
+
+    @staticmethod
+    def _key(*parts: str) -> str:
+        digest = hashlib.sha256(COMPILER_VERSION.encode("utf-8"))
+        for part in parts:
+            encoded = part.encode("utf-8")
+            digest.update(len(encoded).to_bytes(8, "little"))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+
+    def _unit_key(self, layout: ProgramLayout, segment: FunctionSegment,
+                  declared: dict[str, list[VarType]]) -> str:
+        # calls to functions that are not declared before the segment are errors,
+        # so only the signatures of the declared ones are part of the key
+        callees = [
+            f"{name}({','.join(declared[name])})" if name in declared else f"{name}?"
+            for name in segment.calls
+        ]
+        return self._key(layout.globals_text, segment.text, " ".join(callees))
+
+
+    def _get_unit(self, layout: ProgramLayout, segment: FunctionSegment,
+                  declared: dict[str, list[VarType]], units: dict[str, FunctionUnit]) -> FunctionUnit:
+        key = self._unit_key(layout, segment, declared)
+        unit = self._units.get(key)
+        if unit is None:
+            unit = compile_unit(layout, segment, declared)
+            self.recompiled.append(segment.name)
+        else:
+            self.reused.append(segment.name)
+        units[key] = unit
+        return unit
+
+
+    def build(self, source: str) -> ProgramImage:
+        """
+        Compiles the program, reusing the units of the previous builds.
+        """
+        self.recompiled = []
+        self.reused = []
+
+        try:
+            layout = split_program(source)
+            names = [segment.name for segment in layout.functions]
+            if len(set(names)) != len(names):
+                raise ProgramLayoutError("duplicate function")
+        except ProgramLayoutError:
+            # not a well-formed program, let the full compiler report the errors
+            self._units.clear()
+            return Compiler().compile(source).to_image()
+
+        globals_key = self._key(layout.globals_text)
+        global_addresses = self._globals.get(globals_key)
+        if global_addresses is None:
+            global_addresses = compile_globals(layout)
+        self._globals = {globals_key: global_addresses}
+
+        units: dict[str, FunctionUnit] = {}
+        declared: dict[str, list[VarType]] = {}
+        function_units = []
+        for segment in layout.functions:
+            # a function can call itself, so it is declared while compiling its body
+            declared[segment.name] = segment.signature
+            function_units.append(self._get_unit(layout, segment, declared, units))
+        main_unit = self._get_unit(layout, layout.main, declared, units)
+
+        # keep only the units of the current program
+        self._units = units
+
+        return link_units(function_units, main_unit, global_addresses)
@@ -0,0 +1,3 @@
+from .linker import link_modules
+
+__all__ = ["link_modules"]
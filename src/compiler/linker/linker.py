@@ -0,0 +1,93 @@
+from typing import Sequence
+from src.compiler.module_object import ModuleObject
+from src.errors.link_errors import LinkError, UnresolvedSymbolError, DuplicateSymbolError
+from src.intermediate_generation.constants_table import ConstantsTable
+from src.intermediate_generation.memory_manager import MemoryManager
+from src.intermediate_generation.quadruple import Quadruple, FUNCTION_OPERATORS, JUMP_OPERATORS
+from src.semantic.constants import GLOBAL_FUNC_NAME
+from src.types import VarType
+from src.virtual_machine.function_runtime_info_map import FunctionRuntimeInfo
+from src.virtual_machine.program_image import ProgramImage
+
+
+def _signature_text(name: str, signature: list[VarType]) -> str:
+    return f"{name}({', '.join(signature)})"
+
+
+def _resolve_symbols(modules: Sequence[ModuleObject]) -> None:
+    """Checks that every import matches the signature of exactly one export."""
+    exporters: dict[str, ModuleObject] = {}
+    for module in modules:
+        for name in module.exports:
+            if name in exporters:
+                raise DuplicateSymbolError(name, exporters[name].name, module.name)
+            exporters[name] = module
+
+    for module in modules:
+        for name, signature in module.imports.items():
+            exporter = exporters.get(name)
+            if exporter is None:
+                raise UnresolvedSymbolError(name, module.name)
+            exported = exporter.exports[name].signature
+            if list(exported) != list(signature):
+                raise LinkError(f"Module '{module.name}' imports {_signature_text(name, signature)} "
+                                f"but '{exporter.name}' exports {_signature_text(name, exported)}")
+
+
+def link_modules(modules: Sequence[ModuleObject], entry: str | None = None) -> ProgramImage:
+    """
+    Lays the modules out after the initial GOTO, in order, and resolves their calls.
+
+    Only the main of the `entry` module (the first one by default) is kept. Each module
+    keeps its own globals, and constants equal across modules are stored once.
+    """
+    if not modules:
+        raise LinkError("No modules to link")
+    if entry is None:
+        entry_module = modules[0]
+    else:
+        entry_module = next((module for module in modules if module.name == entry), None)
+        if entry_module is None:
+            raise LinkError(f"No module named '{entry}'")
+    _resolve_symbols(modules)
+
+    memory_manager = MemoryManager()
+    constants_table = ConstantsTable(memory_manager)
+    quadruples = [Quadruple("GOTO", None, None, None)]
+    global_addresses = []
+    functions = {GLOBAL_FUNC_NAME: FunctionRuntimeInfo(entry_module.main_frame, [], None)}
+
+    for module in modules:
+        start = len(quadruples)
+        relocated = {
+            addr: constants_table.get_or_add(value, const_type)
+            for addr, value, const_type in module.constants
+        }
+        for addr in module.global_addresses:
+            _, var_type, _ = MemoryManager.decode_address(addr)
+            relocated[addr] = memory_manager.new_addr("global", var_type)
+            global_addresses.append(relocated[addr])
+
+        # main ends the code of a module, only the entry one runs
+        code = module.code if module is entry_module else module.code[:module.entry]
+        for operator, left, right, result in code:
+            left = relocated.get(left, left)
+            right = relocated.get(right, right)
+            if operator in JUMP_OPERATORS:
+                result += start
+            elif operator not in FUNCTION_OPERATORS and operator != "PARAM":
+                result = relocated.get(result, result)
+            quadruples.append(Quadruple(operator, left, right, result))
+
+        if module is entry_module:
+            quadruples[0].result = start + module.entry
+        for name, info in module.exports.items():
+            functions[name] = FunctionRuntimeInfo(info.frame_resources, list(info.signature),
+                                                  start + info.initial_quad_index)
+
+    return ProgramImage(
+        quadruples=quadruples,
+        constants={addr: value for (value, _), addr in constants_table.value_addr_map.items()},
+        global_addresses=global_addresses,
+        functions=functions,
+    )
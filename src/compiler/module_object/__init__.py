@@ -0,0 +1,10 @@
+from .module_object import ModuleObject, compile_module, write_module, load_module, is_module, MODULE_SUFFIX
+
+__all__ = [
+    "ModuleObject",
+    "compile_module",
+    "write_module",
+    "load_module",
+    "is_module",
+    "MODULE_SUFFIX",
+]
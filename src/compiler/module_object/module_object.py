@@ -0,0 +1,137 @@
+import pickle
+import re
+from dataclasses import dataclass
+from typing import Iterable
+from src.compiler.compiler import Compiler, COMPILER_VERSION
+from src.compiler.function_unit.function_unit import QuadrupleTuple, _stub
+from src.compiler.program_layout import ProgramLayoutError, split_program
+from src.errors.artifact_errors import InvalidArtifactError
+from src.intermediate_generation.quadruple import JUMP_OPERATORS
+from src.semantic.constants import GLOBAL_FUNC_NAME
+from src.types import AddressType, ValueType, VarType
+from src.virtual_machine.frame_resources import FrameResources
+from src.virtual_machine.function_runtime_info_map import FunctionRuntimeInfo
+
+MODULE_SUFFIX = ".bdm"
+MODULE_MAGIC = b"BDUCKMOD"
+
+_HEADER_RE = re.compile(r"\s*program\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*;")
+
+
+@dataclass
+class ModuleObject:
+    """
+    A program compiled on its own, to be linked with other modules.
+
+    `code` holds the quadruples of its functions followed by those of its main, with
+    jump targets relative to the first one. Globals and constants keep module-local
+    addresses, which the linker renumbers. Calls refer to functions by name: `exports`
+    are the functions the module defines (their initial quadruple indexes are relative
+    too) and `imports` the signatures it was compiled against for the others it calls.
+    """
+    name: str
+    code: list[QuadrupleTuple]
+    constants: list[tuple[AddressType, ValueType, VarType]]   # (module address, value, type)
+    global_addresses: list[AddressType]
+    exports: dict[str, FunctionRuntimeInfo]
+    imports: dict[str, list[VarType]]
+    entry: int                          # first quadruple of main in `code`
+    main_frame: FrameResources
+
+
+def compile_module(source: str, libraries: Iterable[ModuleObject] = ()) -> ModuleObject:
+    """
+    Compiles a program as a module. Its code can call the functions exported by
+    `libraries` as if they were declared before its own functions.
+    """
+    header = _HEADER_RE.match(source)
+    try:
+        layout = split_program(source)
+    except ProgramLayoutError:
+        header = None
+    if header is None:
+        # not a well-formed program, let the compiler report the errors
+        Compiler().compile(source)
+        raise ProgramLayoutError("unexpected program structure")
+
+    defined = [segment.name for segment in layout.functions]
+    called = {name for segment in layout.functions + [layout.main] for name in segment.calls}
+    imports: dict[str, list[VarType]] = {}
+    for library in libraries:
+        for name, info in library.exports.items():
+            if name in called and name not in defined:
+                imports.setdefault(name, list(info.signature))
+
+    # the imported functions are declared by empty stubs written on the line of the
+    # first declaration, so the line numbers of the errors do not change
+    stubs = " ".join(_stub(name, signature).rstrip("\n") for name, signature in imports.items())
+    body_start = header.end() + len(layout.globals_text)
+    program = Compiler().compile(f"{source[:body_start]}{stubs} {source[body_start:]}")
+
+    quadruples = program.quadruples
+    function_dir = program.function_dir
+    main_start = quadruples[0].result
+    # the module code starts after the initial GOTO and the code of the stubs
+    base = min([function_dir.get_function(name).initial_quad_index for name in defined] + [main_start])
+
+    code = []
+    for quadruple in quadruples[base:]:
+        operator, left, right, result = quadruple
+        if operator in JUMP_OPERATORS:
+            result -= base
+        code.append((operator, left, right, result))
+
+    exports = {}
+    for name in defined:
+        func = function_dir.get_function(name)
+        exports[name] = FunctionRuntimeInfo(func.frame_resources, list(func.signature),
+                                            func.initial_quad_index - base)
+
+    return ModuleObject(
+        name=header.group(1),
+        code=code,
+        constants=[
+            (addr, value, const_type)
+            for (value, const_type), addr in program.constants_table.value_addr_map.items()
+        ],
+        global_addresses=[var.address for var in function_dir.get_var_table(GLOBAL_FUNC_NAME).get_vars()],
+        exports=exports,
+        imports=imports,
+        entry=main_start - base,
+        main_frame=function_dir.get_function(GLOBAL_FUNC_NAME).frame_resources,
+    )
+
+
+def write_module(module: ModuleObject, path: str) -> None:
+    """Writes a module object file."""
+    with open(path, "wb") as f:
+        f.write(MODULE_MAGIC)
+        pickle.dump((COMPILER_VERSION, module), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def is_module(path: str) -> bool:
+    """Whether the file starts like a module object file."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MODULE_MAGIC)) == MODULE_MAGIC
+    except OSError:
+        return False
+
+
+def load_module(path: str) -> ModuleObject:
+    """
+    Reads a module object file. Module files are pickles, so only load trusted ones.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MODULE_MAGIC)) != MODULE_MAGIC:
+            raise InvalidArtifactError(path, "not a module object")
+        try:
+            version, module = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError, TypeError) as error:
+            raise InvalidArtifactError(path, f"corrupt module object ({error})") from error
+
+    if version != COMPILER_VERSION:
+        raise InvalidArtifactError(path, f"compiled by version {version}, expected {COMPILER_VERSION}")
+    if not isinstance(module, ModuleObject):
+        raise InvalidArtifactError(path, "not a module object")
+    return module
@@ -0,0 +1,3 @@
+from .parallel_compiler import ParallelCompiler
+
+__all__ = ["ParallelCompiler"]
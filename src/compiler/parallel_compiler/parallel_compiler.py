@@ -0,0 +1,113 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from src.compiler.compiler import Compiler
+from src.compiler.program_layout import ProgramLayout, FunctionSegment, ProgramLayoutError, split_program
+from src.compiler.function_unit import FunctionUnit, compile_unit, compile_globals, link_units
+from src.errors.error import Error
+from src.errors.internal_compiler_error import CompilerBug
+from src.errors.semantic_errors import SemanticError
+from src.types import VarType
+from src.virtual_machine.program_image import ProgramImage
+
+# what a unit that does not compile can raise (semantic errors are not `Error`s)
+COMPILE_ERRORS = (Error, SemanticError, SyntaxError, CompilerBug, ValueError)
+
+# tasks per worker: smaller tasks balance the load better but cost more round trips
+TASKS_PER_WORKER = 4
+
+
+def _compile_segment(globals_text: str, segment: FunctionSegment, is_main: bool,
+                     callees: dict[str, list[VarType]]) -> FunctionUnit | None:
+    """
+    Compiles one segment in a worker from the only things its code depends on.
+    Returns None when it does not compile, the full compilation reports the error.
+    """
+    if is_main:
+        layout = ProgramLayout(globals_text, [], segment)
+    else:
+        layout = ProgramLayout(globals_text, [segment], FunctionSegment("main", ""))
+    try:
+        return compile_unit(layout, segment, callees)
+    except COMPILE_ERRORS:
+        return None
+
+
+class ParallelCompiler:
+    """
+    Compiles the functions of a program in a process pool.
+
+    The first phase splits the program and collects the global declarations and the
+    signatures of its functions (see `split_program`). The second compiles each function
+    and main into a position-independent `FunctionUnit` on the workers, and `link_units`
+    concatenates them, relocating the jump targets, the initial quadruple indexes and the
+    constants. The image is the same as the one of a full compilation.
+
+    Programs that cannot be split, or with a unit that does not compile, are compiled in
+    full in this process, so errors are reported as usual. The pool is created on first
+    use and reused by later compilations until `close`; an `executor` passed in is left
+    open. With a single worker the units are compiled in this process.
+    """
+
+    def __init__(self, workers: int | None = None, executor: Executor | None = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = executor
+        self._owns_executor = executor is None
+
+
+    def __enter__(self) -> "ParallelCompiler":
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+    def close(self) -> None:
+        """Shuts down the pool created by this compiler."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+    def _map(self, *iterables):
+        if self._executor is None and self.workers == 1:
+            return map(_compile_segment, *iterables)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers)
+        chunksize = max(1, len(iterables[0]) // (self.workers * TASKS_PER_WORKER))
+        return self._executor.map(_compile_segment, *iterables, chunksize=chunksize)
+
+
+    def compile(self, source: str) -> ProgramImage:
+        """
+        Compiles a Baby Duck program and returns its runtime image.
+        """
+        try:
+            layout = split_program(source)
+            names = [segment.name for segment in layout.functions]
+            if len(set(names)) != len(names):
+                raise ProgramLayoutError("duplicate function")
+        except ProgramLayoutError:
+            return Compiler().compile(source).to_image()
+
+        segments = layout.functions + [layout.main]
+        callees = []
+        declared: dict[str, list[VarType]] = {}
+        for segment in segments:
+            # a function can call itself, so it is declared while compiling its body
+            if segment is not layout.main:
+                declared[segment.name] = segment.signature
+            callees.append({name: declared[name] for name in segment.calls if name in declared})
+
+        results = self._map([layout.globals_text] * len(segments), segments,
+                            [segment is layout.main for segment in segments], callees)
+        # the globals are compiled here while the workers run
+        try:
+            global_addresses = compile_globals(layout)
+        except COMPILE_ERRORS:
+            global_addresses = None
+        units = list(results)
+
+        if global_addresses is None or any(unit is None for unit in units):
+            return Compiler().compile(source).to_image()
+        return link_units(units[:-1], units[-1], global_addresses)
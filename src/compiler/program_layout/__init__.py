@@ -0,0 +1,8 @@
+from .program_layout import ProgramLayout, FunctionSegment, ProgramLayoutError, split_program
+
+__all__ = [
+    "ProgramLayout",
+    "FunctionSegment",
+    "ProgramLayoutError",
+    "split_program",
+]
@@ -0,0 +1,130 @@
+import re
+from dataclasses import dataclass, field
+from src.lexer.lexer import reserved
+from src.types import VarType
+
+# the few tokens needed to find the top-level structure of a program; string
+# literals are matched so that their content is skipped
+_TOKEN_RE = re.compile(r'"[^"\n]*"|[a-zA-Z_][a-zA-Z0-9_]*|[\[\]();:,]')
+
+
+class ProgramLayoutError(Exception):
+    """Raised when the top-level structure of a program cannot be recognized."""
+
+
+@dataclass
+class FunctionSegment:
+    """The source text of a function (or of main) and what it needs from the rest of the program."""
+    name: str
+    text: str
+    signature: list[VarType] = field(default_factory=list)
+    calls: list[str] = field(default_factory=list)     # called functions, in order of first call
+
+
+@dataclass
+class ProgramLayout:
+    """A program cut into its global declarations, its functions and main."""
+    globals_text: str
+    functions: list[FunctionSegment]
+    main: FunctionSegment
+
+    def signatures(self) -> dict[str, list[VarType]]:
+        return {segment.name: segment.signature for segment in self.functions}
+
+
+class _Tokens:
+    def __init__(self, source: str):
+        self.matches = list(_TOKEN_RE.finditer(source))
+        self.pos = 0
+
+    def peek(self) -> str | None:
+        return self.matches[self.pos].group() if self.pos < len(self.matches) else None
+
+    def next(self) -> re.Match:
+        if self.pos >= len(self.matches):
+            raise ProgramLayoutError("unexpected end of program")
+        match = self.matches[self.pos]
+        self.pos += 1
+        return match
+
+    def expect(self, text: str) -> re.Match:
+        match = self.next()
+        if match.group() != text:
+            raise ProgramLayoutError(f"expected '{text}' but found '{match.group()}'")
+        return match
+
+    def identifier(self) -> str:
+        text = self.next().group()
+        if text in reserved or not (text[0].isalpha() or text[0] == "_"):
+            raise ProgramLayoutError(f"expected an identifier but found '{text}'")
+        return text
+
+
+def _collect_calls(tokens: _Tokens, stop: str) -> list[str]:
+    """Returns the functions called before the `stop` token (which is consumed)."""
+    calls = []
+    previous = None
+    while True:
+        text = tokens.next().group()
+        if text == stop:
+            return calls
+        if text == "(" and previous is not None and previous not in reserved \
+                and (previous[0].isalpha() or previous[0] == "_") and previous not in calls:
+            calls.append(previous)
+        previous = text
+
+
+def split_program(source: str) -> ProgramLayout:
+    """
+    Cuts a program into segments without parsing it.
+
+    Brackets only delimit function bodies and strings cannot span lines, so a scan
+    over a handful of tokens is enough. Raises ProgramLayoutError when the program
+    does not have the expected shape (the parser will report the actual error).
+    """
+    tokens = _Tokens(source)
+    tokens.expect("program")
+    tokens.identifier()
+    globals_start = tokens.expect(";").end()
+
+    # global declarations, up to the first function or main
+    while tokens.peek() not in ("void", "main", None):
+        tokens.next()
+    if tokens.peek() is None:
+        raise ProgramLayoutError("missing main")
+    globals_end = tokens.matches[tokens.pos].start()
+
+    functions = []
+    while tokens.peek() == "void":
+        start = tokens.next().start()
+        name = tokens.identifier()
+
+        # parameters: ID : type [, ID : type]*
+        signature = []
+        tokens.expect("(")
+        while tokens.peek() != ")":
+            if signature:
+                tokens.expect(",")
+            tokens.identifier()
+            tokens.expect(":")
+            param_type = tokens.next().group()
+            if param_type not in ("int", "float"):
+                raise ProgramLayoutError(f"invalid parameter type '{param_type}'")
+            signature.append(param_type)
+        tokens.expect(")")
+
+        tokens.expect("[")
+        calls = _collect_calls(tokens, "]")
+        end = tokens.expect(";").end()
+        functions.append(FunctionSegment(name, source[start:end], signature, calls))
+
+    main_start = tokens.expect("main").start()
+    calls = _collect_calls(tokens, "end")
+    if tokens.peek() is not None:
+        raise ProgramLayoutError("unexpected text after end")
+
+    return ProgramLayout(
+        globals_text=source[globals_start:globals_end],
+        functions=functions,
+        main=FunctionSegment("main", source[main_start:], [], calls),
+    )
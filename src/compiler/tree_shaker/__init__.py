@@ -0,0 +1,3 @@
+from .tree_shaker import shake_image
+
+__all__ = ["shake_image"]
@@ -0,0 +1,139 @@
+from src.intermediate_generation.memory_manager import MemoryManager
+from src.intermediate_generation.quadruple import Quadruple, FUNCTION_OPERATORS, JUMP_OPERATORS
+from src.semantic.constants import GLOBAL_FUNC_NAME
+from src.types import AddressType
+from src.virtual_machine.function_runtime_info_map import FunctionRuntimeInfo
+from src.virtual_machine.program_image import ProgramImage
+
+
+def _has_address_result(operator: str) -> bool:
+    """Whether the result of the operator is an address (not a target, a name or a parameter index)."""
+    return operator not in JUMP_OPERATORS and operator not in FUNCTION_OPERATORS and operator != "PARAM"
+
+
+def _region(quadruples: list[Quadruple], start: int, end_operator: str) -> range:
+    """The quadruples from `start` to the first `end_operator` after it."""
+    end = start
+    while quadruples[end].operator != end_operator:
+        end += 1
+    return range(start, end + 1)
+
+
+def _reachable_code(image: ProgramImage) -> list[int]:
+    """
+    Indexes of the initial GOTO, of main and of the functions called from main
+    (directly or through other reachable functions), in program order.
+    """
+    quadruples = image.quadruples
+    kept = set(_region(quadruples, quadruples[0].result, "END_PROG"))
+    pending = list(kept)
+    called = set()
+    while pending:
+        quadruple = quadruples[pending.pop()]
+        if quadruple.operator == "GOSUB" and quadruple.result not in called:
+            called.add(quadruple.result)
+            body = _region(quadruples, image.functions[quadruple.result].initial_quad_index, "END_FUNC")
+            kept.update(body)
+            pending.extend(body)
+    return [0] + sorted(kept)
+
+
+def _dead_globals(image: ProgramImage, code: list[int]) -> set[AddressType]:
+    """
+    Globals that are never read by the code. Assignments to them are dropped, which may
+    leave other globals unread, so this runs until nothing changes. Globals written by
+    other operators are kept, so no computation (or error) is removed.
+    """
+    quadruples = image.quadruples
+    candidates = set(image.global_addresses)
+    for idx in code:
+        quadruple = quadruples[idx]
+        if quadruple.operator != "=" and _has_address_result(quadruple.operator):
+            candidates.discard(quadruple.result)
+
+    dead: set[AddressType] = set()
+    while True:
+        read = set()
+        for idx in code:
+            operator, left, right, result = quadruples[idx]
+            if operator == "=" and result in dead:
+                continue
+            read.add(left)
+            read.add(right)
+            if operator == "PRINT":
+                read.add(result)
+        newly_dead = candidates - read - dead
+        if not newly_dead:
+            return dead
+        dead |= newly_dead
+
+
+def _compact(addresses: list[AddressType]) -> dict[AddressType, AddressType]:
+    """Gives the addresses of each segment and type consecutive indexes, in address order."""
+    counters: dict[int, int] = {}
+    compacted = {}
+    for address in sorted(addresses):
+        segment, var_type, _ = MemoryManager.decode_address(address)
+        base = MemoryManager.get_base_addr(segment, var_type)
+        compacted[address] = base + counters.get(base, 0)
+        counters[base] = counters.get(base, 0) + 1
+    return compacted
+
+
+def shake_image(image: ProgramImage) -> ProgramImage:
+    """
+    Returns the image without the functions main never calls, the globals it never
+    reads and the constants it no longer uses.
+
+    The remaining quadruples are renumbered, and so are the jump targets, the initial
+    quadruple indexes and the line table. Globals and constants get consecutive
+    addresses. The program prints the same values as the original one.
+    """
+    quadruples = image.quadruples
+    code = _reachable_code(image)
+    dead = _dead_globals(image, code)
+    code = [idx for idx in code if not (quadruples[idx].operator == "=" and quadruples[idx].result in dead)]
+
+    # a jump to a dropped quadruple goes to the next kept one
+    new_index = {}
+    count = 0
+    for idx in range(len(quadruples) + 1):
+        new_index[idx] = count
+        if count < len(code) and code[count] == idx:
+            count += 1
+
+    used = set()
+    for idx in code:
+        operator, left, right, result = quadruples[idx]
+        used.update((left, right))
+        if _has_address_result(operator):
+            used.add(result)
+    global_addresses = [addr for addr in image.global_addresses if addr not in dead]
+    constants = [addr for addr in image.constants if addr in used]
+    relocated = _compact(global_addresses) | _compact(constants)
+
+    shaken = []
+    for idx in code:
+        operator, left, right, result = quadruples[idx]
+        left = relocated.get(left, left)
+        right = relocated.get(right, right)
+        if operator in JUMP_OPERATORS:
+            result = new_index[result]
+        elif _has_address_result(operator):
+            result = relocated.get(result, result)
+        shaken.append(Quadruple(operator, left, right, result))
+
+    called = {quadruples[idx].result for idx in code if quadruples[idx].operator == "GOSUB"}
+    functions = {}
+    for name, info in image.functions.items():
+        if name == GLOBAL_FUNC_NAME or name in called:
+            start = None if info.initial_quad_index is None else new_index[info.initial_quad_index]
+            functions[name] = FunctionRuntimeInfo(info.frame_resources, info.signature, start)
+
+    return ProgramImage(
+        quadruples=shaken,
+        constants={relocated[addr]: image.constants[addr] for addr in constants},
+        global_addresses=[relocated[addr] for addr in global_addresses],
+        functions=functions,
+        line_table=None if image.line_table is None else [image.line_table[idx] for idx in code],
+    )
@@ -0,0 +1,5 @@
+from .invalid_artifact_error import InvalidArtifactError
+
+__all__ = [
+    "InvalidArtifactError",
+]
@@ -0,0 +1,10 @@
+from src.errors.error import Error
+
+
+class InvalidArtifactError(Error):
+  """
+  Exception raised when a compiled program file cannot be loaded.
+  """
+  def __init__(self, path: str, reason: str):
+    message = f"Invalid program file '{path}': {reason}"
+    super().__init__(message)
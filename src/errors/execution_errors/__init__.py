@@ -0,0 +1,5 @@
+from .budget_exceeded_error import BudgetExceededError
+
+__all__ = [
+    "BudgetExceededError",
+]
@@ -0,0 +1,10 @@
+from src.errors.error import Error
+
+
+class BudgetExceededError(Error):
+    """
+    Exception raised when a program runs more instructions than it was allowed.
+    """
+    def __init__(self, budget: int):
+        super().__init__(f"Instruction budget of {budget} exhausted before END_PROG")
+        self.budget = budget
@@ -0,0 +1,9 @@
+from .link_error import LinkError
+from .unresolved_symbol_error import UnresolvedSymbolError
+from .duplicate_symbol_error import DuplicateSymbolError
+
+__all__ = [
+    "LinkError",
+    "UnresolvedSymbolError",
+    "DuplicateSymbolError",
+]
@@ -0,0 +1,9 @@
+from src.errors.link_errors.link_error import LinkError
+
+
+class DuplicateSymbolError(LinkError):
+    """
+    Exception raised when two linked modules export the same function.
+    """
+    def __init__(self, name: str, first: str, second: str):
+        super().__init__(f"Function '{name}' is exported by both '{first}' and '{second}'")
@@ -0,0 +1,7 @@
+from src.errors.error import Error
+
+
+class LinkError(Error):
+    """
+    Base class for the errors found while linking modules.
+    """
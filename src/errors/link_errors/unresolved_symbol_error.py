@@ -0,0 +1,9 @@
+from src.errors.link_errors.link_error import LinkError
+
+
+class UnresolvedSymbolError(LinkError):
+    """
+    Exception raised when a module imports a function that no linked module exports.
+    """
+    def __init__(self, name: str, module: str):
+        super().__init__(f"Module '{module}' imports '{name}', which no module exports")
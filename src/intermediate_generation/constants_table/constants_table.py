@@ -3,7 +3,7 @@ from src.types import VarType, AddressType, ValueType
 from src.intermediate_generation.memory_manager import MemoryManager
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantEntry:
     value: ValueType
     const_type: VarType
@@ -41,8 +41,8 @@ class ConstantsTable:
             return "<empty>"
 
         header = [
-            "addr │ type   │ value",
-            "─────┼────────┼────────────────────",
+            "      addr │ type   │ value",
+            "───────────┼────────┼────────────────────",
         ]
 
         rows = sorted(
@@ -54,7 +54,7 @@ class ConstantsTable:
         )
 
         lines = [
-            f"{addr:>5} │ {const_type:<6} │ {value!r}"
+            f"{addr:>10} │ {const_type:<6} │ {value!r}"
             for addr, const_type, value in rows
         ]
 
@@ -7,24 +7,27 @@ from src.intermediate_generation.memory_manager import MemoryManager
 from src.intermediate_generation.jump_stack import JumpStack
 from src.semantic.semantic_cube import get_resulting_type
 from src.types import ValueType, FunctionTypeEnum, EndType
-from typing import Literal
+from typing import Callable, Literal
 from src.semantic.constants import FAKE_BOTTOM
 from src.errors.internal_compiler_error import CompilerBug
 from src.semantic.function_dir import FunctionDir
 from src.virtual_machine.frame_resources import FrameResources
-from src.intermediate_generation.quadruple import Quadruple
 
 TokenType = Literal["CTE_STRING", "CTE_INT", "ID"]
 
 
 class IntermediateGenerator:
-    def __init__(self, function_dir: FunctionDir, memory_manager: MemoryManager):
+    def __init__(self, function_dir: FunctionDir, memory_manager: MemoryManager,
+                 line_of: Callable[[], int] | None = None,
+                 quadruples_factory: Callable[..., QuadruplesList] = QuadruplesList):
         self.function_dir = function_dir
         self.memory_manager = memory_manager
+        self.line_of = line_of  # current source line, recorded for each quadruple when given
+        self.quadruples_factory = quadruples_factory  # e.g. a QuadrupleStream over a file
         
         self.operands_stack = OperandsStack()
         self.operators_stack = OperatorsStack()
-        self.quadruples = QuadruplesList()
+        self.quadruples = quadruples_factory(line_of)
         self.constants_table = ConstantsTable(memory_manager)
         self.jump_stack = JumpStack()
 
@@ -40,15 +43,13 @@ class IntermediateGenerator:
         temp_addr = self.memory_manager.new_addr("temp", result_type)
         
         # add the cuadruple to the list and the result to the operands stack
-        quadruple = Quadruple(operator, left.addr, right.addr, temp_addr)
-        self.quadruples.append(quadruple)
+        self.quadruples.emit(operator, left.addr, right.addr, temp_addr)
         self.operands_stack.push(temp_addr, result_type)
 
     def push_initial_quadruple(self): 
         """Add the first quadruple (GOTO) at the beginning of the list."""
         
-        quadruple = Quadruple("GOTO", None, None, None)
-        self.quadruples.append(quadruple)
+        self.quadruples.emit("GOTO", None, None, None)
         self.jump_stack.push(self.quadruples.get_actual_index()) # push the index to the stack
 
     def mark_loop_start(self) -> None:
@@ -72,8 +73,7 @@ class IntermediateGenerator:
         self.current_param_index = 0
         
         # add an era quadruple to the list
-        quadruple = Quadruple("ERA", None, None, func_name)
-        self.quadruples.append(quadruple)
+        self.quadruples.emit("ERA", None, None, func_name)
     
     def handle_function_call_finished(self) -> None:
         """
@@ -86,8 +86,7 @@ class IntermediateGenerator:
                                                     self.current_param_index)
 
         # add the GOSUB quadruple
-        quadruple = Quadruple("GOSUB", None, None, self.current_function_called)        
-        self.quadruples.append(quadruple)
+        self.quadruples.emit("GOSUB", None, None, self.current_function_called)
         
         
 
@@ -100,8 +99,7 @@ class IntermediateGenerator:
         param_addr = self.operands_stack.pop()
         
         # add the quadruple for the parameter
-        quadruple = Quadruple("PARAM", param_addr.addr, None, self.current_param_index)
-        self.quadruples.append(quadruple)
+        self.quadruples.emit("PARAM", param_addr.addr, None, self.current_param_index)
         
         # validate the signature of the function
         self.function_dir.validate_signature_argument(self.current_function_called,
@@ -120,8 +118,7 @@ class IntermediateGenerator:
         last_quad = self.quadruples.get_last_quadruple()
         
         # add the GOTOF quadruple, let the destination empty for now
-        quadruple = Quadruple("GOTOF", last_quad.result, None, None)
-        self.quadruples.append(quadruple)
+        self.quadruples.emit("GOTOF", last_quad.result, None, None)
         self.jump_stack.push(self.quadruples.get_actual_index())
 
     def assign_goto_destination(self) -> None:
@@ -130,7 +127,7 @@ class IntermediateGenerator:
         goto_quad_idx = self.jump_stack.pop()
         
         # patch the GOTO to jump here (exit point of the statement)
-        self.quadruples[goto_quad_idx].result = self.quadruples.next_quad
+        self.quadruples.set_result(goto_quad_idx, self.quadruples.next_quad)
 
     def register_parameter(self, func_name: str, param_name: str, param_type: ValueType) -> None:
         """
@@ -160,8 +157,7 @@ class IntermediateGenerator:
         self.memory_manager.reset_segment("temp")
         
         # add quadruple for function end
-        quadruple = Quadruple(end_type, None, None, None)
-        self.quadruples.append(quadruple)
+        self.quadruples.emit(end_type, None, None, None)
 
     def handle_else(self) -> None:
         """Handle the else statement."""
@@ -170,12 +166,11 @@ class IntermediateGenerator:
         gotof_quad_idx = self.jump_stack.pop()
         
         # add a GOTO to skip the else block (to be patched later)
-        quadruple = Quadruple("GOTO", None, None, None)
-        self.quadruples.append(quadruple)
+        self.quadruples.emit("GOTO", None, None, None)
         self.jump_stack.push(self.quadruples.get_actual_index())
         
         # patch the GOTOF to jump here (exit point of the statement)
-        self.quadruples[gotof_quad_idx].result = self.quadruples.next_quad
+        self.quadruples.set_result(gotof_quad_idx, self.quadruples.next_quad)
         
         
     def close_loop(self) -> None:
@@ -187,11 +182,10 @@ class IntermediateGenerator:
         loop_start_idx = self.jump_stack.pop()
         
         # append an unconditional GOTO to re-evaluate the loop condition
-        quadruple = Quadruple("GOTO", None, None, loop_start_idx)
-        self.quadruples.append(quadruple)
+        self.quadruples.emit("GOTO", None, None, loop_start_idx)
 
         # patch the GOTOF to jump here (exit point of the loop)
-        self.quadruples[gotof_quad_idx].result = self.quadruples.next_quad
+        self.quadruples.set_result(gotof_quad_idx, self.quadruples.next_quad)
 
     def push_fake_bottom(self): 
         """Push a fake bottom to the stack."""
@@ -204,16 +198,14 @@ class IntermediateGenerator:
         value_to_assign = self.operands_stack.pop()
         var_to_record = self.function_dir.get_var(current_scope, var_name)
 
-        quadruple = Quadruple(operator, value_to_assign.addr, None, var_to_record.address)
-        self.quadruples.append(quadruple)
+        self.quadruples.emit(operator, value_to_assign.addr, None, var_to_record.address)
 
     def create_print_quadruple(self):
         """Create a print quadruple."""
         operator = "PRINT"
         value_to_print = self.operands_stack.pop()
 
-        quadruple = Quadruple(operator, None, None, value_to_print.addr)
-        self.quadruples.append(quadruple)
+        self.quadruples.emit(operator, None, None, value_to_print.addr)
 
 
     def pop_until_bottom(self):
@@ -284,7 +276,7 @@ class IntermediateGenerator:
         """Reset the generator state."""
         self.operands_stack = OperandsStack()
         self.operators_stack = OperatorsStack()
-        self.quadruples = QuadruplesList()
+        self.quadruples = self.quadruples_factory(self.line_of)
         self.constants_table = ConstantsTable(self.memory_manager)
         self.jump_stack = JumpStack()
         self.current_function_called = None
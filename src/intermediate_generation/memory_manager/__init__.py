@@ -1,8 +1,17 @@
-from .memory_manager import MemoryManager, SegmentType, BLOCK_SIZE, LocalOrTempType
+from .memory_manager import (
+  MemoryManager, SegmentType, LocalOrTempType,
+  BLOCK_SIZE, INDEX_BITS, SEGMENT_SHIFT, INDEX_MASK, TYPE_MASK, SEGMENT_CODE, TYPE_CODE,
+)
 
 __all__ = [
   "MemoryManager",
   "SegmentType",
   "BLOCK_SIZE",
-  "LocalOrTempType"
-  ]
\ No newline at end of file
+  "LocalOrTempType",
+  "INDEX_BITS",
+  "SEGMENT_SHIFT",
+  "INDEX_MASK",
+  "TYPE_MASK",
+  "SEGMENT_CODE",
+  "TYPE_CODE",
+  ]
@@ -5,83 +5,78 @@ LocalOrTempType = Literal["local", "temp"]
 SegmentType = Literal["global", LocalOrTempType, "const"]
 CountersType = dict[SegmentType, dict[VarType, int]] # segment -> var_type -> count
 
-SEGMENT_BASE: dict[SegmentType, int] = {
-    "global": 10000,
-    "local":  20000,
-    "temp":   30000,
-    "const":  40000,
+# an address packs the segment, the type and the index in fixed bit fields:
+#     segment code << SEGMENT_SHIFT | type code << INDEX_BITS | index
+# segment codes start at 1, so every address is a positive int32
+INDEX_BITS = 24
+TYPE_BITS = 2
+SEGMENT_SHIFT = INDEX_BITS + TYPE_BITS
+INDEX_MASK = (1 << INDEX_BITS) - 1
+TYPE_MASK = (1 << TYPE_BITS) - 1
+
+SEGMENT_CODE: dict[SegmentType, int] = {
+    "global": 1,
+    "local":  2,
+    "temp":   3,
+    "const":  4,
 }
 
-TYPE_OFFSET = {
+TYPE_CODE: dict[VarType, int] = {
     "int":    0,
-    "float":  2000,
-    "string": 4000,
+    "float":  1,
+    "string": 2,
 }
 
-BLOCK_SIZE = 2000       
+# code -> name, None for the unused codes
+SEGMENT_OF_CODE = (None, "global", "local", "temp", "const")
+TYPE_OF_CODE = ("int", "float", "string", None)
+
+# default and largest number of addresses per segment and type
+BLOCK_SIZE = 1 << INDEX_BITS
 
 class MemoryManager:
-    def __init__(self):
-        
+    def __init__(self, capacity: int = BLOCK_SIZE):
+        if not 0 < capacity <= BLOCK_SIZE:
+            raise ValueError(f"Segment capacity must be between 1 and {BLOCK_SIZE}")
+        self.capacity = capacity
+
         self._counters: CountersType = {
-            seg: {t: 0 for t in TYPE_OFFSET}
-            for seg in SEGMENT_BASE
+            seg: {t: 0 for t in TYPE_CODE}
+            for seg in SEGMENT_CODE
         }
     
     @staticmethod
     def decode_address(address: int) -> tuple[SegmentType, VarType, int]:
         """
         Decodes an address into its segment, variable type, and index.
-        E.g.: 10005 -> ("global", "int", 5)
+        E.g.: MemoryManager.get_base_addr("global", "int") + 5 -> ("global", "int", 5)
         """
-
-        # determine the segment
-        segment = None
-        for seg, base in SEGMENT_BASE.items():
-            max_offset = max(TYPE_OFFSET.values()) + BLOCK_SIZE
-            if base <= address < base + max_offset:
-                segment = seg
-                break
-        if not segment:
+        segment_code = address >> SEGMENT_SHIFT
+        if not 0 < segment_code < len(SEGMENT_OF_CODE):
             raise ValueError(f"Invalid address: {address}")
 
-        # calculate offset within the segment
-        segment_offset = address - SEGMENT_BASE[segment]
-
-        # determine the variable type and index
-        var_type = None
-        for vt, vt_offset in sorted(TYPE_OFFSET.items(), key=lambda x: -x[1]):
-            if segment_offset >= vt_offset:
-                var_type = vt
-                idx = segment_offset - vt_offset 
-                if idx >= BLOCK_SIZE:
-                    raise ValueError(f"Invalid address: {address}")
-                break
-
-        if not var_type or idx >= BLOCK_SIZE:
+        var_type = TYPE_OF_CODE[address >> INDEX_BITS & TYPE_MASK]
+        if var_type is None:
             raise ValueError(f"Invalid address: {address}")
 
-        return segment, var_type, idx
+        return SEGMENT_OF_CODE[segment_code], var_type, address & INDEX_MASK
     
     
     @staticmethod
     def get_base_addr(segment: SegmentType, var_type: VarType) -> int:
         """Returns the base address for the given segment and variable type."""
         
-        base   = SEGMENT_BASE[segment]
-        offset = TYPE_OFFSET[var_type]
-        return base + offset
+        return SEGMENT_CODE[segment] << SEGMENT_SHIFT | TYPE_CODE[var_type] << INDEX_BITS
 
     def new_addr(self, segment: SegmentType, var_type: VarType) -> int:
         """Returns a new address for the given segment and variable type."""
         idx = self._counters[segment][var_type]
         self._counters[segment][var_type] += 1
 
-        if idx >= BLOCK_SIZE:
+        if idx >= self.capacity:
             raise RuntimeError(f"Out of memory for {var_type} in segment {segment}")
 
-        base_addr = self.get_base_addr(segment, var_type)
-        return base_addr + idx
+        return self.get_base_addr(segment, var_type) + idx
 
 
     def snapshot_segment(self, segment: SegmentType) -> dict[VarType, int]:
@@ -94,5 +89,5 @@ class MemoryManager:
 
     def reset_segment(self, segment: SegmentType) -> None:
         """Resets the given segment to its initial state."""
-        for var_type in TYPE_OFFSET:
+        for var_type in TYPE_CODE:
             self._counters[segment][var_type] = 0
@@ -3,7 +3,7 @@ from src.types import VarType, AddressType
 from src.errors.syntax_errors import MissingOperandError
 
 
-@dataclass
+@dataclass(slots=True)
 class Operand:
     addr: AddressType
     type: VarType
@@ -1,5 +1,10 @@
 from .quadruple import Quadruple
+from .opcodes import OPCODES, OPCODE_OF, FUNCTION_OPERATORS, JUMP_OPERATORS
 
 __all__ = [
     "Quadruple",
-]
\ No newline at end of file
+    "OPCODES",
+    "OPCODE_OF",
+    "FUNCTION_OPERATORS",
+    "JUMP_OPERATORS",
+]
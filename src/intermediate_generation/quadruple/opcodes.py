@@ -0,0 +1,20 @@
+from src.types import OperatorType
+
+# numeric code of every operator, used by the binary representations of the quadruples
+# (append new operators at the end to keep the existing codes stable)
+OPCODES: tuple[OperatorType, ...] = (
+    "+", "-", "*", "/",
+    "<", ">", "!=",
+    "=", "PRINT",
+    "GOTO", "GOTOF",
+    "ERA", "PARAM", "GOSUB",
+    "END_FUNC", "END_PROG",
+)
+
+OPCODE_OF: dict[OperatorType, int] = {operator: code for code, operator in enumerate(OPCODES)}
+
+# operators whose result field holds a function name instead of a number
+FUNCTION_OPERATORS = ("ERA", "GOSUB")
+
+# operators whose result field holds a quadruple index
+JUMP_OPERATORS = ("GOTO", "GOTOF")
@@ -4,10 +4,7 @@ from src.types import OperatorType
 
 class Quadruple:
     """A single quadruple representing an operation."""
-    operator: OperatorType
-    left: Optional[str]
-    right: Optional[str]
-    result: Optional[str]
+    __slots__ = ("operator", "left", "right", "result")
     
     
     def __init__(self, operator: OperatorType, left: Optional[str], right: Optional[str], result: Optional[str]):
@@ -32,6 +29,14 @@ class Quadruple:
         res = self.result if self.result is not None else "-"
         return f"{self.operator:<6} {l:<6} {r:<6} {res}"
 
+    def __eq__(self, other: object) -> bool:
+        """Two quadruples are equal when all their fields are equal."""
+        if not isinstance(other, Quadruple):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    __hash__ = None  # quadruples are patched in place
+
     def __iter__(self):
         """Yield operator, left, right, result in order."""
         yield self.operator
@@ -0,0 +1,6 @@
+from .quadruple_stream import QuadrupleStream, DEFAULT_WINDOW
+
+__all__ = [
+    "QuadrupleStream",
+    "DEFAULT_WINDOW",
+]
@@ -0,0 +1,139 @@
+import os
+from typing import BinaryIO, Callable, Iterator
+from src.errors.internal_compiler_error import CompilerBug
+from src.intermediate_generation.quadruple import Quadruple, OPCODES, FUNCTION_OPERATORS
+from src.intermediate_generation.quadruples_list import QuadruplesList
+from src.intermediate_generation.quadruples_list.quadruples_list import NONE
+from src.virtual_machine.artifact.artifact import QUAD_RECORD, INT32
+
+DEFAULT_WINDOW = 4096
+READ_BATCH = 4096           # records read at once when iterating
+RESULT_OFFSET = 3 * INT32.size
+
+
+class QuadrupleStream(QuadruplesList):
+    """
+    A QuadruplesList that writes its quadruples to a file while they are generated.
+
+    Only the last `window` quadruples stay in memory. Older ones are written to the
+    file as fixed-width records, laid out like the QUADS section of the binary format
+    (the result of ERA/GOSUB is an index in `symbols`). Backpatching a quadruple that
+    was already written adds it to `patches`. `finish` writes the rest and applies the
+    patches with positioned writes, so the file must be seekable (not a pipe).
+    Quadruples read from the stream are standalone copies: patch through `set_result`.
+    """
+
+    def __init__(self, file: BinaryIO, line_of: Callable[[], int] | None = None,
+                 window: int = DEFAULT_WINDOW):
+        if window < 1:
+            raise ValueError("the window must hold at least one quadruple")
+        super().__init__(line_of)
+        self.file = file
+        self.window = window
+        self.start = file.tell()        # file offset of the first record
+        self.written = 0                # quadruples before this index are in the file
+        self.patches: dict[int, int] = {}   # written quadruple index -> new result
+        self.finished = False
+
+    def emit(self, operator, left, right, result) -> None:
+        """Append a new quadruple given by its fields."""
+        if self.finished:
+            raise CompilerBug("Cannot emit quadruples after the stream is finished.")
+        super().emit(operator, left, right, result)
+        if self.next_quad - self.written > self.window:
+            # keep the last quadruple: the generator reads it back for GOTOF
+            self._write(self.next_quad - self.written - 1)
+
+    def _write(self, count: int) -> None:
+        """Writes the `count` oldest quadruples held in memory."""
+        columns = (self.opcodes, self.lefts, self.rights, self.results)
+        self.file.write(b"".join(
+            QUAD_RECORD.pack(*record) for record in zip(*(column[:count] for column in columns))
+        ))
+        for column in columns:
+            del column[:count]
+        self.written += count
+
+    def _row(self, index: int) -> int:
+        """Position in the in-memory columns of a quadruple that was not written yet."""
+        if not 0 <= index < self.next_quad:
+            raise IndexError("quadruple index out of range")
+        return index - self.written
+
+    def _record(self, index: int) -> tuple[int, int, int, int]:
+        if index >= self.written:
+            row = index - self.written
+            return self.opcodes[row], self.lefts[row], self.rights[row], self.results[row]
+        self.file.flush()
+        data = os.pread(self.file.fileno(), QUAD_RECORD.size, self.start + index * QUAD_RECORD.size)
+        opcode, left, right, result = QUAD_RECORD.unpack(data)
+        return opcode, left, right, self.patches.get(index, result)
+
+    def _decode(self, record: tuple[int, int, int, int]) -> Quadruple:
+        opcode, left, right, result = record
+        operator = OPCODES[opcode]
+        if result == NONE:
+            result = None
+        elif operator in FUNCTION_OPERATORS:
+            result = self.symbols[result]
+        return Quadruple(operator,
+                         None if left == NONE else left,
+                         None if right == NONE else right,
+                         result)
+
+    def get_result(self, index: int) -> int | str | None:
+        """Get the result field of the quadruple at the index."""
+        return self[index].result
+
+    def set_result(self, index: int, result: int | str | None) -> None:
+        """Set the result field of the quadruple at the index (backpatching)."""
+        row = self._row(index)
+        encoded = self._encode_result(OPCODES[self._record(index)[0]], result)
+        if row >= 0:
+            self.results[row] = encoded
+        else:
+            self.patches[index] = encoded
+
+    def get_last_quadruple(self) -> Quadruple:
+        """Get a copy of the last quadruple."""
+        if not self.next_quad:
+            raise CompilerBug("No quadruples available.")
+        return self[self.next_quad - 1]
+
+    def finish(self) -> None:
+        """Writes the quadruples still in memory and applies the pending patches."""
+        if self.finished:
+            return
+        self._write(self.next_quad - self.written)
+        self.file.flush()
+        fd = self.file.fileno()
+        for index, result in sorted(self.patches.items()):
+            os.pwrite(fd, INT32.pack(result), self.start + index * QUAD_RECORD.size + RESULT_OFFSET)
+        self.patches.clear()
+        self.finished = True
+
+    def __iter__(self) -> Iterator[Quadruple]:
+        """Iterate over the quadruples, reading them back from the file."""
+        self.file.flush()
+        fd = self.file.fileno()
+        for first in range(0, self.written, READ_BATCH):
+            count = min(READ_BATCH, self.written - first)
+            data = os.pread(fd, count * QUAD_RECORD.size, self.start + first * QUAD_RECORD.size)
+            for offset, record in enumerate(QUAD_RECORD.iter_unpack(data), first):
+                if offset in self.patches:
+                    record = record[:3] + (self.patches[offset],)
+                yield self._decode(record)
+        for index in range(self.written, self.next_quad):
+            yield self._decode(self._record(index))
+
+    def __getitem__(self, index: int | slice) -> Quadruple | list[Quadruple]:
+        """Get a copy of a quadruple (or a list of them for a slice) by index."""
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(self.next_quad))]
+        if index < 0:
+            index += self.next_quad
+        self._row(index)
+        return self._decode(self._record(index))
+
+    def __getstate__(self) -> dict:
+        raise TypeError("a QuadrupleStream cannot be pickled, read its quadruples instead")
@@ -1,3 +1,6 @@
-from .quadruples_list import QuadruplesList
+from .quadruples_list import QuadruplesList, QuadrupleView
 
-__all__ = ["QuadruplesList"]
\ No newline at end of file
+__all__ = [
+    "QuadruplesList",
+    "QuadrupleView",
+]
@@ -1,26 +1,116 @@
-from typing import Optional
+from array import array
+from typing import Callable, Iterator
 from src.types import OperatorType
 from src.errors.internal_compiler_error import CompilerBug
-from src.intermediate_generation.quadruple import Quadruple
+from src.intermediate_generation.quadruple import Quadruple, OPCODES, OPCODE_OF, FUNCTION_OPERATORS
 
+NONE = -1   # stored in place of a missing operand
 
-class QuadruplesList: 
-    """A list of quadruples used for building the intermediate representation."""
-    
-    def __init__(self):
-        self.quadruples: list[Quadruple] = []
+
+class QuadrupleView(Quadruple):
+    """
+    A quadruple stored in a `QuadruplesList`. Its fields read and write the list,
+    so assigning `result` backpatches the stored quadruple.
+    """
+    __slots__ = ("_owner", "index")
+
+    def __init__(self, owner: "QuadruplesList", index: int):
+        self._owner = owner
+        self.index = index
+
+    @property
+    def operator(self) -> OperatorType:
+        return OPCODES[self._owner.opcodes[self.index]]
+
+    @property
+    def left(self) -> int | None:
+        value = self._owner.lefts[self.index]
+        return None if value == NONE else value
+
+    @property
+    def right(self) -> int | None:
+        value = self._owner.rights[self.index]
+        return None if value == NONE else value
+
+    @property
+    def result(self) -> int | str | None:
+        return self._owner.get_result(self.index)
+
+    @result.setter
+    def result(self, value: int | str | None) -> None:
+        self._owner.set_result(self.index, value)
+
+
+class QuadruplesList:
+    """
+    A list of quadruples used for building the intermediate representation.
+
+    The quadruples are stored column by column in typed arrays (an opcode and three
+    int32 operands each, NONE for a missing operand). Function names, the result of
+    ERA and GOSUB, are kept in the `symbols` side table and stored as their index.
+    Indexing and iterating give `QuadrupleView`s over the stored quadruples.
+    With `line_of`, the source line it returns is recorded for each appended quadruple.
+    """
+
+    def __init__(self, line_of: Callable[[], int] | None = None):
+        self.opcodes = array("B")
+        self.lefts = array("i")
+        self.rights = array("i")
+        self.results = array("i")
+        self.symbols: list[str] = []
+        self.symbol_ids: dict[str, int] = {}
         self.next_quad: int = 0
+        self.line_of = line_of
+        self.lines = array("i")
+
+    @property
+    def quadruples(self) -> "QuadruplesList":
+        """The quadruples as a sequence (the list itself)."""
+        return self
+
+    def _encode_result(self, operator: OperatorType, result: int | str | None) -> int:
+        if result is None:
+            return NONE
+        if operator in FUNCTION_OPERATORS:
+            if result not in self.symbol_ids:
+                self.symbol_ids[result] = len(self.symbols)
+                self.symbols.append(result)
+            return self.symbol_ids[result]
+        return result
 
     def append(self, quadruple: Quadruple) -> None:
         """Append a new quadruple to the list."""
-        self.quadruples.append(quadruple)
+        self.emit(quadruple.operator, quadruple.left, quadruple.right, quadruple.result)
+
+    def emit(self, operator: OperatorType, left: int | None, right: int | None,
+             result: int | str | None) -> None:
+        """Append a new quadruple given by its fields."""
+        self.opcodes.append(OPCODE_OF[operator])
+        self.lefts.append(NONE if left is None else left)
+        self.rights.append(NONE if right is None else right)
+        self.results.append(self._encode_result(operator, result))
         self.next_quad += 1
-    
+        if self.line_of is not None:
+            self.lines.append(self.line_of())
+
+    def get_result(self, index: int) -> int | str | None:
+        """Get the result field of the quadruple at the index."""
+        value = self.results[index]
+        if value == NONE:
+            return None
+        if OPCODES[self.opcodes[index]] in FUNCTION_OPERATORS:
+            return self.symbols[value]
+        return value
+
+    def set_result(self, index: int, result: int | str | None) -> None:
+        """Set the result field of the quadruple at the index (backpatching)."""
+        self.results[index] = self._encode_result(OPCODES[self.opcodes[index]], result)
+
     def get_last_quadruple(self) -> Quadruple:
         """Get the last quadruple in the list."""
-        if not self.quadruples:
+        if not self.next_quad:
             raise CompilerBug("No quadruples available.")
-        return self.quadruples[-1]
+        return QuadrupleView(self, self.next_quad - 1)
 
     def get_actual_index(self) -> int:
         """Get the current quadruple index."""
@@ -29,24 +119,41 @@ class QuadruplesList:
     def get_next_quad(self) -> int:
         """Get the next quadruple index."""
         return self.next_quad
-    
+
+    def finish(self) -> None:
+        """Called once the code generation is over (nothing to do in memory)."""
+
+    def to_quadruples(self) -> list[Quadruple]:
+        """Returns standalone copies of the quadruples."""
+        return [Quadruple(*quadruple) for quadruple in self]
+
     def dump(self) -> str:
         return "\n" + "\n".join(
-            f"{i:>3}: {quad}" for i, quad in enumerate(self.quadruples)
+            f"{i:>3}: {quad}" for i, quad in enumerate(self)
         )
 
     def __len__(self) -> int:
         """Get the length of the quadruples list."""
-        return len(self.quadruples)
-    
-    def __iter__(self):
+        return self.next_quad
+
+    def __iter__(self) -> Iterator[Quadruple]:
         """Iterate over the quadruples list."""
-        return iter(self.quadruples)
-    
-    def __getitem__(self, index: int) -> Quadruple:
-        """Get a quadruple by index."""
-        return self.quadruples[index]
-    
+        return (QuadrupleView(self, index) for index in range(self.next_quad))
+
+    def __getitem__(self, index: int | slice) -> Quadruple | list[Quadruple]:
+        """Get a quadruple (or a list of them for a slice) by index."""
+        if isinstance(index, slice):
+            return [QuadrupleView(self, idx) for idx in range(*index.indices(self.next_quad))]
+        if index < 0:
+            index += self.next_quad
+        if not 0 <= index < self.next_quad:
+            raise IndexError("quadruple index out of range")
+        return QuadrupleView(self, index)
+
+    def __getstate__(self) -> dict:
+        # the columns pickle as plain buffers, the line callback is not kept
+        return {**self.__dict__, "line_of": None}
+
     def __str__(self) -> str:
         """String representation of the quadruples list."""
-        return self.dump()
\ No newline at end of file
+        return self.dump()
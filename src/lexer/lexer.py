@@ -108,4 +108,8 @@ def t_error(t):
     t.lexer.skip(1)
 
 
-lexer = lex.lex()
+# module holding the prebuilt master regular expressions
+LEXTAB = "src.lexer.lextab"
+
+# load the prebuilt tables shipped in src/lexer/lextab.py (see src/parser/build_tables.py)
+lexer = lex.lex(optimize=True, lextab=LEXTAB)
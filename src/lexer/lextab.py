@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ASSIGN', 'COLON', 'COMMA', 'CTE_FLOAT', 'CTE_INT', 'CTE_STRING', 'DIV', 'DO', 'ELSE', 'END', 'FLOAT', 'GREATER', 'ID', 'IF', 'INT', 'LESS', 'L_BRACE', 'L_BRACK', 'L_PARENT', 'MAIN', 'MINUS', 'MULT', 'NOT_EQ', 'PLUS', 'PRINT', 'PROGRAM', 'R_BRACE', 'R_BRACK', 'R_PARENT', 'SEMICOLON', 'VAR', 'VOID', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_CTE_FLOAT>\\d+\\.\\d+)|(?P<t_CTE_INT>\\d+)|(?P<t_CTE_STRING>"[^"\\n]*")|(?P<t_ID>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_newline>\\n+)|(?P<t_L_BRACE>\\{)|(?P<t_L_BRACK>\\[)|(?P<t_L_PARENT>\\()|(?P<t_MULT>\\*)|(?P<t_NOT_EQ>!=)|(?P<t_PLUS>\\+)|(?P<t_R_BRACE>\\})|(?P<t_R_BRACK>\\])|(?P<t_R_PARENT>\\))|(?P<t_ASSIGN>=)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_DIV>/)|(?P<t_GREATER>>)|(?P<t_LESS><)|(?P<t_MINUS>-)|(?P<t_SEMICOLON>;)', [None, ('t_CTE_FLOAT', 'CTE_FLOAT'), ('t_CTE_INT', 'CTE_INT'), ('t_CTE_STRING', 'CTE_STRING'), ('t_ID', 'ID'), ('t_newline', 'newline'), (None, 'L_BRACE'), (None, 'L_BRACK'), (None, 'L_PARENT'), (None, 'MULT'), (None, 'NOT_EQ'), (None, 'PLUS'), (None, 'R_BRACE'), (None, 'R_BRACK'), (None, 'R_PARENT'), (None, 'ASSIGN'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIV'), (None, 'GREATER'), (None, 'LESS'), (None, 'MINUS'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,25 @@
+class LineTrackingLexer:
+    """
+    Wraps a lexer and remembers the line of the last two tokens it produced.
+
+    Both parsers read one token ahead before generating the code of what they have
+    just recognized, so `previous_line`, the line of the token before the lookahead,
+    is the line the generated code comes from.
+    """
+
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self.line = 1
+        self.previous_line = 1
+
+
+    def input(self, data: str) -> None:
+        self.lexer.input(data)
+
+
+    def token(self):
+        tok = self.lexer.token()
+        self.previous_line = self.line
+        if tok is not None:
+            self.line = tok.lineno
+        return tok
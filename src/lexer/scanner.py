@@ -0,0 +1,152 @@
+import functools
+import re
+from src.lexer.lexer import reserved, t_error
+
+# ignored blanks are matched as a prefix of the next token, so there is one match per
+# token; the numbered groups are tried in the same order as the PLY rules
+_MASTER_RE = re.compile(r"""
+    [ \t]*+
+    (?:
+        (\n+)                      # 1 newlines
+      | (\d+\.\d+)                # 2 CTE_FLOAT
+      | (\d+)                      # 3 CTE_INT
+      | ("[^"\n]*")                # 4 CTE_STRING
+      | ([a-zA-Z_][a-zA-Z0-9_]*)    # 5 ID and keywords
+      | (!=|[-+*/<>=(){}\[\]:,;])  # 6 symbols
+      | (.)                        # 7 illegal character
+    )
+""", re.VERBOSE | re.DOTALL)
+
+_NEWLINE, _CTE_FLOAT, _CTE_INT, _CTE_STRING, _ID, _SYMBOL = range(1, 7)
+
+SYMBOLS = {
+    "+": "PLUS",
+    "-": "MINUS",
+    "*": "MULT",
+    "/": "DIV",
+    ">": "GREATER",
+    "<": "LESS",
+    "=": "ASSIGN",
+    "(": "L_PARENT",
+    ")": "R_PARENT",
+    "{": "L_BRACE",
+    "}": "R_BRACE",
+    "[": "L_BRACK",
+    "]": "R_BRACK",
+    ":": "COLON",
+    ",": "COMMA",
+    ";": "SEMICOLON",
+    "!=": "NOT_EQ",
+}
+
+
+class Token:
+    """A token with the attributes the PLY parser reads."""
+    __slots__ = ("type", "value", "lineno", "lexpos", "lexer")
+
+    def __init__(self, type: str, value, lineno: int, lexpos: int):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __repr__(self) -> str:
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+class Scanner:
+    """
+    A hand-written alternative to the PLY lexer.
+
+    All the token rules are alternatives of a single compiled regular expression and
+    keywords are resolved with the `reserved` table, so there is no Python callback
+    per token. It has the interface the parser uses (`input`, `token`, `lineno`,
+    `clone`), produces the same token types, values and line numbers as the PLY
+    lexer and reports illegal characters through the same `t_error` rule.
+    """
+
+    def __init__(self):
+        self.lineno = 1
+        self.lexdata = ""
+        self.lexpos = 0
+        self._tokens = iter(())
+
+
+    def input(self, data: str) -> None:
+        """Sets the text to scan. The line number is kept, as in PLY."""
+        self.lexdata = data
+        self.lexpos = 0
+        self._tokens = self._scan()
+        # bound straight to the generator, so fetching a token runs no Python frame
+        self.token = functools.partial(next, self._tokens, None)
+
+
+    def begin(self, state: str) -> None:
+        """Only the INITIAL state exists, kept for compatibility with PLY."""
+        if state != "INITIAL":
+            raise ValueError(f"Undefined state '{state}'")
+
+
+    def skip(self, n: int) -> None:
+        """Skips characters, used by `t_error`."""
+        self.lexpos += n
+
+
+    def clone(self) -> "Scanner":
+        return Scanner()
+
+
+    def token(self) -> Token | None:
+        """Returns the next token, or None at the end of the input."""
+        return next(self._tokens, None)
+
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self) -> Token:
+        tok = self.token()
+        if tok is None:
+            raise StopIteration
+        return tok
+
+
+    def _scan(self):
+        data = self.lexdata
+        keyword = reserved.get
+        symbol = SYMBOLS.__getitem__
+        pos = 0
+
+        while True:
+            for match in _MASTER_RE.finditer(data, pos):
+                kind = match.lastindex
+                if kind == _ID:
+                    value = match.group(kind)
+                    yield Token(keyword(value, "ID"), value, self.lineno, match.start(kind))
+                elif kind == _SYMBOL:
+                    value = match.group(kind)
+                    yield Token(symbol(value), value, self.lineno, match.start(kind))
+                elif kind == _NEWLINE:
+                    self.lineno += match.end() - match.start(kind)
+                elif kind == _CTE_INT:
+                    yield Token("CTE_INT", int(match.group(kind)), self.lineno, match.start(kind))
+                elif kind == _CTE_FLOAT:
+                    yield Token("CTE_FLOAT", float(match.group(kind)), self.lineno, match.start(kind))
+                elif kind == _CTE_STRING:
+                    yield Token("CTE_STRING", match.group(kind)[1:-1], self.lineno, match.start(kind))
+                else:
+                    # same contract as PLY: the error rule sees the rest of the input
+                    # and has to skip at least one character
+                    pos = match.start(kind)
+                    self.lexpos = pos
+                    error = Token("error", data[pos:], self.lineno, pos)
+                    error.lexer = self
+                    t_error(error)
+                    if self.lexpos == pos:
+                        raise SyntaxError(f"Scanning error. Illegal character '{data[pos]}'")
+                    pos = self.lexpos
+                    break   # resume the scan after the skipped characters
+            else:
+                self.lexpos = len(data)
+                return
@@ -0,0 +1,112 @@
+from src.lexer.lexer import lexer as base_lexer
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _last_token_boundary(buffer: bytearray, start: int, quotes: int) -> int:
+    """
+    Returns the position of the last blank at or after `start` that is not inside a
+    string literal, or -1. The buffer starts at a line start or at such a blank, so a
+    blank is outside the strings when an even number of quotes comes before it
+    (`quotes` is the number of them in the whole buffer).
+    """
+    quotes_after = 0
+    end = len(buffer)
+    while True:
+        blank = max(buffer.rfind(b" ", start, end), buffer.rfind(b"\t", start, end))
+        if blank == -1:
+            return -1
+        quotes_after += buffer.count(b'"', blank, end)
+        if (quotes - quotes_after) % 2 == 0:
+            return blank
+        end = blank
+
+
+class StreamingLexer:
+    """
+    Feeds a PLY lexer from a binary stream (an open file, an mmap, ...) one chunk at
+    a time, so the whole program never has to be held as a single string.
+
+    Chunks are cut right after a newline: no token can contain one (string literals
+    stop at the end of the line), so every token is complete inside its chunk and
+    `t_newline` keeps counting lines across chunks. A line longer than `chunk_size`
+    is cut after a blank outside string literals, so only a single token longer than
+    the chunk is ever buffered whole. Token positions (`lexpos`) are absolute
+    character offsets.
+    """
+
+    def __init__(self, stream, lexer=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.stream = stream
+        self.lexer = lexer if lexer is not None else base_lexer.clone()
+        self.chunk_size = chunk_size
+        self.lexer.input("")  # drop whatever the lexer was scanning before
+
+        self._pending = b""         # bytes read after the end of the previous chunk
+        self._offset = 0            # characters consumed by the previous chunks
+        self._chunk_length = 0
+        self._eof = False
+
+
+    @property
+    def lineno(self) -> int:
+        return self.lexer.lineno
+
+
+    def _feed_next_chunk(self) -> bool:
+        """
+        Reads the next chunk and gives it to the lexer. Returns False at the end of the stream.
+        """
+        if self._eof and not self._pending:
+            return False
+
+        buffer = bytearray(self._pending)
+        quotes = buffer.count(b'"')
+        cut = -1
+        while not self._eof:
+            data = self.stream.read(self.chunk_size)
+            if not data:
+                self._eof = True
+                break
+            start = len(buffer)
+            buffer += data
+            quotes += data.count(b'"')
+            cut = buffer.rfind(b"\n", start)
+            if cut == -1 and len(buffer) >= self.chunk_size:
+                cut = _last_token_boundary(buffer, start, quotes)
+            if cut != -1:
+                break
+
+        if self._eof:
+            chunk, self._pending = buffer, b""
+        else:
+            chunk, self._pending = buffer[:cut + 1], bytes(buffer[cut + 1:])
+
+        self._offset += self._chunk_length
+        text = chunk.decode("utf-8")
+        self._chunk_length = len(text)
+        self.lexer.input(text)
+        return True
+
+
+    def token(self):
+        """
+        Returns the next token, or None at the end of the stream.
+        """
+        while True:
+            tok = self.lexer.token()
+            if tok is not None:
+                tok.lexpos += self._offset
+                return tok
+            if not self._feed_next_chunk():
+                return None
+
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self):
+        tok = self.token()
+        if tok is None:
+            raise StopIteration
+        return tok
@@ -0,0 +1,107 @@
+"""
+Regenerates the prebuilt PLY tables shipped with the compiler.
+
+The parser and the lexer load `src/parser/parsetab.py` and `src/lexer/lextab.py`
+in optimized mode, which skips PLY's own consistency checks. Run this module
+after changing the grammar or the token rules:
+
+    python -m src.parser.build_tables           # rewrite the stale tables
+    python -m src.parser.build_tables --check   # exit with 1 if a table is stale
+"""
+import argparse
+import importlib
+import os
+import sys
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+from src.lexer import lexer as lexer_module
+from src.parser import parser as parser_module
+
+PARSER_DIR = os.path.dirname(os.path.abspath(parser_module.__file__))
+LEXER_DIR = os.path.dirname(os.path.abspath(lexer_module.__file__))
+START_SYMBOL = "program"
+
+
+def grammar_signature() -> str:
+    """Returns the signature PLY computes for the grammar in `parser.py`."""
+    pdict = {name: getattr(parser_module, name) for name in dir(parser_module)}
+    pdict["start"] = START_SYMBOL
+
+    pinfo = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+    pinfo.get_all()
+    return pinfo.signature()
+
+
+def lexer_patterns() -> list[str]:
+    """Returns the master regular expressions built from the rules in `lexer.py`."""
+    fresh = lex.lex(module=lexer_module, errorlog=lex.NullLogger())
+    return [regex.pattern for regex, _ in fresh.lexstatere["INITIAL"]]
+
+
+def _load_table(name: str):
+    """Imports (or re-imports) a table module, returns None if it does not exist."""
+    sys.modules.pop(name, None)
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def stale_tables() -> list[str]:
+    """Returns the names of the shipped table modules that do not match the sources."""
+    stale = []
+
+    parsetab = _load_table(parser_module.TABMODULE)
+    if parsetab is None or parsetab._lr_signature != grammar_signature():
+        stale.append(parser_module.TABMODULE)
+
+    lextab = _load_table(lexer_module.LEXTAB)
+    if lextab is None or [pat for pat, _ in lextab._lexstatere["INITIAL"]] != lexer_patterns():
+        stale.append(lexer_module.LEXTAB)
+
+    return stale
+
+
+def build_tables() -> list[str]:
+    """Rewrites the stale table modules and returns their names."""
+    stale = stale_tables()
+
+    if parser_module.TABMODULE in stale:
+        # yacc only writes the table file when it does not match the grammar
+        yacc.yacc(
+            module=parser_module,
+            start=START_SYMBOL,
+            tabmodule=parser_module.TABMODULE,
+            outputdir=PARSER_DIR,
+            debug=False,
+            write_tables=True,
+        )
+
+    if lexer_module.LEXTAB in stale:
+        fresh = lex.lex(module=lexer_module)
+        fresh.writetab(lexer_module.LEXTAB, LEXER_DIR)
+
+    return stale
+
+
+def main(argv: list[str] | None = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--check", action="store_true",
+                            help="only verify that the shipped tables match the grammar")
+    args = arg_parser.parse_args(argv)
+
+    if args.check:
+        stale = stale_tables()
+        for name in stale:
+            print(f"stale table module: {name}")
+        return 1 if stale else 0
+
+    for name in build_tables():
+        print(f"rebuilt {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,458 @@
+from src.lexer.lexer import lexer as base_lexer
+from src.syntax_tree.node import Node
+from src.semantic.constants import GLOBAL_FUNC_NAME
+from src.types import FunctionTypeEnum
+
+# tokens that can start a statement
+STATEMENT_START = frozenset(("ID", "IF", "WHILE", "PRINT"))
+
+RELATIONAL_OPERATORS = frozenset(("GREATER", "LESS", "NOT_EQ"))
+ADDITIVE_OPERATORS = frozenset(("PLUS", "MINUS"))
+MULTIPLICATIVE_OPERATORS = frozenset(("MULT", "DIV"))
+FACTOR_VALUES = frozenset(("ID", "CTE_INT", "CTE_FLOAT"))
+
+
+class DescentParser:
+    """
+    A hand-written predictive parser for the Baby Duck grammar.
+
+    It recognizes the same language as the PLY parser and calls the same
+    `IntermediateGenerator` methods in the same order, but directly at each neuralgic
+    point instead of through empty productions, and returns the same syntax tree.
+    It reads the same attributes the grammar actions read through `p.parser`
+    (`function_dir`, `intermediate_generator`, `current_function`, `current_type`),
+    so a `Compiler` can use either front end.
+
+    Without `build_ast` it only generates code and every method returns None.
+
+    Like the PLY parser, it raises `SyntaxError` at the first unexpected token and
+    does not try to recover.
+    """
+
+    def __init__(self):
+        self.memory_manager = None
+        self.function_dir = None
+        self.intermediate_generator = None
+        self.current_function = GLOBAL_FUNC_NAME
+        self.current_type = None
+        self.build_ast = True
+
+        self.tok = None
+        self._next_token = None
+
+
+    def parse(self, input: str | None = None, lexer=None) -> Node:
+        """
+        Parses a program and returns its syntax tree. Same calling convention as PLY:
+        the text is given to `lexer` when `input` is not None.
+        """
+        if lexer is None:
+            lexer = base_lexer.clone()
+        if input is not None:
+            lexer.input(input)
+
+        self._next_token = lexer.token
+        self.tok = self._next_token()
+        tree = self.program()
+        if self.tok is not None:
+            self._error()
+        return tree
+
+
+    # -----------------------------------------------------------------------
+    #  Tokens
+
+    def _error(self):
+        tok = self.tok
+        if tok is None:
+            raise SyntaxError("Syntax error at EOF")
+        raise SyntaxError(f"Syntax error at token {tok.type!r} (value={tok.value!r}) line={tok.lineno}")
+
+
+    def _expect(self, type: str):
+        """Consumes a token of the given type and returns its value."""
+        tok = self.tok
+        if tok is None or tok.type != type:
+            self._error()
+        self.tok = self._next_token()
+        return tok.value
+
+
+    def _peek_type(self) -> str | None:
+        tok = self.tok
+        return tok.type if tok is not None else None
+
+
+    # -----------------------------------------------------------------------
+    #  Top Level
+
+    def program(self) -> Node:
+        generator = self.intermediate_generator
+
+        self._expect("PROGRAM")
+        name = self._expect("ID")
+        self._expect("SEMICOLON")
+
+        # NP: push the initial quadruple to the list (GOTO)
+        generator.push_initial_quadruple()
+
+        variables = self.vars_or_empty()
+        while self._peek_type() == "VOID":
+            self.func()
+
+        # NP: patch the initial quadruple with the destination
+        generator.assign_goto_destination()
+
+        self._expect("MAIN")
+        self.body()
+
+        # NP: close the program (resources, memory reset and END_PROG quadruple)
+        generator.handle_function_end(GLOBAL_FUNC_NAME, "END_PROG")
+        self._expect("END")
+
+        if self.build_ast:
+            return Node("Program", [name, None, variables, None])
+
+
+    # -----------------------------------------------------------------------
+    #  Vars
+
+    def vars_or_empty(self):
+        if self._peek_type() != "VAR":
+            return None
+
+        self._expect("VAR")
+        declarations = [self.vars_declaration()]
+        while self._peek_type() == "ID":
+            declarations.append(self.vars_declaration())
+        if self.build_ast:
+            return Node("Vars", declarations)
+
+
+    def vars_declaration(self) -> Node:
+        ids = [self._expect("ID")]
+        while self._peek_type() == "COMMA":
+            self.tok = self._next_token()
+            ids.append(self._expect("ID"))
+        self._expect("COLON")
+        var_type = self.type()
+        self._expect("SEMICOLON")
+
+        # NP: add the variables to the function directory
+        scope = self.current_function
+        for id in ids:
+            self.function_dir.add_var_to_function(scope, id, var_type)
+
+        if self.build_ast:
+            return Node("VarsDecl", [ids, var_type])
+
+
+    def type(self) -> str:
+        if self._peek_type() not in ("INT", "FLOAT"):
+            self._error()
+        var_type = self.tok.value
+        self.tok = self._next_token()
+
+        # NP: set the current type
+        self.current_type = var_type
+        return var_type
+
+
+    # -----------------------------------------------------------------------
+    #  Functions
+
+    def func(self) -> Node:
+        generator = self.intermediate_generator
+
+        self._expect("VOID")
+        func_name = self._expect("ID")
+
+        # NP: add the function to the function directory and enter its scope
+        generator.add_function_to_dir(func_name, FunctionTypeEnum.VOID)
+        self.current_function = func_name
+
+        self._expect("L_PARENT")
+        if self._peek_type() == "ID":
+            self.param()
+            while self._peek_type() == "COMMA":
+                self.tok = self._next_token()
+                self.param()
+        self._expect("R_PARENT")
+        self._expect("L_BRACK")
+
+        variables = self.vars_or_empty()
+        body = self.body()
+
+        self._expect("R_BRACK")
+        self._expect("SEMICOLON")
+
+        # NP: close the function (resources, memory reset and END_FUNC quadruple)
+        #   : and go back to the global function
+        generator.handle_function_end(self.current_function, "END_FUNC")
+        self.current_function = GLOBAL_FUNC_NAME
+
+        if self.build_ast:
+            return Node("Func", [None, variables, body[0], body[1]])
+
+
+    def param(self) -> Node:
+        id = self._expect("ID")
+        self._expect("COLON")
+        param_type = self.type()
+
+        # NP: add the parameter to the var table and its type to the function signature
+        self.intermediate_generator.register_parameter(self.current_function, id, param_type)
+        if self.build_ast:
+            return Node("Param", [id, param_type])
+
+
+    # -----------------------------------------------------------------------
+    #  Body And Statements
+
+    def body(self) -> Node:
+        self._expect("L_BRACE")
+        if not self.build_ast:
+            while self._peek_type() in STATEMENT_START:
+                self.statement()
+            self._expect("R_BRACE")
+            return None
+
+        statements = []
+        while self._peek_type() in STATEMENT_START:
+            statements.append(self.statement())
+        self._expect("R_BRACE")
+        return Node("Body", statements)
+
+
+    def statement(self):
+        kind = self.tok.type
+        if kind == "ID":
+            # an assignment or a call, told apart by the token after the name
+            name = self.tok.value
+            self.tok = self._next_token()
+            if self._peek_type() == "ASSIGN":
+                return self.assign(name)
+            return self.f_call(name)
+        if kind == "IF":
+            return self.condition()
+        if kind == "WHILE":
+            return self.cycle()
+        return self.print()
+
+
+    # -----------------------------------------------------------------------
+    #  Assign
+
+    def assign(self, var: str) -> Node:
+        self._expect("ASSIGN")
+        value = self.expresion()
+        self._expect("SEMICOLON")
+
+        # NP: push the assignment to the quadruple list
+        self.intermediate_generator.create_assignment_quadruple(self.current_function, var)
+        if self.build_ast:
+            return Node("Assign", [var, value])
+
+
+    # -----------------------------------------------------------------------
+    #  Condition
+
+    def condition(self) -> Node:
+        generator = self.intermediate_generator
+
+        self._expect("IF")
+        self._expect("L_PARENT")
+        test = self.expresion()
+        self._expect("R_PARENT")
+
+        # NP: push the GOTOF to the quadruple list
+        generator.generate_gotof_for_statement()
+
+        body = self.body()
+        else_body = None
+        if self._peek_type() == "ELSE":
+            # NP: skip the else block and patch the GOTOF
+            generator.handle_else()
+            self.tok = self._next_token()
+            else_body = self.body()
+
+        # NP: patch the pending jump to exit here
+        generator.assign_goto_destination()
+        self._expect("SEMICOLON")
+        if self.build_ast:
+            return Node("If", [test, body, else_body])
+
+
+    # -----------------------------------------------------------------------
+    #  Cycle
+
+    def cycle(self) -> Node:
+        generator = self.intermediate_generator
+
+        self._expect("WHILE")
+
+        # NP: push the start of the loop to the jump stack
+        generator.mark_loop_start()
+
+        self._expect("L_PARENT")
+        test = self.expresion()
+        self._expect("R_PARENT")
+
+        # NP: push the GOTOF to the quadruple list
+        generator.generate_gotof_for_statement()
+
+        do = self._expect("DO")
+        body = self.body()
+
+        # NP: close the loop
+        generator.close_loop()
+        self._expect("SEMICOLON")
+        if self.build_ast:
+            return Node("While", [test, do, body])
+
+
+    # -----------------------------------------------------------------------
+    #  Function Call
+
+    def f_call(self, func_name: str) -> Node:
+        generator = self.intermediate_generator
+        if self._peek_type() != "L_PARENT":
+            self._error()
+
+        # NP: add the ERA quadruple and set the function being called
+        generator.handle_function_called_start(func_name)
+
+        self.tok = self._next_token()
+        args = []
+        if self._peek_type() != "R_PARENT":
+            args.append(self.expresion())
+            # NP: add the PARAM quadruple and verify the signature
+            generator.handle_new_param()
+            while self._peek_type() == "COMMA":
+                self.tok = self._next_token()
+                args.append(self.expresion())
+                generator.handle_new_param()
+        self._expect("R_PARENT")
+
+        # NP: add the GOSUB quadruple
+        generator.handle_function_call_finished()
+        self._expect("SEMICOLON")
+        if self.build_ast:
+            return Node("Call", [func_name, args])
+
+
+    # -----------------------------------------------------------------------
+    #  Print
+
+    def print(self) -> Node:
+        generator = self.intermediate_generator
+
+        self._expect("PRINT")
+        self._expect("L_PARENT")
+        options = []
+        while True:
+            if self._peek_type() == "CTE_STRING":
+                option = self.tok.value
+                self.tok = self._next_token()
+                generator.push_operand(lexeme=option, token_type="CTE_STRING",
+                                       current_scope=self.current_function)
+            else:
+                option = self.expresion()
+            options.append(option)
+
+            # NP: push a print quadruple
+            generator.create_print_quadruple()
+
+            if self._peek_type() != "COMMA":
+                break
+            self.tok = self._next_token()
+        self._expect("R_PARENT")
+        self._expect("SEMICOLON")
+        if self.build_ast:
+            return Node("Print", options)
+
+
+    # -----------------------------------------------------------------------
+    #  Expressions
+
+    def expresion(self) -> Node:
+        left = self.exp()
+        right = None
+        if self._peek_type() in RELATIONAL_OPERATORS:
+            operator = self.tok.value
+            self.tok = self._next_token()
+            # NP: push the operator to the intermediate generator
+            self.intermediate_generator.push_operator(operator)
+            right = self.exp()
+
+        # NP: pop the stack until the bottom
+        self.intermediate_generator.pop_until_bottom()
+        if self.build_ast:
+            return Node("Exp", [left, [operator, right] if right is not None else []])
+
+
+    def exp(self) -> Node:
+        build_ast = self.build_ast
+        first = self.termino()
+        children = [first] if build_ast else None
+        while self._peek_type() in ADDITIVE_OPERATORS:
+            operator = self.tok.value
+            self.tok = self._next_token()
+            # NP: push the operator to the intermediate generator
+            self.intermediate_generator.push_operator(operator)
+            operand = self.termino()
+            if build_ast:
+                children += (operator, operand)
+        if build_ast:
+            return Node("Exp", children)
+
+
+    def termino(self) -> Node:
+        build_ast = self.build_ast
+        first = self.factor()
+        children = [first] if build_ast else None
+        while self._peek_type() in MULTIPLICATIVE_OPERATORS:
+            operator = self.tok.value
+            self.tok = self._next_token()
+            # NP: push the operator to the intermediate generator
+            self.intermediate_generator.push_operator(operator)
+            operand = self.factor()
+            if build_ast:
+                children += (operator, operand)
+        if build_ast:
+            return Node("Termino", children)
+
+
+    def factor(self):
+        kind = self._peek_type()
+        if kind == "L_PARENT":
+            self.tok = self._next_token()
+            # NP: push a fake bottom for the nested expression
+            self.intermediate_generator.push_fake_bottom()
+            value = self.expresion()
+            self._expect("R_PARENT")
+            return value
+
+        sign = None
+        if kind in ADDITIVE_OPERATORS:
+            sign = self.tok.value
+            self.tok = self._next_token()
+            kind = self._peek_type()
+        if kind not in FACTOR_VALUES:
+            self._error()
+        lexeme = self.tok.value
+        self.tok = self._next_token()
+
+        # add the sign to the lexeme if it is a number
+        if sign == "-" and kind != "ID":
+            lexeme = -lexeme
+
+        # NP: push the operand to the intermediate generator
+        self.intermediate_generator.push_operand(lexeme=lexeme, token_type=kind,
+                                                 current_scope=self.current_function)
+
+        if not self.build_ast:
+            return None
+        if sign == "-":
+            return Node("Negate", [lexeme])
+        return lexeme
@@ -4,6 +4,16 @@ from src.syntax_tree.node import Node
 from src.semantic.constants import GLOBAL_FUNC_NAME
 from src.types import FunctionTypeEnum
 
+# module holding the prebuilt parsing tables
+TABMODULE = "src.parser.parsetab"
+
+
+# The grammar actions only build the syntax tree when `p.parser.build_ast` is set:
+# quadruples are generated in the neuralgic points, so nothing else needs it.
+#
+# Repetitions (`body_helper`, `vars_helper`, `more_ids`, ...) are left-recursive: each
+# reduction appends to the list built so far, so they take linear time and the parser
+# stack does not grow with the number of items.
 
 # ---------------------------------------------------------------------------
 #  Top Level
@@ -32,7 +42,8 @@ def p_handle_program_end(p):
 def p_program(p):
     """program : PROGRAM ID SEMICOLON push_initial_quadruple vars_or_empty funcs_or_empty assign_destination_of_initial_quadruple MAIN body handle_program_end END"""
     
-    p[0] = Node("Program", [p[2], p[4], p[5], p[7]])
+    if p.parser.build_ast:
+        p[0] = Node("Program", [p[2], p[4], p[5], p[7]])
 
 
 # ---------------------------------------------------------------------------
@@ -47,7 +58,8 @@ def p_vars_or_empty(p):
 
 def p_vars(p):
     """vars : VAR vars_declaration vars_helper"""
-    p[0] = Node("Vars", [p[2]] + p[3])
+    if p.parser.build_ast:
+        p[0] = Node("Vars", [p[2]] + p[3])
 
 
 def p_vars_declaration(p):
@@ -60,22 +72,27 @@ def p_vars_declaration(p):
         # NP: add the variable to the function directory
         p.parser.function_dir.add_var_to_function(scope, id, var_type)
     
-    p[0] = Node("VarsDecl", [ids, p[4]])
+    if p.parser.build_ast:
+        p[0] = Node("VarsDecl", [ids, p[4]])
 
 
 def p_vars_helper(p):
-    """vars_helper : vars_declaration vars_helper
+    """vars_helper : vars_helper vars_declaration
                   | empty"""
+    if not p.parser.build_ast:
+        return
     if len(p) == 3:  # first production
-        p[0] = [p[1]] + p[2]
+        p[0] = p[1]
+        p[0].append(p[2])
     else:
         p[0] = []
 
 def p_more_ids(p):
-    """more_ids : COMMA ID more_ids
+    """more_ids : more_ids COMMA ID
                 | empty"""
     if len(p) == 4:  # first production
-        p[0] = [p[2]] + (p[3] or [])
+        p[0] = p[1]
+        p[0].append(p[3])
     else:
         p[0] = []
 
@@ -90,10 +107,13 @@ def p_type(p):
 # ---------------------------------------------------------------------------
 #  Functions
 def p_funcs_or_empty(p):
-    """funcs_or_empty : funcs funcs_or_empty
+    """funcs_or_empty : funcs_or_empty funcs
                         | empty"""
+    if not p.parser.build_ast:
+        return
     if len(p) == 3:  # first production
-        p[0] = [p[1]] + p[2]
+        p[0] = p[1]
+        p[0].append(p[2])
     else:
         p[0] = []
 
@@ -130,6 +150,8 @@ def p_func_footer(p):
 
 def p_funcs(p):
     """funcs : func_header vars_or_empty body func_footer"""
+    if not p.parser.build_ast:
+        return
     p[0] = Node("Func", [
         p[1], 
         p[2], 
@@ -144,12 +166,15 @@ def p_param(p):
     id, type = p[1], p[3]
     p.parser.intermediate_generator.register_parameter(p.parser.current_function, id, type)
 
-    p[0] = Node("Param", [p[1], p[3]])
+    if p.parser.build_ast:
+        p[0] = Node("Param", [p[1], p[3]])
 
 
 def p_param_list(p):
     """param_list : param param_list_helper
                 | empty"""
+    if not p.parser.build_ast:
+        return
     if len(p) == 3:  # first production
         p[0] = [p[1]] + p[2]
     else:
@@ -157,10 +182,13 @@ def p_param_list(p):
 
 
 def p_param_list_helper(p):
-    """param_list_helper : COMMA param param_list_helper
+    """param_list_helper : param_list_helper COMMA param
                         | empty"""
+    if not p.parser.build_ast:
+        return
     if len(p) == 4:  # first production
-        p[0] = [p[2]] + p[3]
+        p[0] = p[1]
+        p[0].append(p[3])
     else:
         p[0] = []
 
@@ -169,14 +197,18 @@ def p_param_list_helper(p):
 #  Body And Statements
 def p_body(p):
     """body : L_BRACE body_helper R_BRACE"""
-    p[0] = Node("Body", p[2])
+    if p.parser.build_ast:
+        p[0] = Node("Body", p[2])
 
 
 def p_body_helper(p):
-    """body_helper : statement body_helper
+    """body_helper : body_helper statement
                   | empty"""
+    if not p.parser.build_ast:
+        return
     if len(p) == 3:  # first production
-        p[0] = [p[1]] + p[2]
+        p[0] = p[1]
+        p[0].append(p[2])
     else:
         p[0] = []
 
@@ -199,7 +231,8 @@ def p_assign(p):
     var = p[1]
     p.parser.intermediate_generator.create_assignment_quadruple(p.parser.current_function,  var)
         
-    p[0] = Node("Assign", [p[1], p[3]])
+    if p.parser.build_ast:
+        p[0] = Node("Assign", [p[1], p[3]])
 
 
 # ---------------------------------------------------------------------------
@@ -219,7 +252,8 @@ def p_update_goto(p):
 
 def p_condition(p):
     """condition : IF L_PARENT expresion R_PARENT generate_gotof body else_part update_goto SEMICOLON"""
-    p[0] = Node("If", [p[3], p[6], p[7]])
+    if p.parser.build_ast:
+        p[0] = Node("If", [p[3], p[6], p[7]])
 
 def p_else_handler(p):
     """else_handler :"""
@@ -255,7 +289,8 @@ def p_while_end(p):
 
 def p_cycle(p):
     """cycle : WHILE while_start L_PARENT expresion R_PARENT generate_gotof DO body while_end SEMICOLON"""
-    p[0] = Node("While", [p[4], p[7], p[8]])
+    if p.parser.build_ast:
+        p[0] = Node("While", [p[4], p[7], p[8]])
 
 
 # ---------------------------------------------------------------------------
@@ -282,7 +317,8 @@ def p_handle_function_call_finished(p):
 def p_f_call(p):
     """f_call : handle_function_called_start L_PARENT args_list R_PARENT handle_function_call_finished SEMICOLON"""
 
-    p[0] = Node("Call", [p[1], p[3]])
+    if p.parser.build_ast:
+        p[0] = Node("Call", [p[1], p[3]])
 
 
 def p_handle_new_param(p):
@@ -296,6 +332,8 @@ def p_handle_new_param(p):
 def p_args_list(p):
     """args_list : expresion handle_new_param args_list_helper
                 | empty"""
+    if not p.parser.build_ast:
+        return
     if len(p) == 4:  # first production
         p[0] = [p[1]] + p[3]
     else:
@@ -303,10 +341,13 @@ def p_args_list(p):
 
 
 def p_args_list_helper(p):
-    """args_list_helper : COMMA expresion handle_new_param args_list_helper
+    """args_list_helper : args_list_helper COMMA expresion handle_new_param
                         | empty"""
+    if not p.parser.build_ast:
+        return
     if len(p) == 5:  # first production
-        p[0] = [p[2]] + p[4]
+        p[0] = p[1]
+        p[0].append(p[3])
     else:
         p[0] = []
 
@@ -315,7 +356,8 @@ def p_args_list_helper(p):
 #  Print
 def p_print(p):
     """print : PRINT L_PARENT print_options R_PARENT SEMICOLON"""
-    p[0] = Node("Print", p[3])
+    if p.parser.build_ast:
+        p[0] = Node("Print", p[3])
 
 
 def p_add_print_quadruple(p):
@@ -325,18 +367,16 @@ def p_add_print_quadruple(p):
     p.parser.intermediate_generator.create_print_quadruple()
 
 def p_print_options(p):
-    """print_options : print_option add_print_quadruple more_expressions"""
+    """print_options : print_options COMMA print_option add_print_quadruple
+                     | print_option add_print_quadruple"""
     
-    p[0] = [p[1]] + p[3]
-
-
-def p_more_expressions(p):
-    """more_expressions : COMMA print_options
-                        | empty"""
-    if len(p) == 3:  # first production
-        p[0] = p[2]
+    if not p.parser.build_ast:
+        return
+    if len(p) == 5:  # first production
+        p[0] = p[1]
+        p[0].append(p[3])
     else:
-        p[0] = []
+        p[0] = [p[1]]
 
 
 def p_print_option(p):
@@ -364,11 +404,14 @@ def p_resolve_expression(p):
 
 def p_expresion(p):
     """expresion : exp relational_part resolve_expression"""
-    p[0] = Node("Exp", [p[1], p[2]])
+    if p.parser.build_ast:
+        p[0] = Node("Exp", [p[1], p[2]])
 
 def p_relational_part(p):
     """relational_part : relational_operators exp
                       | empty"""
+    if not p.parser.build_ast:
+        return
     if len(p) == 3:  # first production
         p[0] = [p[1], p[2]]
     else:
@@ -388,14 +431,18 @@ def p_relational_operators(p):
 #  Arithmetic Expressions
 def p_exp(p):
     """exp : termino exp_helper"""
-    p[0] = Node("Exp", [p[1]] + p[2])
+    if p.parser.build_ast:
+        p[0] = Node("Exp", [p[1]] + p[2])
 
 
 def p_exp_helper(p):
-    """exp_helper : plus_or_minus termino exp_helper
+    """exp_helper : exp_helper plus_or_minus termino
                   | empty"""
+    if not p.parser.build_ast:
+        return
     if len(p) == 4:  # first production
-        p[0] = [p[1], p[2]] + p[3]
+        p[0] = p[1]
+        p[0] += (p[2], p[3])
     else:
         p[0] = []
 
@@ -411,14 +458,18 @@ def p_plus_or_minus(p):
 
 def p_termino(p):
     """termino : factor termino_helper"""
-    p[0] = Node("Termino", [p[1]] + p[2])
+    if p.parser.build_ast:
+        p[0] = Node("Termino", [p[1]] + p[2])
 
 
 def p_termino_helper(p):
-    """termino_helper : mult_or_div factor termino_helper
+    """termino_helper : termino_helper mult_or_div factor
                       | empty"""
+    if not p.parser.build_ast:
+        return
     if len(p) == 4:  # first production
-        p[0] = [p[1], p[2]] + p[3]
+        p[0] = p[1]
+        p[0] += (p[2], p[3])
     else:
         p[0] = []
 
@@ -465,7 +516,7 @@ def p_factor(p):
     )
 
 
-    if sign == '-':
+    if sign == '-' and p.parser.build_ast:
         p[0] = Node("Negate", [lexeme])
     else:
         p[0] = lexeme
@@ -498,15 +549,26 @@ def p_empty(p):
 
 
 def p_error(p):
+    # no error recovery: the grammar actions have already generated code for the
+    # tokens before the error, so whatever follows could not be trusted
     if p:
-        print(f"Syntax error at token {p.type!r} (value={p.value!r}) line={p.lineno}")
-    else:
-        print("Syntax error at EOF")
+        raise SyntaxError(f"Syntax error at token {p.type!r} (value={p.value!r}) line={p.lineno}")
+    raise SyntaxError("Syntax error at EOF")
 
 
 
 
 
-parser = yacc.yacc(start='program')
+# load the prebuilt LALR tables shipped in src/parser/parsetab.py (see build_tables.py),
+# never write tables or debug files at import time
+parser = yacc.yacc(
+    start='program',
+    tabmodule=TABMODULE,
+    optimize=True,
+    debug=False,
+    write_tables=False,
+)
 parser.current_function = GLOBAL_FUNC_NAME 
-parser.current_type = None 
\ No newline at end of file
+parser.current_type = None
+# direct users of the module-level parser get the syntax tree, as before sessions existed
+parser.build_ast = True 
\ No newline at end of file
@@ -0,0 +1,114 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'programASSIGN COLON COMMA CTE_FLOAT CTE_INT CTE_STRING DIV DO ELSE END FLOAT GREATER ID IF INT LESS L_BRACE L_BRACK L_PARENT MAIN MINUS MULT NOT_EQ PLUS PRINT PROGRAM R_BRACE R_BRACK R_PARENT SEMICOLON VAR VOID WHILEpush_initial_quadruple :assign_destination_of_initial_quadruple :handle_program_end :program : PROGRAM ID SEMICOLON push_initial_quadruple vars_or_empty funcs_or_empty assign_destination_of_initial_quadruple MAIN body handle_program_end ENDvars_or_empty : vars\n                    | emptyvars : VAR vars_declaration vars_helpervars_declaration : ID more_ids COLON type SEMICOLONvars_helper : vars_helper vars_declaration\n                  | emptymore_ids : more_ids COMMA ID\n                | emptytype : INT\n            | FLOATfuncs_or_empty : funcs_or_empty funcs\n                        | emptypush_scope :func_header : VOID ID push_scope L_PARENT param_list R_PARENT L_BRACKfunc_footer : R_BRACK SEMICOLONfuncs : func_header vars_or_empty body func_footerparam : ID COLON typeparam_list : param param_list_helper\n                | emptyparam_list_helper : param_list_helper COMMA param\n                        | emptybody : L_BRACE body_helper R_BRACEbody_helper : body_helper statement\n                  | emptystatement : assign\n                | condition\n                | cycle\n                | f_call\n                | printassign : ID ASSIGN expresion SEMICOLONgenerate_gotof :update_goto :condition : IF L_PARENT expresion R_PARENT generate_gotof body else_part update_goto SEMICOLONelse_handler :else_part : else_handler ELSE body\n                  | emptywhile_start :while_end :cycle : WHILE while_start L_PARENT expresion R_PARENT generate_gotof DO body while_end SEMICOLONhandle_function_called_start : IDhandle_function_call_finished :f_call : handle_function_called_start L_PARENT args_list R_PARENT handle_function_call_finished SEMICOLONhandle_new_param :args_list : expresion handle_new_param args_list_helper\n                | emptyargs_list_helper : args_list_helper COMMA expresion handle_new_param\n                        | emptyprint : PRINT L_PARENT print_options R_PARENT SEMICOLONadd_print_quadruple :print_options : print_options COMMA print_option add_print_quadruple\n                     | print_option add_print_quadrupleprint_option : expresion\n                    | CTE_STRINGresolve_expression :expresion : exp relational_part resolve_expressionrelational_part : relational_operators exp\n                      | emptyrelational_operators : GREATER\n                            | LESS\n                            | NOT_EQexp : termino exp_helperexp_helper : exp_helper plus_or_minus termino\n                  | emptyplus_or_minus : PLUS\n                    | MINUStermino : factor termino_helpertermino_helper : termino_helper mult_or_div factor\n                      | emptymult_or_div : MULT\n                    | DIVlp : L_PARENTfactor : lp expresion R_PARENT\n              | factor_sign factor_valuefactor_sign : PLUS\n                  | MINUS\n                  | emptyfactor_value : ID\n                    | CTE_INT\n                    | CTE_FLOATempty :'
+    
+_lr_action_items = {'PROGRAM':([0,],[2,]),'$end':([1,43,],[0,-4,]),'ID':([2,9,12,17,18,19,25,27,29,37,38,41,42,45,46,47,48,49,50,61,62,64,65,74,75,76,77,78,79,81,84,91,92,94,96,97,98,113,118,119,120,121,122,123,130,136,137,148,151,],[3,13,-84,24,13,-10,-9,35,-84,51,-28,57,-8,-27,-29,-30,-31,-32,-33,-84,-84,-84,-84,-84,105,-75,-78,-79,-80,-84,-80,57,-34,-84,-62,-63,-64,-84,-84,-68,-69,-84,-73,-74,-52,-46,-84,-37,-43,]),'SEMICOLON':([3,32,33,34,40,44,70,71,72,73,93,95,99,100,101,102,104,105,106,107,110,112,116,117,124,127,132,133,134,139,141,144,146,149,150,],[4,42,-13,-14,56,-26,92,-84,-84,-84,-58,-61,-65,-67,-70,-72,-77,-81,-82,-83,-45,130,-59,-60,-76,136,-66,-71,-84,-36,-40,148,-42,-39,151,]),'VAR':([4,5,16,90,],[-1,9,9,-18,]),'VOID':([4,5,6,7,8,10,11,12,15,18,19,25,39,42,56,],[-1,-84,-84,-5,-6,17,-16,-84,-15,-7,-10,-9,-20,-8,-19,]),'MAIN':([4,5,6,7,8,10,11,12,14,15,18,19,25,39,42,56,],[-1,-84,-84,-5,-6,-2,-16,-84,22,-15,-7,-10,-9,-20,-8,-19,]),'L_BRACE':([7,8,12,16,18,19,22,23,25,42,90,108,125,142,145,],[-5,-6,-84,-84,-7,-10,29,29,-9,-8,-18,-35,29,29,29,]),'COLON':([13,20,21,35,57,],[-84,26,-12,-11,66,]),'COMMA':([13,20,21,33,34,35,59,68,69,71,72,73,83,85,86,87,88,89,93,95,99,100,101,102,104,105,106,107,111,114,115,116,117,124,128,129,131,132,133,138,143,147,],[-84,27,-12,-13,-14,-11,-84,91,-25,-84,-84,-84,-47,113,-53,-56,-57,-21,-58,-61,-65,-67,-70,-72,-77,-81,-82,-83,-84,-55,-24,-59,-60,-76,137,-51,-53,-66,-71,-54,-47,-50,]),'L_PARENT':([24,31,51,52,53,54,55,61,62,63,64,65,74,76,81,94,96,97,98,113,118,119,120,121,122,123,137,],[-17,41,-44,62,-41,64,65,76,76,81,76,76,76,-75,76,76,-62,-63,-64,76,76,-68,-69,76,-73,-74,76,]),'INT':([26,66,],[33,33,]),'FLOAT':([26,66,],[34,34,]),'END':([28,36,44,],[-3,43,-26,]),'R_BRACE':([29,37,38,45,46,47,48,49,50,92,130,136,148,151,],[-84,44,-28,-27,-29,-30,-31,-32,-33,-34,-52,-46,-37,-43,]),'IF':([29,37,38,45,46,47,48,49,50,92,130,136,148,151,],[-84,52,-28,-27,-29,-30,-31,-32,-33,-34,-52,-46,-37,-43,]),'WHILE':([29,37,38,45,46,47,48,49,50,92,130,136,148,151,],[-84,53,-28,-27,-29,-30,-31,-32,-33,-34,-52,-46,-37,-43,]),'PRINT':([29,37,38,45,46,47,48,49,50,92,130,136,148,151,],[-84,55,-28,-27,-29,-30,-31,-32,-33,-34,-52,-46,-37,-43,]),'R_BRACK':([30,44,],[40,-26,]),'R_PARENT':([33,34,41,58,59,60,64,68,69,71,72,73,80,82,83,84,85,86,87,88,89,93,95,99,100,101,102,103,104,105,106,107,109,111,114,115,116,117,124,128,129,131,132,133,138,143,147,],[-13,-14,-84,67,-84,-23,-84,-22,-25,-84,-84,-84,108,110,-47,-49,112,-53,-56,-57,-21,-58,-61,-65,-67,-70,-72,124,-77,-81,-82,-83,126,-84,-55,-24,-59,-60,-76,-48,-51,-53,-66,-71,-54,-47,-50,]),'ELSE':([44,134,140,],[-26,-38,145,]),'ASSIGN':([51,],[61,]),'PLUS':([61,62,64,65,72,73,74,76,81,94,96,97,98,99,100,101,102,104,105,106,107,113,118,119,120,121,122,123,124,132,133,137,],[77,77,77,77,-84,-84,77,-75,77,77,-62,-63,-64,119,-67,-70,-72,-77,-81,-82,-83,77,77,-68,-69,77,-73,-74,-76,-66,-71,77,]),'MINUS':([61,62,64,65,72,73,74,76,81,94,96,97,98,99,100,101,102,104,105,106,107,113,118,119,120,121,122,123,124,132,133,137,],[78,78,78,78,-84,-84,78,-75,78,78,-62,-63,-64,120,-67,-70,-72,-77,-81,-82,-83,78,78,-68,-69,78,-73,-74,-76,-66,-71,78,]),'CTE_INT':([61,62,64,65,74,75,76,77,78,79,81,84,94,96,97,98,113,118,119,120,121,122,123,137,],[-84,-84,-84,-84,-84,106,-75,-78,-79,-80,-84,-80,-84,-62,-63,-64,-84,-84,-68,-69,-84,-73,-74,-84,]),'CTE_FLOAT':([61,62,64,65,74,75,76,77,78,79,81,84,94,96,97,98,113,118,119,120,121,122,123,137,],[-84,-84,-84,-84,-84,107,-75,-78,-79,-80,-84,-80,-84,-62,-63,-64,-84,-84,-68,-69,-84,-73,-74,-84,]),'CTE_STRING':([65,113,],[88,88,]),'L_BRACK':([67,],[90,]),'GREATER':([71,72,73,99,100,101,102,104,105,106,107,124,132,133,],[96,-84,-84,-65,-67,-70,-72,-77,-81,-82,-83,-76,-66,-71,]),'LESS':([71,72,73,99,100,101,102,104,105,106,107,124,132,133,],[97,-84,-84,-65,-67,-70,-72,-77,-81,-82,-83,-76,-66,-71,]),'NOT_EQ':([71,72,73,99,100,101,102,104,105,106,107,124,132,133,],[98,-84,-84,-65,-67,-70,-72,-77,-81,-82,-83,-76,-66,-71,]),'MULT':([73,101,102,104,105,106,107,124,133,],[-84,122,-72,-77,-81,-82,-83,-76,-71,]),'DIV':([73,101,102,104,105,106,107,124,133,],[-84,123,-72,-77,-81,-82,-83,-76,-71,]),'DO':([126,135,],[-35,142,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'push_initial_quadruple':([4,],[5,]),'vars_or_empty':([5,16,],[6,23,]),'vars':([5,16,],[7,7,]),'empty':([5,6,12,13,16,29,41,59,61,62,64,65,71,72,73,74,81,94,111,113,118,121,134,137,],[8,11,19,21,8,38,60,69,79,79,84,79,95,100,102,79,79,79,129,79,79,79,141,79,]),'funcs_or_empty':([6,],[10,]),'vars_declaration':([9,18,],[12,25,]),'assign_destination_of_initial_quadruple':([10,],[14,]),'funcs':([10,],[15,]),'func_header':([10,],[16,]),'vars_helper':([12,],[18,]),'more_ids':([13,],[20,]),'body':([22,23,125,142,145,],[28,30,134,146,149,]),'push_scope':([24,],[31,]),'type':([26,66,],[32,89,]),'handle_program_end':([28,],[36,]),'body_helper':([29,],[37,]),'func_footer':([30,],[39,]),'statement':([37,],[45,]),'assign':([37,],[46,]),'condition':([37,],[47,]),'cycle':([37,],[48,]),'f_call':([37,],[49,]),'print':([37,],[50,]),'handle_function_called_start':([37,],[54,]),'param_list':([41,],[58,]),'param':([41,91,],[59,115,]),'while_start':([53,],[63,]),'param_list_helper':([59,],[68,]),'expresion':([61,62,64,65,74,81,113,137,],[70,80,83,87,103,109,87,143,]),'exp':([61,62,64,65,74,81,94,113,137,],[71,71,71,71,71,71,117,71,71,]),'termino':([61,62,64,65,74,81,94,113,118,137,],[72,72,72,72,72,72,72,72,132,72,]),'factor':([61,62,64,65,74,81,94,113,118,121,137,],[73,73,73,73,73,73,73,73,73,133,73,]),'lp':([61,62,64,65,74,81,94,113,118,121,137,],[74,74,74,74,74,74,74,74,74,74,74,]),'factor_sign':([61,62,64,65,74,81,94,113,118,121,137,],[75,75,75,75,75,75,75,75,75,75,75,]),'args_list':([64,],[82,]),'print_options':([65,],[85,]),'print_option':([65,113,],[86,131,]),'relational_part':([71,],[93,]),'relational_operators':([71,],[94,]),'exp_helper':([72,],[99,]),'termino_helper':([73,],[101,]),'factor_value':([75,],[104,]),'handle_new_param':([83,143,],[111,147,]),'add_print_quadruple':([86,131,],[114,138,]),'resolve_expression':([93,],[116,]),'plus_or_minus':([99,],[118,]),'mult_or_div':([101,],[121,]),'generate_gotof':([108,126,],[125,135,]),'handle_function_call_finished':([110,],[127,]),'args_list_helper':([111,],[128,]),'else_part':([134,],[139,]),'else_handler':([134,],[140,]),'update_goto':([139,],[144,]),'while_end':([146,],[150,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('push_initial_quadruple -> <empty>','push_initial_quadruple',0,'p_push_initial_quadruple','parser.py',22),
+  ('assign_destination_of_initial_quadruple -> <empty>','assign_destination_of_initial_quadruple',0,'p_assign_destination_of_initial_quadruple','parser.py',28),
+  ('handle_program_end -> <empty>','handle_program_end',0,'p_handle_program_end','parser.py',34),
+  ('program -> PROGRAM ID SEMICOLON push_initial_quadruple vars_or_empty funcs_or_empty assign_destination_of_initial_quadruple MAIN body handle_program_end END','program',11,'p_program','parser.py',43),
+  ('vars_or_empty -> vars','vars_or_empty',1,'p_vars_or_empty','parser.py',52),
+  ('vars_or_empty -> empty','vars_or_empty',1,'p_vars_or_empty','parser.py',53),
+  ('vars -> VAR vars_declaration vars_helper','vars',3,'p_vars','parser.py',60),
+  ('vars_declaration -> ID more_ids COLON type SEMICOLON','vars_declaration',5,'p_vars_declaration','parser.py',66),
+  ('vars_helper -> vars_helper vars_declaration','vars_helper',2,'p_vars_helper','parser.py',80),
+  ('vars_helper -> empty','vars_helper',1,'p_vars_helper','parser.py',81),
+  ('more_ids -> more_ids COMMA ID','more_ids',3,'p_more_ids','parser.py',91),
+  ('more_ids -> empty','more_ids',1,'p_more_ids','parser.py',92),
+  ('type -> INT','type',1,'p_type','parser.py',100),
+  ('type -> FLOAT','type',1,'p_type','parser.py',101),
+  ('funcs_or_empty -> funcs_or_empty funcs','funcs_or_empty',2,'p_funcs_or_empty','parser.py',110),
+  ('funcs_or_empty -> empty','funcs_or_empty',1,'p_funcs_or_empty','parser.py',111),
+  ('push_scope -> <empty>','push_scope',0,'p_push_scope','parser.py',122),
+  ('func_header -> VOID ID push_scope L_PARENT param_list R_PARENT L_BRACK','func_header',7,'p_func_header','parser.py',133),
+  ('func_footer -> R_BRACK SEMICOLON','func_footer',2,'p_func_footer','parser.py',139),
+  ('funcs -> func_header vars_or_empty body func_footer','funcs',4,'p_funcs','parser.py',152),
+  ('param -> ID COLON type','param',3,'p_param','parser.py',163),
+  ('param_list -> param param_list_helper','param_list',2,'p_param_list','parser.py',174),
+  ('param_list -> empty','param_list',1,'p_param_list','parser.py',175),
+  ('param_list_helper -> param_list_helper COMMA param','param_list_helper',3,'p_param_list_helper','parser.py',185),
+  ('param_list_helper -> empty','param_list_helper',1,'p_param_list_helper','parser.py',186),
+  ('body -> L_BRACE body_helper R_BRACE','body',3,'p_body','parser.py',199),
+  ('body_helper -> body_helper statement','body_helper',2,'p_body_helper','parser.py',205),
+  ('body_helper -> empty','body_helper',1,'p_body_helper','parser.py',206),
+  ('statement -> assign','statement',1,'p_statement','parser.py',217),
+  ('statement -> condition','statement',1,'p_statement','parser.py',218),
+  ('statement -> cycle','statement',1,'p_statement','parser.py',219),
+  ('statement -> f_call','statement',1,'p_statement','parser.py',220),
+  ('statement -> print','statement',1,'p_statement','parser.py',221),
+  ('assign -> ID ASSIGN expresion SEMICOLON','assign',4,'p_assign','parser.py',228),
+  ('generate_gotof -> <empty>','generate_gotof',0,'p_generate_gotof','parser.py',242),
+  ('update_goto -> <empty>','update_goto',0,'p_update_goto','parser.py',248),
+  ('condition -> IF L_PARENT expresion R_PARENT generate_gotof body else_part update_goto SEMICOLON','condition',9,'p_condition','parser.py',254),
+  ('else_handler -> <empty>','else_handler',0,'p_else_handler','parser.py',259),
+  ('else_part -> else_handler ELSE body','else_part',3,'p_else_part','parser.py',267),
+  ('else_part -> empty','else_part',1,'p_else_part','parser.py',268),
+  ('while_start -> <empty>','while_start',0,'p_while_start','parser.py',279),
+  ('while_end -> <empty>','while_end',0,'p_while_end','parser.py',284),
+  ('cycle -> WHILE while_start L_PARENT expresion R_PARENT generate_gotof DO body while_end SEMICOLON','cycle',10,'p_cycle','parser.py',291),
+  ('handle_function_called_start -> ID','handle_function_called_start',1,'p_handle_function_called_start','parser.py',299),
+  ('handle_function_call_finished -> <empty>','handle_function_call_finished',0,'p_handle_function_call_finished','parser.py',309),
+  ('f_call -> handle_function_called_start L_PARENT args_list R_PARENT handle_function_call_finished SEMICOLON','f_call',6,'p_f_call','parser.py',318),
+  ('handle_new_param -> <empty>','handle_new_param',0,'p_handle_new_param','parser.py',325),
+  ('args_list -> expresion handle_new_param args_list_helper','args_list',3,'p_args_list','parser.py',333),
+  ('args_list -> empty','args_list',1,'p_args_list','parser.py',334),
+  ('args_list_helper -> args_list_helper COMMA expresion handle_new_param','args_list_helper',4,'p_args_list_helper','parser.py',344),
+  ('args_list_helper -> empty','args_list_helper',1,'p_args_list_helper','parser.py',345),
+  ('print -> PRINT L_PARENT print_options R_PARENT SEMICOLON','print',5,'p_print','parser.py',358),
+  ('add_print_quadruple -> <empty>','add_print_quadruple',0,'p_add_print_quadruple','parser.py',364),
+  ('print_options -> print_options COMMA print_option add_print_quadruple','print_options',4,'p_print_options','parser.py',370),
+  ('print_options -> print_option add_print_quadruple','print_options',2,'p_print_options','parser.py',371),
+  ('print_option -> expresion','print_option',1,'p_print_option','parser.py',383),
+  ('print_option -> CTE_STRING','print_option',1,'p_print_option','parser.py',384),
+  ('resolve_expression -> <empty>','resolve_expression',0,'p_resolve_expression','parser.py',400),
+  ('expresion -> exp relational_part resolve_expression','expresion',3,'p_expresion','parser.py',406),
+  ('relational_part -> relational_operators exp','relational_part',2,'p_relational_part','parser.py',411),
+  ('relational_part -> empty','relational_part',1,'p_relational_part','parser.py',412),
+  ('relational_operators -> GREATER','relational_operators',1,'p_relational_operators','parser.py',421),
+  ('relational_operators -> LESS','relational_operators',1,'p_relational_operators','parser.py',422),
+  ('relational_operators -> NOT_EQ','relational_operators',1,'p_relational_operators','parser.py',423),
+  ('exp -> termino exp_helper','exp',2,'p_exp','parser.py',433),
+  ('exp_helper -> exp_helper plus_or_minus termino','exp_helper',3,'p_exp_helper','parser.py',439),
+  ('exp_helper -> empty','exp_helper',1,'p_exp_helper','parser.py',440),
+  ('plus_or_minus -> PLUS','plus_or_minus',1,'p_plus_or_minus','parser.py',451),
+  ('plus_or_minus -> MINUS','plus_or_minus',1,'p_plus_or_minus','parser.py',452),
+  ('termino -> factor termino_helper','termino',2,'p_termino','parser.py',460),
+  ('termino_helper -> termino_helper mult_or_div factor','termino_helper',3,'p_termino_helper','parser.py',466),
+  ('termino_helper -> empty','termino_helper',1,'p_termino_helper','parser.py',467),
+  ('mult_or_div -> MULT','mult_or_div',1,'p_mult_or_div','parser.py',478),
+  ('mult_or_div -> DIV','mult_or_div',1,'p_mult_or_div','parser.py',479),
+  ('lp -> L_PARENT','lp',1,'p_lp','parser.py',489),
+  ('factor -> lp expresion R_PARENT','factor',3,'p_factor','parser.py',494),
+  ('factor -> factor_sign factor_value','factor',2,'p_factor','parser.py',495),
+  ('factor_sign -> PLUS','factor_sign',1,'p_factor_sign','parser.py',526),
+  ('factor_sign -> MINUS','factor_sign',1,'p_factor_sign','parser.py',527),
+  ('factor_sign -> empty','factor_sign',1,'p_factor_sign','parser.py',528),
+  ('factor_value -> ID','factor_value',1,'p_factor_value','parser.py',536),
+  ('factor_value -> CTE_INT','factor_value',1,'p_factor_value','parser.py',537),
+  ('factor_value -> CTE_FLOAT','factor_value',1,'p_factor_value','parser.py',538),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',547),
+]
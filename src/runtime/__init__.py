@@ -0,0 +1,6 @@
+from .runtime import main, run_image
+
+__all__ = [
+    "main",
+    "run_image",
+]
@@ -0,0 +1,3 @@
+from src.runtime import main
+
+raise SystemExit(main())
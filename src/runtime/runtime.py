@@ -0,0 +1,39 @@
+"""
+Runtime-only entry point: runs compiled programs without loading the compiler.
+
+    python -m src.runtime program.bdo [program.bdo ...]
+
+Only the virtual machine modules are imported, never the lexer, the parser, the
+semantic analysis or the code generator, so a fresh process per job starts quickly
+(see benchmarks/bench_cold_start.py for the budget). Sources are compiled beforehand
+with `python -m src.cli compile`.
+"""
+import sys
+from src.errors.error import Error
+from src.virtual_machine.artifact import load_artifact
+from src.virtual_machine.program_image import ProgramImage
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+PROG = "baby-duck-run"
+USAGE = f"usage: {PROG} program.bdo [program.bdo ...]"
+
+
+def run_image(image: ProgramImage) -> int:
+    """Runs a program image. Returns the number of instructions executed."""
+    return VirtualMachine.from_image(image).run()
+
+
+def main(argv: list[str] | None = None) -> int:
+    # no argparse: it is slower to import than the whole virtual machine
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0].startswith("-"):
+        print(USAGE, file=sys.stderr)
+        return 0 if argv and argv[0] in ("-h", "--help") else 2
+
+    try:
+        for path in argv:
+            run_image(load_artifact(path))
+    except (Error, OSError, ZeroDivisionError) as error:
+        print(f"{PROG}: error: {error}", file=sys.stderr)
+        return 1
+    return 0
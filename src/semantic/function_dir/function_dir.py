@@ -10,7 +10,7 @@ from src.virtual_machine.frame_resources import FrameResources
 SignatureType = list[VarType]
 
 # create types
-@dataclass
+@dataclass(slots=True)
 class Function:
     type: FunctionTypeEnum
     var_table: VarTable
@@ -4,7 +4,7 @@ from src.types import AddressType
 
 
 # create types
-@dataclass
+@dataclass(slots=True)
 class Var:
     var_type: str             # e.g. "int", "float"
     address: AddressType      # address of the variable in memory
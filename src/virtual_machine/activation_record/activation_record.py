@@ -7,17 +7,22 @@ class ActivationRecord:
     """
     Represents an activation record in a virtual machine.
     An activation record contains information about the function call.
+
+    The locals and temporaries share one list, laid out as local ints, local floats,
+    temp ints and temp floats, so a call allocates a single list. Each index is
+    checked against the size of its segment, so it never reaches the next one.
     """
+    __slots__ = ("values", "local_float_base", "temp_int_base", "temp_float_base")
 
     def __init__(self, frameResources: FrameResources | None = None) -> None:
         """
         Initializes the activation record with the given frame resources.
         """
         
-        self.local_int = [None] * frameResources.vars_int
-        self.local_float = [None] * frameResources.vars_float
-        self.temp_int = [None] * frameResources.temps_int
-        self.temp_float = [None] * frameResources.temps_float
+        self.local_float_base = frameResources.vars_int
+        self.temp_int_base = self.local_float_base + frameResources.vars_float
+        self.temp_float_base = self.temp_int_base + frameResources.temps_int
+        self.values = [None] * (self.temp_float_base + frameResources.temps_float)
 
     def get_value(self, segment: LocalOrTempType, var_type: VarType, idx: int) -> NumericValueType | None:
         """
@@ -28,15 +33,23 @@ class ActivationRecord:
             case "local":
                 match var_type:
                     case "int":
-                        return self.local_int[idx]
+                        if not 0 <= idx < self.local_float_base:
+                            raise IndexError(f"local int index {idx} out of range")
+                        return self.values[idx]
                     case "float":
-                        return self.local_float[idx]
+                        if not 0 <= idx < self.temp_int_base - self.local_float_base:
+                            raise IndexError(f"local float index {idx} out of range")
+                        return self.values[self.local_float_base + idx]
             case "temp":
                 match var_type:
                     case "int":
-                        return self.temp_int[idx]
+                        if not 0 <= idx < self.temp_float_base - self.temp_int_base:
+                            raise IndexError(f"temp int index {idx} out of range")
+                        return self.values[self.temp_int_base + idx]
                     case "float":
-                        return self.temp_float[idx]
+                        if not 0 <= idx < len(self.values) - self.temp_float_base:
+                            raise IndexError(f"temp float index {idx} out of range")
+                        return self.values[self.temp_float_base + idx]
     
     
     def set_value(self, segment: LocalOrTempType, var_type: VarType, idx: int, value: NumericValueType) -> None:
@@ -48,15 +61,40 @@ class ActivationRecord:
             case "local":
                 match var_type:
                     case "int":
-                        self.local_int[idx] = value
+                        if not 0 <= idx < self.local_float_base:
+                            raise IndexError(f"local int index {idx} out of range")
+                        self.values[idx] = value
                     case "float":
-                        self.local_float[idx] = value
+                        if not 0 <= idx < self.temp_int_base - self.local_float_base:
+                            raise IndexError(f"local float index {idx} out of range")
+                        self.values[self.local_float_base + idx] = value
             case "temp":
                 match var_type:
                     case "int":
-                        self.temp_int[idx] = value
+                        if not 0 <= idx < self.temp_float_base - self.temp_int_base:
+                            raise IndexError(f"temp int index {idx} out of range")
+                        self.values[self.temp_int_base + idx] = value
                     case "float":
-                        self.temp_float[idx] = value
+                        if not 0 <= idx < len(self.values) - self.temp_float_base:
+                            raise IndexError(f"temp float index {idx} out of range")
+                        self.values[self.temp_float_base + idx] = value
+
+    # read-only snapshots of each segment (use set_value to change them)
+    @property
+    def local_int(self) -> tuple:
+        return tuple(self.values[:self.local_float_base])
+
+    @property
+    def local_float(self) -> tuple:
+        return tuple(self.values[self.local_float_base:self.temp_int_base])
+
+    @property
+    def temp_int(self) -> tuple:
+        return tuple(self.values[self.temp_int_base:self.temp_float_base])
+
+    @property
+    def temp_float(self) -> tuple:
+        return tuple(self.values[self.temp_float_base:])
     
     
     def dump(self) -> str:
@@ -0,0 +1,21 @@
+from .artifact import (
+    encode_image,
+    decode_image,
+    write_artifact,
+    load_artifact,
+    run_artifact,
+    is_artifact,
+    QuadrupleRecords,
+    FORMAT_VERSION,
+)
+
+__all__ = [
+    "encode_image",
+    "decode_image",
+    "write_artifact",
+    "load_artifact",
+    "run_artifact",
+    "is_artifact",
+    "QuadrupleRecords",
+    "FORMAT_VERSION",
+]
@@ -0,0 +1,362 @@
+"""
+Binary format of compiled Baby Duck programs.
+
+All integers are little-endian. A file starts with a header followed by a table
+of sections, each section is aligned to 8 bytes:
+
+    header    magic (8s) | version (u16) | section count (u16)
+    entry     kind (u32) | offset (u64) | size (u64)          one per section
+
+    QUADS     fixed-width records: opcode | left | right | result   (4 x i32)
+              missing operands are stored as -1, the result of ERA/GOSUB is
+              the index of the function in the FUNCS section
+    CONSTS    addr (i32) | type (u8) | value: i64, f64 or u32 length + utf-8 bytes
+    GLOBALS   addresses of the global variables (i32 each)
+    FUNCS     name length (u16) | name | initial quad (i32) |
+              vars_int | vars_float | temps_int | temps_float (u32 each) |
+              signature length (u16) | one type code (u8) per parameter
+    LINES     optional, source line of each quadruple (i32 each)
+
+Loading only needs the virtual machine modules, not the lexer or the parser. The
+QUADS section can also be decoded lazily, record by record, straight from a shared
+buffer (see `QuadrupleRecords`).
+"""
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from src.errors.artifact_errors import InvalidArtifactError
+from src.intermediate_generation.quadruple import Quadruple, OPCODES, OPCODE_OF, FUNCTION_OPERATORS
+from src.virtual_machine.frame_resources import FrameResources
+from src.virtual_machine.function_runtime_info_map import FunctionRuntimeInfo
+from src.virtual_machine.program_image import ProgramImage
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+MAGIC = b"BDUCKOBJ"
+FORMAT_VERSION = 2
+
+SECTION_QUADS = 1
+SECTION_CONSTS = 2
+SECTION_GLOBALS = 3
+SECTION_FUNCS = 4
+SECTION_LINES = 5
+
+HEADER = struct.Struct("<8sHH")
+SECTION_ENTRY = struct.Struct("<IQQ")
+QUAD_RECORD = struct.Struct("<iiii")
+CONST_HEADER = struct.Struct("<iB")
+FUNC_RECORD = struct.Struct("<iIIIIH")
+INT32 = struct.Struct("<i")
+INT64 = struct.Struct("<q")
+FLOAT64 = struct.Struct("<d")
+UINT32 = struct.Struct("<I")
+UINT16 = struct.Struct("<H")
+
+VALUE_TYPES = ("int", "float", "string")
+TYPE_CODE = {var_type: code for code, var_type in enumerate(VALUE_TYPES)}
+
+NONE = -1
+ALIGNMENT = 8
+
+
+# ---------------------------------------------------------------------------
+#  Encoding
+
+def _int_or_none(value: int | None) -> int:
+    return NONE if value is None else value
+
+
+def _encode_quads(image: ProgramImage, function_ids: dict[str, int]) -> bytes:
+    out = bytearray()
+    for operator, left, right, result in image.quadruples:
+        if operator in FUNCTION_OPERATORS:
+            result = function_ids[result]
+        out += QUAD_RECORD.pack(OPCODE_OF[operator], _int_or_none(left),
+                                _int_or_none(right), _int_or_none(result))
+    return bytes(out)
+
+
+def _encode_consts(image: ProgramImage) -> bytes:
+    out = bytearray()
+    for addr, value in image.constants.items():
+        # bool is not a Baby Duck type, but it is an int subclass
+        if isinstance(value, int) and not isinstance(value, bool):
+            out += CONST_HEADER.pack(addr, TYPE_CODE["int"]) + INT64.pack(value)
+        elif isinstance(value, float):
+            out += CONST_HEADER.pack(addr, TYPE_CODE["float"]) + FLOAT64.pack(value)
+        elif isinstance(value, str):
+            encoded = value.encode("utf-8")
+            out += CONST_HEADER.pack(addr, TYPE_CODE["string"]) + UINT32.pack(len(encoded)) + encoded
+        else:
+            raise TypeError(f"Unsupported constant value: {value!r}")
+    return bytes(out)
+
+
+def _encode_globals(image: ProgramImage) -> bytes:
+    return b"".join(INT32.pack(addr) for addr in image.global_addresses)
+
+
+def _encode_funcs(image: ProgramImage) -> bytes:
+    out = bytearray()
+    for name, info in image.functions.items():
+        encoded = name.encode("utf-8")
+        frame = info.frame_resources
+        out += UINT16.pack(len(encoded)) + encoded
+        out += FUNC_RECORD.pack(_int_or_none(info.initial_quad_index),
+                                frame.vars_int, frame.vars_float,
+                                frame.temps_int, frame.temps_float,
+                                len(info.signature))
+        out += bytes(TYPE_CODE[param_type] for param_type in info.signature)
+    return bytes(out)
+
+
+def _encode_lines(image: ProgramImage) -> bytes:
+    return b"".join(INT32.pack(line) for line in image.line_table)
+
+
+def encode_image(image: ProgramImage) -> bytes:
+    """
+    Serializes a program image into the binary format.
+    """
+    function_ids = {name: idx for idx, name in enumerate(image.functions)}
+    sections = [
+        (SECTION_QUADS, _encode_quads(image, function_ids)),
+        (SECTION_CONSTS, _encode_consts(image)),
+        (SECTION_GLOBALS, _encode_globals(image)),
+        (SECTION_FUNCS, _encode_funcs(image)),
+    ]
+    if image.line_table is not None:
+        sections.append((SECTION_LINES, _encode_lines(image)))
+
+    # lay the sections out after the header and the section table
+    offset = HEADER.size + SECTION_ENTRY.size * len(sections)
+    table = bytearray()
+    body = bytearray()
+    for kind, payload in sections:
+        padding = -offset % ALIGNMENT
+        body += b"\0" * padding
+        offset += padding
+        table += SECTION_ENTRY.pack(kind, offset, len(payload))
+        body += payload
+        offset += len(payload)
+
+    return HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)) + bytes(table) + bytes(body)
+
+
+# ---------------------------------------------------------------------------
+#  Decoding
+
+def _decode_funcs(data: memoryview) -> dict[str, FunctionRuntimeInfo]:
+    functions = {}
+    pos = 0
+    while pos < len(data):
+        (name_len,) = UINT16.unpack_from(data, pos)
+        pos += UINT16.size
+        name = bytes(data[pos:pos + name_len]).decode("utf-8")
+        pos += name_len
+
+        initial, vars_int, vars_float, temps_int, temps_float, sig_len = FUNC_RECORD.unpack_from(data, pos)
+        pos += FUNC_RECORD.size
+        signature = [VALUE_TYPES[code] for code in data[pos:pos + sig_len]]
+        pos += sig_len
+
+        functions[name] = FunctionRuntimeInfo(
+            frame_resources=FrameResources(vars_int, vars_float, temps_int, temps_float),
+            signature=signature,
+            initial_quad_index=None if initial == NONE else initial,
+        )
+    return functions
+
+
+def _decode_consts(data: memoryview) -> dict:
+    constants = {}
+    pos = 0
+    while pos < len(data):
+        addr, type_code = CONST_HEADER.unpack_from(data, pos)
+        pos += CONST_HEADER.size
+        match VALUE_TYPES[type_code]:
+            case "int":
+                (value,) = INT64.unpack_from(data, pos)
+                pos += INT64.size
+            case "float":
+                (value,) = FLOAT64.unpack_from(data, pos)
+                pos += FLOAT64.size
+            case "string":
+                (length,) = UINT32.unpack_from(data, pos)
+                pos += UINT32.size
+                value = bytes(data[pos:pos + length]).decode("utf-8")
+                pos += length
+        constants[addr] = value
+    return constants
+
+
+def _decode_quad(record: tuple[int, int, int, int], function_names: list[str]) -> Quadruple:
+    opcode, left, right, result = record
+    operator = OPCODES[opcode]
+    if operator in FUNCTION_OPERATORS:
+        if not 0 <= result < len(function_names):
+            raise IndexError(f"function index {result} out of range")
+        result = function_names[result]
+    elif result == NONE:
+        result = None
+    return Quadruple(operator,
+                     None if left == NONE else left,
+                     None if right == NONE else right,
+                     result)
+
+
+def _decode_quads(data: memoryview, function_names: list[str]) -> list[Quadruple]:
+    # a plain loop: a failing comprehension would keep the iterator (and the view) alive
+    quadruples = []
+    for record in QUAD_RECORD.iter_unpack(data):
+        quadruples.append(_decode_quad(record, function_names))
+    return quadruples
+
+
+class QuadrupleRecords(Sequence):
+    """
+    The QUADS section of a buffer seen as a sequence of quadruples. Each record is
+    decoded on first access and kept, so only the code that runs becomes objects.
+    The buffer must stay open until `release` is called.
+    """
+
+    def __init__(self, data: memoryview, function_names: list[str], source: str):
+        if len(data) % QUAD_RECORD.size:
+            raise InvalidArtifactError(source, "corrupt section data (truncated quadruple)")
+        self._data = data
+        self._function_names = function_names
+        self._source = source
+        self._decoded: list[Quadruple | None] = [None] * (len(data) // QUAD_RECORD.size)
+
+    def __len__(self) -> int:
+        return len(self._decoded)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+        quadruple = self._decoded[index]
+        if quadruple is None:
+            index %= len(self._decoded)
+            try:
+                record = QUAD_RECORD.unpack_from(self._data, index * QUAD_RECORD.size)
+                quadruple = _decode_quad(record, self._function_names)
+            except IndexError as e:
+                raise InvalidArtifactError(self._source, f"corrupt section data ({e})") from e
+            self._decoded[index] = quadruple
+        return quadruple
+
+    def decoded_count(self) -> int:
+        """Returns how many records have been decoded so far."""
+        return sum(quadruple is not None for quadruple in self._decoded)
+
+    def release(self) -> None:
+        """Releases the view of the buffer (decoded records stay usable)."""
+        self._data.release()
+
+
+def _read_sections(view: memoryview, source: str, sections: dict[int, memoryview]) -> None:
+    """Validates the header and fills `sections` with a view of each section."""
+    if len(view) < HEADER.size:
+        raise InvalidArtifactError(source, "file is too short")
+
+    magic, version, section_count = HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise InvalidArtifactError(source, "not a Baby Duck program")
+    if version != FORMAT_VERSION:
+        raise InvalidArtifactError(source, f"unsupported format version {version} (expected {FORMAT_VERSION})")
+
+    for idx in range(section_count):
+        kind, offset, size = SECTION_ENTRY.unpack_from(view, HEADER.size + idx * SECTION_ENTRY.size)
+        if offset + size > len(view):
+            raise InvalidArtifactError(source, f"section {kind} is truncated")
+        sections[kind] = view[offset:offset + size]
+
+    for kind in (SECTION_QUADS, SECTION_CONSTS, SECTION_GLOBALS, SECTION_FUNCS):
+        if kind not in sections:
+            raise InvalidArtifactError(source, f"missing section {kind}")
+
+
+def decode_image(buffer, source: str = "<buffer>", lazy: bool = False) -> ProgramImage:
+    """
+    Builds a program image from a buffer in the binary format (bytes, mmap, ...).
+    With `lazy`, the quadruples are `QuadrupleRecords` decoded on demand from the
+    buffer, which must then outlive them.
+    """
+    view = memoryview(buffer)
+    sections = {}
+    quadruples = None
+    try:
+        _read_sections(view, source, sections)
+        functions = _decode_funcs(sections[SECTION_FUNCS])
+        if lazy:
+            quadruples = QuadrupleRecords(sections.pop(SECTION_QUADS), list(functions), source)
+        else:
+            quadruples = _decode_quads(sections[SECTION_QUADS], list(functions))
+        image = ProgramImage(
+            quadruples=quadruples,
+            constants=_decode_consts(sections[SECTION_CONSTS]),
+            global_addresses=[addr for (addr,) in INT32.iter_unpack(sections[SECTION_GLOBALS])],
+            functions=functions,
+        )
+        if SECTION_LINES in sections:
+            image.line_table = [line for (line,) in INT32.iter_unpack(sections[SECTION_LINES])]
+            if len(image.line_table) != len(image.quadruples):
+                raise InvalidArtifactError(source, "the line table does not match the quadruples")
+    except BaseException as e:
+        if isinstance(quadruples, QuadrupleRecords):
+            quadruples.release()
+        if isinstance(e, (struct.error, IndexError, UnicodeDecodeError)):
+            raise InvalidArtifactError(source, f"corrupt section data ({e})") from e
+        raise
+    finally:
+        # release every view so that a memory map can be closed right after
+        for section in sections.values():
+            section.release()
+        view.release()
+    return image
+
+
+# ---------------------------------------------------------------------------
+#  Files
+
+def write_artifact(image: ProgramImage, path: str) -> None:
+    """
+    Writes a program image to a file (atomically replacing an existing one).
+    """
+    import tempfile  # only writers need it, and it is slow to import
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(encode_image(image))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def load_artifact(path: str) -> ProgramImage:
+    """
+    Loads a program image from a file through a read-only memory map.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise InvalidArtifactError(path, "file is empty")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return decode_image(buffer, path)
+
+
+def is_artifact(path: str) -> bool:
+    """Returns True if the file starts with the magic number of the binary format."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def run_artifact(path: str) -> VirtualMachine:
+    """
+    Loads a compiled program and runs it. Returns the virtual machine after the run.
+    """
+    vm = VirtualMachine.from_image(load_artifact(path))
+    vm.run()
+    return vm
@@ -1,13 +1,21 @@
-from dataclasses import dataclass
 from src.virtual_machine.activation_record import ActivationRecord
 from src.errors.internal_compiler_error import CompilerBug
 
 
-@dataclass
 class CallStackEntry:
-    function_name: str
-    activation_record: ActivationRecord
-    return_index: int | None # position in the quadruple list where the function was called
+    """
+    A function call on the stack.
+    """
+    __slots__ = ("function_name", "activation_record", "return_index")
+
+    def __init__(self, function_name: str, activation_record: ActivationRecord, return_index: int | None):
+        self.function_name = function_name
+        self.activation_record = activation_record
+        self.return_index = return_index    # position in the quadruple list where the function was called
+
+    def __repr__(self) -> str:
+        return (f"CallStackEntry(function_name={self.function_name!r}, "
+                f"return_index={self.return_index!r})")
 
 class CallStack:
     """
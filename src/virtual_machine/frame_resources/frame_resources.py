@@ -6,7 +6,8 @@ class FrameResources:
     Stores the space required for a function in its activation record.
     Local variables and temporary values are stored, segmented by type.
     """
-    
+    __slots__ = ("vars_int", "vars_float", "temps_int", "temps_float")
+
     def __init__(
         self,
         vars_int: int = 0,
@@ -41,6 +42,14 @@ class FrameResources:
                 str(frame.temps_int),
                 str(frame.temps_float))
     
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrameResources):
+            return NotImplemented
+        return (self.vars_int, self.vars_float, self.temps_int, self.temps_float) == (
+            other.vars_int, other.vars_float, other.temps_int, other.temps_float)
+
+    __hash__ = None
+
     def __repr__(self) -> str:
         return (
             f"FrameResources("
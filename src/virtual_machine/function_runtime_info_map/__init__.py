@@ -1,5 +1,6 @@
-from .function_runtime_info_map import FunctionRuntimeInfoMap
+from .function_runtime_info_map import FunctionRuntimeInfoMap, FunctionRuntimeInfo
 
 __all__ = [
     "FunctionRuntimeInfoMap",
-]
\ No newline at end of file
+    "FunctionRuntimeInfo",
+]
@@ -1,30 +1,68 @@
-from dataclasses import dataclass
+from __future__ import annotations
+from typing import TYPE_CHECKING
 from src.virtual_machine.frame_resources import FrameResources
-from src.semantic.function_dir import FunctionDir, SignatureType
 from src.errors.internal_compiler_error.compiler_bug import CompilerBug
 
+if TYPE_CHECKING:
+    from src.semantic.function_dir import FunctionDir, SignatureType
+
 
-@dataclass
 class FunctionRuntimeInfo:
-    frame_resources: FrameResources
-    signature: SignatureType
-    initial_quad_index: int
+    """
+    What the virtual machine needs to call a function.
+    """
+    __slots__ = ("frame_resources", "signature", "initial_quad_index")
+
+    def __init__(self, frame_resources: FrameResources, signature: SignatureType,
+                 initial_quad_index: int | None):
+        self.frame_resources = frame_resources
+        self.signature = signature
+        self.initial_quad_index = initial_quad_index
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FunctionRuntimeInfo):
+            return NotImplemented
+        return (self.frame_resources, self.signature, self.initial_quad_index) == (
+            other.frame_resources, other.signature, other.initial_quad_index)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"FunctionRuntimeInfo(frame_resources={self.frame_resources!r}, "
+                f"signature={self.signature!r}, initial_quad_index={self.initial_quad_index!r})")
+
 
 class FunctionRuntimeInfoMap:
     """
     Maps function names to their runtime information.
     """
     
-    def __init__(self, function_dir: FunctionDir):
-        self._map: dict[str, FunctionRuntimeInfo] = {}
+    def __init__(self, runtime_infos: dict[str, FunctionRuntimeInfo]):
+        self._map: dict[str, FunctionRuntimeInfo] = dict(runtime_infos)
+
+
+    @classmethod
+    def from_function_dir(cls, function_dir: FunctionDir) -> FunctionRuntimeInfoMap:
+        """
+        Builds the map from the function directory produced by the compiler.
+        """
+        runtime_infos = {}
         for name, func in function_dir.get_function_dir().items():
             if func.frame_resources is None:
                 raise CompilerBug(f"Function '{name}' does not have frame resources defined.")
-            self._map[name] = FunctionRuntimeInfo(
+            runtime_infos[name] = FunctionRuntimeInfo(
                 frame_resources=func.frame_resources,
                 signature=func.signature,
                 initial_quad_index=func.initial_quad_index
             )
+        return cls(runtime_infos)
+
+
+    def get_function_runtime_infos(self) -> dict[str, FunctionRuntimeInfo]:
+        """
+        Returns the runtime information of every function.
+        """
+        return self._map
 
 
     def get_function_runtime_info(self, name: str) -> FunctionRuntimeInfo:
@@ -55,4 +93,4 @@ class FunctionRuntimeInfoMap:
         """
         Returns the initial quadruple index for a function by its name.
         """
-        return self.get_function_runtime_info(name).initial_quad_index
\ No newline at end of file
+        return self.get_function_runtime_info(name).initial_quad_index
@@ -1,11 +1,10 @@
-from src.intermediate_generation.constants_table import ConstantsTable
-from src.semantic.function_dir import FunctionDir
 from src.semantic.constants import GLOBAL_FUNC_NAME
 from src.virtual_machine.activation_record import ActivationRecord
 from src.types import ValueType
 from src.intermediate_generation.memory_manager import MemoryManager
 from src.virtual_machine.call_stack import CallStack, CallStackEntry
 from src.virtual_machine.function_runtime_info_map import FunctionRuntimeInfoMap
+from src.virtual_machine.program_image import ProgramImage
 
 
 class Memory:
@@ -14,14 +13,14 @@ class Memory:
     and the call stack.
     """
 
-    def __init__(self, constants_table: ConstantsTable, function_dir: FunctionDir):
-        self.constants = self._load_constants(constants_table)
-        self.globals = self._load_globals(function_dir)
+    def __init__(self, image: ProgramImage):
+        self.constants = self._load_constants(image)
+        self.globals = self._load_globals(image)
         self.call_stack = CallStack()
         self.pending_call_entry: CallStackEntry | None = None  # used for function calls that are not yet executed (before GOSUB quadruple)
 
         # create a mapping of function names to their frame resources
-        self.runtime_info_map = FunctionRuntimeInfoMap(function_dir)
+        self.runtime_info_map = FunctionRuntimeInfoMap(image.functions)
 
         # initialize the stack with the global activation record
         self.call_stack.push(CallStackEntry(
@@ -31,27 +30,22 @@ class Memory:
         ))
 
 
-    def _load_constants(self, constants_table: ConstantsTable) -> dict:
+    def _load_constants(self, image: ProgramImage) -> dict:
         """
-        Loads constants from the constants table into a dictionary.
+        Loads constants from the program image into a dictionary.
         """
         
-        return {
-        addr: value          # addr -> value
-        for (value, _), addr in constants_table.value_addr_map.items()
-        }
+        return dict(image.constants)  # addr -> value
 
 
-    def _load_globals(self, function_dir: FunctionDir) -> dict:
+    def _load_globals(self, image: ProgramImage) -> dict:
         """
-        Loads global variables from the function directory into a dictionary.
+        Loads global variables from the program image into a dictionary.
         """
-        
-        global_var_table = function_dir.get_var_table(GLOBAL_FUNC_NAME)
 
         return {
-            var.address: None
-            for var in global_var_table.get_vars()
+            address: None
+            for address in image.global_addresses
         }
     
 
@@ -0,0 +1,7 @@
+from .profiler import Profile, profile_image, function_of_quadruples
+
+__all__ = [
+    "Profile",
+    "profile_image",
+    "function_of_quadruples",
+]
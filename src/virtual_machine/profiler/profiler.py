@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from src.semantic.constants import GLOBAL_FUNC_NAME
+from src.virtual_machine.program_image import ProgramImage
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+MAIN_NAME = "main"
+
+
+def function_of_quadruples(image: ProgramImage) -> list[str]:
+    """
+    Returns the name of the function each quadruple belongs to. The code of a function
+    runs from its initial quadruple to the start of the next one; `main` starts at the
+    destination of the initial GOTO and the GOTO itself belongs to the global scope.
+    """
+    starts = [
+        (info.initial_quad_index, name)
+        for name, info in image.functions.items()
+        if info.initial_quad_index is not None
+    ]
+    if image.quadruples:
+        starts.append((image.quadruples[0].result, MAIN_NAME))
+    starts.sort()
+
+    owners = [GLOBAL_FUNC_NAME] * len(image.quadruples)
+    for (start, name), (end, _) in zip(starts, starts[1:] + [(len(owners), None)]):
+        owners[start:end] = [name] * (end - start)
+    return owners
+
+
+@dataclass
+class Profile:
+    """Execution counts of a program run."""
+    image: ProgramImage
+    quadruple_counts: list[int]     # quadruple index -> times executed
+
+    @property
+    def instructions(self) -> int:
+        return sum(self.quadruple_counts)
+
+
+    def hot_quadruples(self, top: int = 10) -> list[tuple[int, int]]:
+        """Returns the `top` most executed quadruples as (index, count), hottest first."""
+        ranked = sorted(enumerate(self.quadruple_counts), key=lambda item: (-item[1], item[0]))
+        return [(index, count) for index, count in ranked[:top] if count]
+
+
+    def function_instructions(self) -> dict[str, int]:
+        """Returns the instructions executed inside each function, hottest first."""
+        totals: dict[str, int] = {}
+        for owner, count in zip(function_of_quadruples(self.image), self.quadruple_counts):
+            totals[owner] = totals.get(owner, 0) + count
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+
+    def function_calls(self) -> dict[str, int]:
+        """Returns how many times each function was called."""
+        calls: dict[str, int] = {}
+        for quadruple, count in zip(self.image.quadruples, self.quadruple_counts):
+            if quadruple.operator == "GOSUB" and count:
+                calls[quadruple.result] = calls.get(quadruple.result, 0) + count
+        return calls
+
+
+    def report(self, top: int = 10) -> str:
+        """A printable summary: the hottest quadruples and the time spent in each function."""
+        total = self.instructions or 1
+        owners = function_of_quadruples(self.image)
+        calls = self.function_calls()
+
+        lines = [f"{self.instructions} instructions executed", "", "hot quadruples:"]
+        line_table = self.image.line_table
+        lines.append(f"{'index':>7} {'count':>12} {'share':>7} {'line':>6}  {'function':<16} quadruple")
+        for index, count in self.hot_quadruples(top):
+            line = line_table[index] if line_table else ""
+            lines.append(f"{index:>7} {count:>12} {count / total:>7.1%} {line:>6}  {owners[index]:<16} "
+                         f"{self.image.quadruples[index]!r}")
+
+        lines += ["", "functions:", f"{'function':<16} {'instructions':>12} {'share':>7} {'calls':>10}"]
+        for name, count in self.function_instructions().items():
+            lines.append(f"{name:<16} {count:>12} {count / total:>7.1%} {calls.get(name, ''):>10}")
+        return "\n".join(lines)
+
+
+def profile_image(image: ProgramImage) -> Profile:
+    """Runs a program and counts how many times each quadruple is executed."""
+    vm = VirtualMachine.from_image(image)
+    return Profile(image, vm.run_profiled())
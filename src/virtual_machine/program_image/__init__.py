@@ -0,0 +1,3 @@
+from .program_image import ProgramImage
+
+__all__ = ["ProgramImage"]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable
+from src.types import AddressType, ValueType
+from src.semantic.constants import GLOBAL_FUNC_NAME
+from src.intermediate_generation.quadruple import Quadruple
+from src.virtual_machine.function_runtime_info_map import FunctionRuntimeInfoMap, FunctionRuntimeInfo
+
+if TYPE_CHECKING:
+    from src.intermediate_generation.constants_table import ConstantsTable
+    from src.semantic.function_dir import FunctionDir
+
+
+class ProgramImage:
+    """
+    The runtime view of a compiled program: everything the virtual machine needs to
+    execute it, without the compile-time structures (var tables, stacks, ...).
+    A plain class rather than a dataclass: the runtime does not import dataclasses.
+    """
+
+    def __init__(self, quadruples: list[Quadruple], constants: dict[AddressType, ValueType],
+                 global_addresses: list[AddressType], functions: dict[str, FunctionRuntimeInfo],
+                 line_table: list[int] | None = None):
+        self.quadruples = quadruples
+        self.constants = constants                  # addr -> value
+        self.global_addresses = global_addresses
+        self.functions = functions                  # function_name -> runtime info
+        self.line_table = line_table                # quadruple index -> source line (optional)
+
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ProgramImage):
+            return NotImplemented
+        return (self.quadruples, self.constants, self.global_addresses, self.functions, self.line_table) == (
+            other.quadruples, other.constants, other.global_addresses, other.functions, other.line_table)
+
+    __hash__ = None
+
+
+    def __repr__(self) -> str:
+        return (f"ProgramImage({len(self.quadruples)} quadruples, {len(self.constants)} constants, "
+                f"{len(self.global_addresses)} globals, functions={list(self.functions)})")
+
+
+    @classmethod
+    def from_compilation(cls, quadruples: Iterable[Quadruple], constants_table: ConstantsTable,
+                         function_dir: FunctionDir) -> ProgramImage:
+        """
+        Builds an image from the output of the intermediate generator. The quadruples
+        are copied out of the compact list into the objects the virtual machine runs.
+        """
+        constants = {
+            addr: value
+            for (value, _), addr in constants_table.value_addr_map.items()
+        }
+        global_addresses = [
+            var.address
+            for var in function_dir.get_var_table(GLOBAL_FUNC_NAME).get_vars()
+        ]
+        runtime_info_map = FunctionRuntimeInfoMap.from_function_dir(function_dir)
+
+        return cls(
+            quadruples=[Quadruple(*quadruple) for quadruple in quadruples],
+            constants=constants,
+            global_addresses=global_addresses,
+            functions=runtime_info_map.get_function_runtime_infos(),
+        )
@@ -0,0 +1,7 @@
+from .scheduler import Scheduler, run_async, DEFAULT_SLICE
+
+__all__ = [
+    "Scheduler",
+    "run_async",
+    "DEFAULT_SLICE",
+]
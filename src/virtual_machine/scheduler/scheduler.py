@@ -0,0 +1,82 @@
+import asyncio
+import contextlib
+from typing import TextIO
+from src.errors.execution_errors import BudgetExceededError
+from src.virtual_machine.program_image import ProgramImage
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+# instructions a program runs before it lets the others run
+DEFAULT_SLICE = 1000
+
+
+async def run_async(vm: VirtualMachine, slice_size: int = DEFAULT_SLICE, budget: int | None = None,
+                    deadline: float | None = None, output: TextIO | None = None) -> int:
+    """
+    Runs the program in slices of `slice_size` instructions, yielding to the event loop
+    after each one. Returns the number of instructions executed.
+
+    The program stops with `BudgetExceededError` after `budget` instructions, and with
+    `TimeoutError` when the loop time passes `deadline`. Cancelling the task stops it
+    between two slices. What the program prints goes to `output` (stdout by default).
+    """
+    if slice_size < 1:
+        raise ValueError("slice_size must be at least 1")
+    redirect = contextlib.redirect_stdout(output) if output is not None else contextlib.nullcontext()
+
+    async with asyncio.timeout_at(deadline):
+        while not vm.finished:
+            limit = slice_size
+            if budget is not None:
+                if vm.instructions_executed >= budget:
+                    raise BudgetExceededError(budget)
+                limit = min(limit, budget - vm.instructions_executed)
+            with redirect:
+                vm.step(limit)
+            # the ready callbacks run in order, so every program gets a slice before this one resumes
+            await asyncio.sleep(0)
+    return vm.instructions_executed
+
+
+class Scheduler:
+    """
+    Time-slices many programs in the running event loop.
+
+    Each program runs in its own asyncio task (see `run_async`), so one that loops
+    forever only delays the others by one slice at a time. `submit` returns the task:
+    await it for the instruction count, or cancel it to stop the program.
+    """
+
+    def __init__(self, slice_size: int = DEFAULT_SLICE):
+        if slice_size < 1:
+            raise ValueError("slice_size must be at least 1")
+        self.slice_size = slice_size
+        self.tasks: set[asyncio.Task] = set()
+
+
+    def submit(self, program: ProgramImage | VirtualMachine, budget: int | None = None,
+               timeout: float | None = None, output: TextIO | None = None,
+               name: str | None = None) -> asyncio.Task:
+        """
+        Starts a program. `timeout` counts in seconds from now, so time spent waiting
+        for a slice counts too. Must be called from the event loop.
+        """
+        vm = program if isinstance(program, VirtualMachine) else VirtualMachine.from_image(program)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        task = loop.create_task(run_async(vm, self.slice_size, budget, deadline, output), name=name)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+
+    def cancel_all(self) -> None:
+        """Cancels every running program."""
+        for task in self.tasks:
+            task.cancel()
+
+
+    async def join(self) -> None:
+        """Waits until every submitted program has finished, failed or been cancelled."""
+        while self.tasks:
+            await asyncio.wait(list(self.tasks))
@@ -0,0 +1,5 @@
+from .shared_image import SharedImage
+
+__all__ = [
+    "SharedImage",
+]
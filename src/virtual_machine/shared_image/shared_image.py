@@ -0,0 +1,76 @@
+from __future__ import annotations
+from multiprocessing.shared_memory import SharedMemory
+from src.virtual_machine.artifact import encode_image, decode_image
+from src.virtual_machine.program_image import ProgramImage
+
+
+class SharedImage:
+    """
+    A program image in shared memory, in the binary artifact format.
+
+    `publish` copies an image into a new block once; worker processes `attach` to it by
+    name and get a read-only view. Their image decodes quadruples from the block only
+    when they are first executed, so the code is not copied into every worker: only the
+    per-run state (globals, frames, constants) is private. The publisher unlinks the
+    block on `close`. Attaching is meant for processes started through `multiprocessing`,
+    which share the publisher's resource tracker.
+    """
+
+    def __init__(self, shared_memory: SharedMemory, owner: bool):
+        self.shared_memory = shared_memory
+        self.owner = owner
+        self.buffer = shared_memory.buf.toreadonly()
+        self.image: ProgramImage = decode_image(self.buffer, f"shm:{shared_memory.name}", lazy=True)
+
+
+    @classmethod
+    def publish(cls, image: ProgramImage, name: str | None = None) -> SharedImage:
+        """Copies the image into a new shared memory block."""
+        data = encode_image(image)
+        shared_memory = SharedMemory(name=name, create=True, size=len(data))
+        try:
+            shared_memory.buf[:len(data)] = data
+            return cls(shared_memory, owner=True)
+        except BaseException:
+            shared_memory.close()
+            shared_memory.unlink()
+            raise
+
+
+    @classmethod
+    def attach(cls, name: str) -> SharedImage:
+        """Attaches to a block published by another process."""
+        shared_memory = SharedMemory(name=name)
+        try:
+            return cls(shared_memory, owner=False)
+        except BaseException:
+            shared_memory.close()
+            raise
+
+
+    @property
+    def name(self) -> str:
+        return self.shared_memory.name
+
+
+    def close(self) -> None:
+        """
+        Detaches from the block (unlinking it if this process published it).
+        Quadruples decoded so far stay usable, the others can no longer be read.
+        """
+        if self.buffer is None:
+            return
+        self.image.quadruples.release()
+        self.buffer.release()
+        self.buffer = None
+        self.shared_memory.close()
+        if self.owner:
+            self.shared_memory.unlink()
+
+
+    def __enter__(self) -> SharedImage:
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,19 +1,43 @@
-from src.intermediate_generation.constants_table import ConstantsTable
-from src.semantic.function_dir import FunctionDir
+from __future__ import annotations
+from typing import TYPE_CHECKING
 from src.virtual_machine.memory import Memory
 from src.virtual_machine.cpu import CPU
-from src.intermediate_generation.quadruple import Quadruple
+from src.virtual_machine.program_image import ProgramImage
+
+if TYPE_CHECKING:
+    # compile-time structures, only needed to build the image (see src.runtime)
+    from src.intermediate_generation.constants_table import ConstantsTable
+    from src.semantic.function_dir import FunctionDir
+    from src.intermediate_generation.quadruple import Quadruple
 
 
 class VirtualMachine:
     def __init__(self, quadruple_list: list[Quadruple],constants_table: ConstantsTable, function_dir: FunctionDir):
-        self.memory = Memory(constants_table, function_dir)
+        self._load(ProgramImage.from_compilation(quadruple_list, constants_table, function_dir))
+        
+
+    @classmethod
+    def from_image(cls, image: ProgramImage) -> VirtualMachine:
+        """Creates a virtual machine that runs an already built program image."""
+        vm = cls.__new__(cls)
+        vm._load(image)
+        return vm
+
+
+    def _load(self, image: ProgramImage) -> None:
+        self.memory = Memory(image)
         self.cpu = CPU(self.memory)
-        self.quadruples = quadruple_list
+        self.quadruples = image.quadruples
+        self.instructions_executed = 0
+        self.finished = False
         
         
-    def run(self) -> None:
-                
+    def run(self) -> int:
+        """
+        Runs the program until END_PROG, from where the previous `step` left it.
+        Returns the number of instructions executed by this call.
+        """
+        executed = 0
         while (True):
             current_instruction = self.cpu.get_next_instruction(self.quadruples)
             if current_instruction.operator == "END_PROG":
@@ -21,3 +45,50 @@ class VirtualMachine:
             
             self.cpu.perform_instruction(current_instruction)
             self.cpu.instruction_pointer += 1
+            executed += 1
+
+        self.instructions_executed += executed
+        self.finished = True
+        return executed
+
+
+    def step(self, max_instructions: int) -> int:
+        """
+        Runs at most `max_instructions` instructions and returns how many ran. Later calls
+        (or `run`) resume the program where it stopped; `finished` tells when it reached END_PROG.
+        """
+        cpu = self.cpu
+        quadruples = self.quadruples
+        executed = 0
+        while executed < max_instructions:
+            current_instruction = cpu.get_next_instruction(quadruples)
+            if current_instruction.operator == "END_PROG":
+                break
+
+            cpu.perform_instruction(current_instruction)
+            cpu.instruction_pointer += 1
+            executed += 1
+
+        self.instructions_executed += executed
+        self.finished = cpu.get_next_instruction(quadruples).operator == "END_PROG"
+        return executed
+
+
+    def run_profiled(self) -> list[int]:
+        """
+        Runs the program like `run` and returns how many times each quadruple was executed
+        by this call.
+        """
+        counts = [0] * len(self.quadruples)
+        while (True):
+            current_instruction = self.cpu.get_next_instruction(self.quadruples)
+            if current_instruction.operator == "END_PROG":
+                break
+
+            counts[self.cpu.instruction_pointer] += 1
+            self.cpu.perform_instruction(current_instruction)
+            self.cpu.instruction_pointer += 1
+
+        self.instructions_executed += sum(counts)
+        self.finished = True
+        return counts
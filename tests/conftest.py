@@ -1,23 +1,9 @@
 import pytest
-import ply.yacc as yacc
-from src.intermediate_generation.memory_manager import MemoryManager
-from src.semantic.function_dir.function_dir import FunctionDir
-from src.intermediate_generation.intermediate_generator import IntermediateGenerator
-from src.parser.parser import parser
-from src.lexer.lexer import lexer
+from src.compiler.compiler import Compiler
 
 @pytest.fixture
 def compiler():
-    # create new instances
-    mem  = MemoryManager()
-    fdir = FunctionDir(mem)
-    igen = IntermediateGenerator(fdir, mem)
+    # each test gets its own compilation session, with the syntax tree the parser tests check
+    session = Compiler(build_ast=True)
 
-    # add attributes to the parser
-    parser.memory_manager           = mem
-    parser.function_dir             = fdir
-    parser.intermediate_generator   = igen
-    parser.current_function         = 'global'
-    parser.current_type             = None
-
-    yield parser, lexer, igen
+    yield session.parser, session.lexer, session.intermediate_generator
@@ -0,0 +1,52 @@
+import pytest
+from benchmarks import bench_front_end
+from src.compiler.compiler import Compiler
+
+
+# ────────────────────────────────────────────────────────────────────
+# Generated sources follow the requested size and compile
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("size", ["1K", "10K", "40K"])
+def test_generated_source_size(size):
+    source = bench_front_end.generate_source(bench_front_end.parse_size(size))
+
+    assert abs(len(source) - bench_front_end.parse_size(size)) < 1024
+    assert len(Compiler().compile(source).quadruples) > 0
+
+
+# ────────────────────────────────────────────────────────────────────
+# Reductions are counted without touching other sessions
+# ────────────────────────────────────────────────────────────────────
+def test_count_reductions():
+    source = bench_front_end.generate_source(2048)
+    session = Compiler()
+    counter = bench_front_end.count_reductions(session)
+
+    session.compile(source)
+    first = counter[0]
+    session.compile(source)
+    Compiler().compile(source)
+
+    assert first > len(source) // 10
+    assert counter[0] == 2 * first
+
+
+# ────────────────────────────────────────────────────────────────────
+# Scaling exponents expose superlinear growth
+# ────────────────────────────────────────────────────────────────────
+def test_scaling_exponents():
+    sizes = [1, 10, 100, 100]
+    exponents = bench_front_end.scaling_exponents(sizes, [1.0, 10.0, 1000.0, 1000.0])
+
+    assert exponents[0] is None
+    assert exponents[1] == pytest.approx(1.0)
+    assert exponents[2] == pytest.approx(2.0)
+    assert exponents[3] is None
+
+
+def test_measure_reports_every_row():
+    results = bench_front_end.measure(bench_front_end.generate_source(1024))
+
+    assert results["ply lexer tokens"][0] == results["scanner tokens"][0]
+    assert results["ply quadruples"][0] == results["generator quadruples"][0]
+    assert all(seconds > 0 for _, seconds in results.values())
@@ -0,0 +1,58 @@
+import pytest
+from benchmarks import bench_vm
+from src.compiler.compiler import Compiler
+
+RESULT = {
+    "instructions": 1000,
+    "instructions_per_second": 100_000.0,
+    "wall_time": 0.01,
+    "peak_memory": 4096,
+    "call_depth": 3,
+}
+
+
+# ────────────────────────────────────────────────────────────────────
+# Every workload of the suite compiles
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("name", bench_vm.workload_names())
+def test_workload_compiles(name):
+    program = Compiler().compile_file(f"{bench_vm.WORKLOADS_DIR}/{name}{bench_vm.WORKLOAD_SUFFIX}")
+    assert len(program.quadruples) > 0
+
+
+def test_measure_reports_depth_and_memory():
+    result = bench_vm.measure("fibonacci_tr", 1, Compiler())
+
+    assert result["call_depth"] == 2002
+    assert result["peak_memory"] > 0
+    assert set(result) == set(RESULT)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Regressions beyond the threshold are reported
+# ────────────────────────────────────────────────────────────────────
+def test_within_threshold_passes():
+    current = {**RESULT, "instructions_per_second": 85_000.0, "peak_memory": 4500}
+    assert bench_vm.compare({"w": current}, {"w": RESULT}, threshold=0.2) == []
+
+
+@pytest.mark.parametrize("change", [
+    {"instructions_per_second": 70_000.0},
+    {"peak_memory": 8192},
+    {"instructions": 1200},
+])
+def test_regressions_are_reported(change):
+    regressions = bench_vm.compare({"w": {**RESULT, **change}}, {"w": RESULT}, threshold=0.2)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("w:")
+
+
+def test_new_workloads_are_not_regressions():
+    assert bench_vm.compare({"new": RESULT}, {}, threshold=0.2) == []
+
+
+def test_baseline_round_trip(tmp_path):
+    path = str(tmp_path / "baselines" / "vm.json")
+    bench_vm.write_baseline(path, {"w": RESULT})
+
+    assert bench_vm.load_baseline(path) == {"w": RESULT}
@@ -0,0 +1,146 @@
+import json
+import pytest
+from src.cli import main, warm_compiler, load_program
+from src.compiler.compiler import compile_source
+from src.compiler.program_layout import ProgramLayoutError
+from src.errors.internal_compiler_error import CompilerBug
+from src.virtual_machine.artifact import is_artifact, load_artifact
+
+SOURCE = """
+program fib;
+var n, a, b, t, i: int;
+
+void step(k: int) [{
+    t = a + b;
+    a = b;
+    b = t;
+}];
+
+main {
+    n = 20;
+    a = 0;
+    b = 1;
+    i = 0;
+    while (i < n) do {
+        step(i);
+        i = i + 1;
+    };
+    print(a);
+}
+end
+"""
+
+
+@pytest.fixture
+def source_path(tmp_path):
+    path = tmp_path / "fib.bd"
+    path.write_text(SOURCE)
+    return path
+
+
+# ────────────────────────────────────────────────────────────────────
+# compile writes an artifact that run executes
+# ────────────────────────────────────────────────────────────────────
+def test_compile_and_run(source_path, tmp_path, capsys):
+    assert main(["compile", str(source_path)]) == 0
+    artifact = tmp_path / "fib.bdo"
+    assert is_artifact(str(artifact))
+
+    capsys.readouterr()
+    assert main(["run", str(artifact)]) == 0
+    assert capsys.readouterr().out == "6765\n"
+
+
+def test_run_source_with_descent_parser(source_path, capsys):
+    assert main(["run", str(source_path), "--parser", "descent", "--scanner", "fast"]) == 0
+    assert capsys.readouterr().out == "6765\n"
+
+
+def test_compile_writes_metrics(source_path, tmp_path):
+    metrics_path = tmp_path / "metrics.json"
+    assert main(["compile", str(source_path), "-o", str(tmp_path / "out.bdo"),
+                 "--metrics", str(metrics_path)]) == 0
+
+    assert json.loads(metrics_path.read_text())["phases"]["parsing"]["calls"] == 1
+
+
+# ────────────────────────────────────────────────────────────────────
+# bench reports instructions per second percentiles without the output
+# ────────────────────────────────────────────────────────────────────
+def test_bench(source_path, capsys):
+    assert main(["bench", str(source_path), "-n", "3", "--warmup", "0"]) == 0
+    out = capsys.readouterr().out
+
+    assert "6765" not in out
+    assert "3 runs, 268 instructions per run" in out
+    for label in ("p50", "p90", "p99", "mean"):
+        assert label in out
+
+
+# ────────────────────────────────────────────────────────────────────
+# profile prints the hot quadruples and functions
+# ────────────────────────────────────────────────────────────────────
+def test_profile(source_path, capsys):
+    assert main(["profile", str(source_path), "--top", "3"]) == 0
+    out = capsys.readouterr().out
+
+    assert out.startswith("268 instructions executed")
+    assert "hot quadruples:" in out
+    assert "step" in out and "main" in out
+
+
+# ────────────────────────────────────────────────────────────────────
+# One warm compiler per process
+# ────────────────────────────────────────────────────────────────────
+def test_compiler_is_shared(source_path):
+    load_program(str(source_path))
+    compiler = warm_compiler()
+    image = load_program(str(source_path))
+
+    assert warm_compiler() is compiler
+    assert image == compile_source(SOURCE).to_image()
+
+
+# ────────────────────────────────────────────────────────────────────
+# Errors are reported with an exit status
+# ────────────────────────────────────────────────────────────────────
+def test_errors(tmp_path, capsys):
+    assert main(["run", str(tmp_path / "missing.bd")]) == 1
+
+    broken = tmp_path / "broken.bd"
+    broken.write_text("program p; main { x = 1; } end")
+    assert main(["run", str(broken)]) == 1
+    assert "baby-duck: error:" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("error", [
+    ProgramLayoutError("expected ';' but found 'main'"),
+    RuntimeError("Out of memory for int in segment temp"),
+    CompilerBug("unbalanced jump stack"),
+])
+def test_other_errors_are_reported(source_path, monkeypatch, capsys, error):
+    def fail(*args, **kwargs):
+        raise error
+    monkeypatch.setattr("src.cli.cli.compile_module", fail)
+
+    assert main(["link", str(source_path)]) == 1
+    assert capsys.readouterr().err == f"baby-duck: error: {error}\n"
+
+
+@pytest.mark.parametrize("command", ["compile", "run"])
+def test_syntax_error(tmp_path, capsys, command):
+    invalid = tmp_path / "invalid.bd"
+    invalid.write_text("program p;\nmain {\n print(1 2); } end")
+
+    assert main([command, str(invalid)]) == 1
+    assert capsys.readouterr().err == \
+        "baby-duck: error: Syntax error at token 'CTE_INT' (value=2) line=3\n"
+    assert not (tmp_path / "invalid.bdo").exists()
+
+
+def test_compile_with_lines(source_path, tmp_path):
+    output = tmp_path / "lines.bdo"
+    assert main(["compile", str(source_path), "-o", str(output), "-g"]) == 0
+
+    image = load_artifact(str(output))
+    assert len(image.line_table) == len(image.quadruples)
@@ -0,0 +1,162 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from src.compiler.compiler import Compiler, compile_source
+from src.compiler.compile_cache import CompileCache, cache_key
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+SOURCE_TEMPLATE = """
+program cached;
+var i: int;
+main {
+    i = 0;
+    while (i < {n}) do {
+        i = i + 1;
+    };
+    print("done", i);
+}
+end
+"""
+
+
+def source_for(n: int) -> str:
+    return SOURCE_TEMPLATE.replace("{n}", str(n))
+
+
+@pytest.fixture
+def count_compiles(monkeypatch):
+    """Counts the calls to Compiler.compile."""
+    calls = []
+    original = Compiler.compile
+
+    def counting_compile(self, source):
+        calls.append(source)
+        return original(self, source)
+
+    monkeypatch.setattr(Compiler, "compile", counting_compile)
+    return calls
+
+
+def compile_in_worker(args):
+    directory, n = args
+    return CompileCache(directory).compile(source_for(n))
+
+
+# ────────────────────────────────────────────────────────────────────
+# The key depends on the source, the options and the compiler version
+# ────────────────────────────────────────────────────────────────────
+def test_cache_key_inputs():
+    key = cache_key(source_for(1))
+
+    assert key == cache_key(source_for(1))
+    assert key != cache_key(source_for(2))
+    assert key != cache_key(source_for(1), {"segment_capacity": 100})
+    assert key != cache_key(source_for(1), {"record_lines": True})
+    assert key != cache_key(source_for(1), version="0.0.0")
+    options = {"segment_capacity": 100, "record_lines": True}
+    assert cache_key("ab", options) == cache_key("ab", dict(reversed(options.items())))
+
+
+# ────────────────────────────────────────────────────────────────────
+# Options are normalised before hashing
+# ────────────────────────────────────────────────────────────────────
+def test_default_options_share_the_key():
+    key = cache_key(source_for(1))
+
+    assert key == cache_key(source_for(1), {})
+    assert key == cache_key(source_for(1), {"scanner": "ply", "record_lines": False})
+    assert key == cache_key(source_for(1), {"collect_metrics": True, "trace_memory": True})
+    assert key == cache_key(source_for(1), {"build_ast": True})
+
+
+def test_unknown_options_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="optimize"):
+        cache_key(source_for(1), {"optimize": True})
+    with pytest.raises(ValueError, match="optimize"):
+        CompileCache(str(tmp_path)).compile(source_for(1), {"optimize": True})
+
+
+def test_options_reach_the_compiler(tmp_path):
+    cache = CompileCache(str(tmp_path))
+
+    image = cache.compile(source_for(1), {"record_lines": True})
+
+    assert image.line_table
+    assert not cache.compile(source_for(1)).line_table
+
+
+# ────────────────────────────────────────────────────────────────────
+# A second compile of the same source is served from the cache
+# ────────────────────────────────────────────────────────────────────
+def test_hit_skips_compilation_and_runs(tmp_path, count_compiles, capsys):
+    cache = CompileCache(str(tmp_path))
+
+    first = cache.compile(source_for(3))
+    second = CompileCache(str(tmp_path)).compile(source_for(3))
+
+    assert len(count_compiles) == 1
+    assert second == first == compile_source(source_for(3)).to_image()
+
+    VirtualMachine.from_image(second).run()
+    assert capsys.readouterr().out == "done\n3\n"
+
+
+# ────────────────────────────────────────────────────────────────────
+# Writes are atomic: no temporary files are left behind
+# ────────────────────────────────────────────────────────────────────
+def test_no_temporary_files_left(tmp_path):
+    cache = CompileCache(str(tmp_path))
+    for n in range(3):
+        cache.compile(source_for(n))
+
+    assert len(cache) == 3
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        cache_key(source_for(n)) + ".image" for n in range(3))
+
+
+# ────────────────────────────────────────────────────────────────────
+# Unreadable entries are treated as misses
+# ────────────────────────────────────────────────────────────────────
+def test_corrupt_entry_is_a_miss(tmp_path, count_compiles):
+    cache = CompileCache(str(tmp_path))
+    key = cache_key(source_for(1))
+    (tmp_path / (key + ".image")).write_bytes(b"not a pickle")
+
+    assert cache.get(key) is None
+    cache.compile(source_for(1))
+    assert len(count_compiles) == 1
+
+
+# ────────────────────────────────────────────────────────────────────
+# The least recently used entries are evicted past the size bound
+# ────────────────────────────────────────────────────────────────────
+def test_lru_eviction(tmp_path):
+    cache = CompileCache(str(tmp_path))
+    keys = [cache_key(source_for(n)) for n in range(3)]
+    for n, key in enumerate(keys):
+        cache.compile(source_for(n))
+        os.utime(tmp_path / (key + ".image"), (1000 + n, 1000 + n))
+
+    # a hit makes the oldest entry the most recently used one
+    assert cache.get(keys[0]) is not None
+
+    entry_size = max(os.path.getsize(tmp_path / (k + ".image")) for k in keys)
+    cache.max_bytes = 2 * entry_size
+    cache.evict()
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+# ────────────────────────────────────────────────────────────────────
+# Several processes can share the same cache directory
+# ────────────────────────────────────────────────────────────────────
+def test_concurrent_processes(tmp_path):
+    jobs = [(str(tmp_path), n % 3) for n in range(12)]
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        images = list(pool.map(compile_in_worker, jobs))
+
+    for (_, n), image in zip(jobs, images):
+        assert image == compile_source(source_for(n)).to_image()
+    assert len(CompileCache(str(tmp_path))) == 3
@@ -0,0 +1,145 @@
+import io
+import json
+import tracemalloc
+import pytest
+from src.compiler.compiler import Compiler, compile_source
+from src.compiler.compile_metrics import CompileMetrics, PHASES
+from src.errors.semantic_errors import UndeclaredVariableError
+
+SOURCE = """
+program measured;
+var i, total: int;
+
+void add(a: int, b: int) [{
+    total = total + a * b;
+}];
+
+main {
+    i = 0;
+    total = 0;
+    while (i < 10) do {
+        add(i, 2);
+        i = i + 1;
+    };
+    print(total);
+}
+end
+"""
+
+
+def snapshot(program) -> tuple:
+    quads = [tuple(q) for q in program.quadruples]
+    return quads, program.constants_table.value_addr_map
+
+
+# ────────────────────────────────────────────────────────────────────
+# Metrics are only collected on request and do not change the output
+# ────────────────────────────────────────────────────────────────────
+def test_no_metrics_by_default():
+    assert compile_source(SOURCE).metrics is None
+
+
+@pytest.mark.parametrize("parser", ["ply", "descent"])
+def test_metrics_per_phase(parser):
+    program = Compiler(parser=parser, collect_metrics=True).compile(SOURCE)
+    metrics = program.metrics
+
+    assert snapshot(program) == snapshot(compile_source(SOURCE))
+    assert list(metrics.phases) == list(PHASES)
+    for phase in ("lexing", "parsing", "semantic", "codegen"):
+        assert metrics.phases[phase].calls > 0
+        assert metrics.phases[phase].wall_time > 0
+    assert metrics.phases["parsing"].calls == 1
+    assert metrics.phases["optimization"].calls == 0
+
+
+# ────────────────────────────────────────────────────────────────────
+# Nested phases are charged exclusively
+# ────────────────────────────────────────────────────────────────────
+def test_phases_add_up_to_the_total():
+    metrics = Compiler(collect_metrics=True).compile(SOURCE).metrics
+    phases = metrics.phases.values()
+
+    assert sum(p.wall_time for p in phases) == pytest.approx(metrics.total.wall_time, rel=0.05)
+    assert sum(p.cpu_time for p in phases) <= metrics.total.cpu_time + 1e-9
+
+
+def test_nested_phase_accounting(monkeypatch):
+    clock = iter([0, 1, 2, 3, 6, 7, 10, 11])
+    monkeypatch.setattr(CompileMetrics, "_now", lambda self: (next(clock), 0.0, 0))
+
+    metrics = CompileMetrics()
+    metrics.start()                 # 0
+    metrics.enter("parsing")        # 1
+    metrics.enter("codegen")        # 2
+    metrics.enter("semantic")       # 3
+    metrics.exit()                  # 6
+    metrics.exit()                  # 7
+    metrics.exit()                  # 10
+    metrics.stop()                  # 11
+
+    assert metrics.phases["parsing"].wall_time == 1 + 3
+    assert metrics.phases["codegen"].wall_time == 1 + 1
+    assert metrics.phases["semantic"].wall_time == 3
+    assert metrics.total.wall_time == 11
+
+
+# ────────────────────────────────────────────────────────────────────
+# Peak memory is traced on request
+# ────────────────────────────────────────────────────────────────────
+def test_trace_memory():
+    metrics = Compiler(trace_memory=True).compile(SOURCE).metrics
+
+    assert metrics.total.peak_memory > 0
+    assert metrics.total.peak_memory == max(p.peak_memory for p in metrics.phases.values())
+    assert not tracemalloc.is_tracing()
+
+
+# ────────────────────────────────────────────────────────────────────
+# Allocated blocks are a net figure
+# ────────────────────────────────────────────────────────────────────
+def test_allocated_blocks_are_net():
+    metrics = CompileMetrics()
+    kept = []
+    metrics.start()
+    metrics.enter("codegen")
+    for _ in range(100_000):
+        [object()]
+    metrics.exit()
+    metrics.enter("semantic")
+    kept.extend([object()] for _ in range(100_000))
+    metrics.exit()
+    metrics.stop()
+
+    assert abs(metrics.phases["codegen"].net_allocated_blocks) < 1_000
+    assert metrics.phases["semantic"].net_allocated_blocks >= 100_000
+
+
+# ────────────────────────────────────────────────────────────────────
+# Metrics can be written to JSON
+# ────────────────────────────────────────────────────────────────────
+def test_write_json(tmp_path):
+    metrics = Compiler(collect_metrics=True).compile(SOURCE).metrics
+    path = tmp_path / "metrics.json"
+    metrics.write_json(str(path))
+
+    report = json.loads(path.read_text())
+    assert report == metrics.to_dict()
+    assert set(report["phases"]) == set(PHASES)
+    assert set(report["total"]) == {"calls", "wall_time", "cpu_time", "net_allocated_blocks", "peak_memory"}
+
+
+# ────────────────────────────────────────────────────────────────────
+# Instrumentation is removed after the compilation, even after an error
+# ────────────────────────────────────────────────────────────────────
+def test_instrumentation_is_removed():
+    session = Compiler(collect_metrics=True, trace_memory=True)
+    program = session.compile_stream(io.BytesIO(SOURCE.encode("utf-8")), chunk_size=16)
+
+    assert "get_var" not in vars(program.function_dir)
+    assert "push_operand" not in vars(session.intermediate_generator)
+
+    with pytest.raises(UndeclaredVariableError):
+        session.compile(SOURCE.replace("i = 0;", "j = 0;"))
+    assert "get_var" not in vars(session.function_dir)
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,198 @@
+import tracemalloc
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.compiler.compiler import Compiler, compile_source
+from src.parser.parser import parser as module_parser
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+PROGRAM_TEMPLATE = """
+program p{n};
+var i, total: int;
+    x: float;
+
+void add(a: int, b: int) [
+    var tmp: float;
+    {
+        tmp = a * b + {n}.5;
+        x = x + tmp;
+    }
+];
+
+main {
+    i = 0;
+    total = 0;
+    x = 0.0;
+    while (i < {n}) do {
+        total = total + i * {n};
+        add(i, 2);
+        i = i + 1;
+    };
+    print(total, x);
+}
+end
+"""
+
+
+def source_for(n: int) -> str:
+    return PROGRAM_TEMPLATE.replace("{n}", str(n))
+
+
+def snapshot(program) -> tuple:
+    """A comparable view of a compiled program."""
+    quads = [tuple(q) for q in program.quadruples]
+    consts = sorted(program.constants_table.value_addr_map.items(), key=lambda kv: kv[1])
+    starts = {name: f.initial_quad_index
+              for name, f in program.function_dir.get_function_dir().items()}
+    return quads, consts, starts
+
+
+def run(program, capsys) -> str:
+    VirtualMachine(program.quadruples.quadruples,
+                   program.constants_table,
+                   program.function_dir).run()
+    return capsys.readouterr().out
+
+
+# ────────────────────────────────────────────────────────────────────
+# A compiled program runs on the VM
+# ────────────────────────────────────────────────────────────────────
+def test_compile_and_run(capsys):
+    program = compile_source(source_for(3))
+
+    assert program.syntax_tree is None
+    assert run(program, capsys) == "9\n16.5\n"
+
+
+# ────────────────────────────────────────────────────────────────────
+# The syntax tree is only built on request and does not change the code
+# ────────────────────────────────────────────────────────────────────
+def test_build_ast_on_request():
+    with_tree = Compiler(build_ast=True).compile(source_for(3))
+
+    assert with_tree.syntax_tree.name == "Program"
+    assert snapshot(with_tree) == snapshot(compile_source(source_for(3)))
+
+
+def test_skipping_the_tree_lowers_peak_memory():
+    statements = "    total = total + i * (3 - x);\n" * 300
+    source = source_for(1).replace("    print(total, x);", statements + "    print(total, x);")
+
+    peaks = {}
+    for build_ast in (True, False):
+        session = Compiler(build_ast=build_ast)
+        tracemalloc.start()
+        session.compile(source)
+        peaks[build_ast] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    assert peaks[False] < 0.75 * peaks[True]
+
+
+# ────────────────────────────────────────────────────────────────────
+# The source line of each quadruple is recorded on request
+# ────────────────────────────────────────────────────────────────────
+LINES_SOURCE = """program lines;
+var a, b: int;
+void f(x: int) [
+  {
+    a = x * 2;
+    print(a);
+  }
+];
+main {
+  a = 1;
+  b = a + 2 * 3;
+  if (a > b) {
+    print("x");
+  } else {
+    f(b);
+  };
+  while (a < 3) do {
+    a = a + 1;
+  };
+}
+end
+"""
+
+
+@pytest.mark.parametrize("scanner, parser", [("ply", "ply"), ("fast", "descent")])
+def test_record_lines(scanner, parser):
+    program = Compiler(scanner=scanner, parser=parser, record_lines=True).compile(LINES_SOURCE)
+    lines = dict(zip(range(len(program.quadruples)), program.quadruples.lines))
+    by_operator = {}
+    for index, quadruple in enumerate(program.quadruples):
+        by_operator.setdefault(quadruple.operator, []).append(lines[index])
+
+    assert len(program.quadruples.lines) == len(program.quadruples)
+    assert by_operator["*"] == [5, 11]
+    assert by_operator["PRINT"] == [6, 13]
+    assert by_operator["END_FUNC"] == [8]
+    assert by_operator["GOSUB"] == [15]
+    assert by_operator["+"] == [11, 18]
+    assert by_operator["END_PROG"] == [20]
+
+
+def test_lines_are_not_recorded_by_default():
+    assert Compiler().compile(LINES_SOURCE).quadruples.lines.tolist() == []
+
+
+# ────────────────────────────────────────────────────────────────────
+# Syntax errors fail the compilation, with either front end
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("code, message", [
+    ("program p;\nmain {\n print(1 2); } end", "Syntax error at token 'CTE_INT' (value=2) line=3"),
+    ("program p; var a: int; main { a 1; } end", "Syntax error at token 'CTE_INT' (value=1) line=1"),
+    ("program p; main { } end end", "Syntax error at token 'END' (value='end') line=1"),
+    ("program p; main { }", "Syntax error at EOF"),
+])
+@pytest.mark.parametrize("parser", ["ply", "descent"])
+def test_syntax_errors_raise(code, message, parser):
+    with pytest.raises(SyntaxError) as error:
+        Compiler(parser=parser).compile(code)
+
+    assert str(error.value) == message
+
+
+def test_compiler_is_usable_after_a_syntax_error():
+    session = Compiler()
+    with pytest.raises(SyntaxError):
+        session.compile("program p;\nmain {\n print(1 2); } end")
+
+    assert snapshot(session.compile(source_for(4))) == snapshot(Compiler().compile(source_for(4)))
+
+
+# ────────────────────────────────────────────────────────────────────
+# Reusing a compiler does not leak state between programs
+# ────────────────────────────────────────────────────────────────────
+def test_reused_compiler_starts_from_scratch():
+    session = Compiler()
+    first = snapshot(session.compile(source_for(4)))
+    session.compile(source_for(7))
+    again = snapshot(session.compile(source_for(4)))
+
+    assert again == first
+    assert again == snapshot(Compiler().compile(source_for(4)))
+
+
+# ────────────────────────────────────────────────────────────────────
+# The module-level parser is never mutated
+# ────────────────────────────────────────────────────────────────────
+def test_module_parser_is_not_mutated():
+    compile_source(source_for(2))
+
+    assert not hasattr(module_parser, "intermediate_generator")
+    assert not hasattr(module_parser, "function_dir")
+
+
+# ────────────────────────────────────────────────────────────────────
+# Concurrent compilations produce the same output as sequential ones
+# ────────────────────────────────────────────────────────────────────
+def test_concurrent_compilations_match_sequential():
+    sizes = [n % 9 + 1 for n in range(64)]
+    expected = {n: snapshot(compile_source(source_for(n))) for n in set(sizes)}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda n: snapshot(compile_source(source_for(n))), sizes))
+
+    for n, result in zip(sizes, results):
+        assert result == expected[n]
@@ -1,6 +1,9 @@
 import pytest
 from src.intermediate_generation.memory_manager import MemoryManager
 from src.intermediate_generation.memory_manager import BLOCK_SIZE
+from src.compiler.compiler import Compiler
+
+CAPACITY = 100
 
 
 def compile_snippet(code, compiler):
@@ -69,17 +72,24 @@ def test_string_constants_and_duplicates(compiler):
 
 
 # ────────────────────────────────────────────────────────────────────
-# Respect BLOCK_SIZE and raise exception when exceeded
+# Respect the segment capacity and raise exception when exceeded
 # ────────────────────────────────────────────────────────────────────
-def test_constant_pool_overflow_raises(compiler):
+def test_constant_pool_overflow_raises():
     """Generates more integers than fit in the block."""
-    parser, lexer, gen = compiler
-
-    many_ints = ' + '.join(str(i) for i in range(BLOCK_SIZE + 1))
+    many_ints = ' + '.join(str(i) for i in range(CAPACITY + 1))
     code = f"program p;  var a:int; main {{ a = {many_ints}; }} end"
 
     with pytest.raises(RuntimeError, match="Out of memory"):
-        parser.parse(code, lexer=lexer)
+        Compiler(segment_capacity=CAPACITY).compile(code)
+
+
+def test_more_constants_than_the_former_block(compiler):
+    many_floats = ' + '.join(f"{i}.5" for i in range(2001))
+    code = f"program p;  var a:float; main {{ a = {many_floats}; }} end"
+    consts = compile_snippet(code, compiler)
+
+    assert consts[(2000.5, 'float')] == MemoryManager.get_base_addr('const', 'float') + 2000
+    assert CAPACITY < 2000 < BLOCK_SIZE
 
 
 # ────────────────────────────────────────────────────────────────────
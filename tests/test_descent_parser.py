@@ -0,0 +1,122 @@
+import pytest
+from src.compiler.compiler import Compiler
+from src.errors.semantic_errors import (
+    UndeclaredVariableError, UndeclaredFunctionError, WrongNumberOfParametersError, InvalidParameterTypeError,
+)
+
+PROGRAMS = [
+    "program empty; main { } end",
+    """
+    program full;
+    var i, total: int;
+        ratio, scale: float;
+
+    void square(x: int) [
+        var tmp: int;
+            half: float;
+        {
+            tmp = x * x;
+            half = tmp / 2.0;
+            total = total + tmp;
+            print("square", tmp, half);
+        }
+    ];
+
+    void noop() [{ }];
+
+    void countdown(k: int, step: int) [{
+        while (k > 0) do {
+            square(k);
+            k = k - step;
+        };
+        if (k != 0) { print("never"); } else { noop(); };
+    }];
+
+    main {
+        i = -3;
+        total = +0;
+        ratio = (2.5 * -1.0) + 4 / (2 - -1) * (1 + (2 - 3));
+        scale = ratio - -ratio;
+        countdown(i * -2, 1);
+        if (total < 100) { print(total); };
+        while (i < 0) do { i = i + 1; if (i > -1) { print("zero", i); }; };
+        print(total, ratio, scale, "ok", 1 < 2, i != 0);
+    }
+    end
+    """,
+    """
+    program nested;
+    var a: int;
+    main {
+        a = ((((1 + 2) * 3) - 4) / 5);
+        if (a > 0) { if (a < 10) { while (a != 0) do { a = a - 1; }; } else { a = 1; }; };
+        print(a);
+    }
+    end
+    """,
+]
+
+
+def snapshot(program) -> tuple:
+    """Everything the front end produces."""
+    functions = {
+        name: (f.type, f.initial_quad_index, f.signature, f.frame_resources,
+               list(f.var_table.get_vars()))
+        for name, f in program.function_dir.get_function_dir().items()
+    }
+    quads = [tuple(q) for q in program.quadruples]
+    return quads, program.constants_table.value_addr_map, functions, program.syntax_tree
+
+
+# ────────────────────────────────────────────────────────────────────
+# Same quadruples, constants, function directory and tree as PLY
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("source", PROGRAMS)
+@pytest.mark.parametrize("scanner", ["ply", "fast"])
+def test_conforms_to_ply_front_end(source, scanner):
+    expected = snapshot(Compiler(build_ast=True).compile(source))
+
+    assert snapshot(Compiler(scanner=scanner, parser="descent", build_ast=True).compile(source)) == expected
+
+
+def test_reused_session_conforms():
+    session = Compiler(parser="descent")
+    for source in PROGRAMS + PROGRAMS[::-1]:
+        program = session.compile(source)
+        assert program.syntax_tree is None
+        assert snapshot(program) == snapshot(Compiler().compile(source))
+
+
+# ────────────────────────────────────────────────────────────────────
+# Semantic errors are the same as with PLY
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("source, error", [
+    ("program p; main { x = 1; } end", UndeclaredVariableError),
+    ("program p; main { f(); } end", UndeclaredFunctionError),
+    ("program p; void f(a: int) [{ }]; main { f(); } end", WrongNumberOfParametersError),
+    ("program p; void f(a: int) [{ }]; main { f(1.5); } end", InvalidParameterTypeError),
+])
+def test_semantic_errors(source, error):
+    with pytest.raises(error):
+        Compiler().compile(source)
+    with pytest.raises(error):
+        Compiler(parser="descent").compile(source)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Syntax errors stop at the first unexpected token
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("source, message", [
+    ("program p;\nmain {\n print(1 2); } end", "Syntax error at token 'CTE_INT' (value=2) line=3"),
+    ("program p; var a: int; main { a 1; } end", "Syntax error at token 'CTE_INT' (value=1) line=1"),
+    ("program p; main { } end end", "Syntax error at token 'END' (value='end') line=1"),
+    ("program p; main { }", "Syntax error at EOF"),
+])
+def test_syntax_errors(source, message):
+    with pytest.raises(SyntaxError, match=message.replace("(", r"\(").replace(")", r"\)")):
+        Compiler(parser="descent").compile(source)
+
+
+def test_unknown_parser():
+    with pytest.raises(ValueError):
+        Compiler(parser="earley")
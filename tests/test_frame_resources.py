@@ -1,5 +1,8 @@
 import pytest
 from src.intermediate_generation.memory_manager import BLOCK_SIZE
+from src.compiler.compiler import Compiler
+
+CAPACITY = 100
 
 
 
@@ -70,9 +73,9 @@ def test_float_only_function(compiler):
 # ────────────────────────────────────────────────────────────────────
 # Local int overflow raises error
 # ────────────────────────────────────────────────────────────────────
-def test_local_int_overflow_raises(compiler):
-    # genera BLOCK_SIZE+1 variables int locales
-    many_vars = ", ".join(f"v{i}" for i in range(BLOCK_SIZE + 1))
+def test_local_int_overflow_raises():
+    # genera CAPACITY+1 variables int locales
+    many_vars = ", ".join(f"v{i}" for i in range(CAPACITY + 1))
     code = f"""
     program p;
     void explode() [
@@ -82,6 +85,20 @@ def test_local_int_overflow_raises(compiler):
     main {{ explode(); }} end
     """
 
-    parser, lexer, _ = compiler
     with pytest.raises(RuntimeError, match="Out of memory"):
-        parser.parse(code, lexer=lexer)
+        Compiler(segment_capacity=CAPACITY).compile(code)
+
+
+def test_more_locals_than_the_former_block(compiler):
+    many_vars = ", ".join(f"v{i}" for i in range(2001))
+    code = f"""
+    program p;
+    void wide() [
+        var {many_vars} : int;
+        {{ v2000 = 1; }}
+    ];
+    main {{ wide(); }} end
+    """
+    fr = get_function_frame_resources("wide", compiler, code)
+
+    assert fr.vars_int == 2001 < BLOCK_SIZE
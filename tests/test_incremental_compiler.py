@@ -0,0 +1,160 @@
+import pytest
+from src.compiler.compiler import compile_source
+from src.compiler.incremental_compiler import IncrementalCompiler
+from src.compiler.program_layout import split_program, ProgramLayoutError
+from src.errors.semantic_errors import UndeclaredFunctionError, InvalidParameterTypeError, DuplicateFunctionError
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+SOURCE = """
+program incremental;
+var n, result: int;
+    scale: float;
+
+void square(x: int) [
+    var tmp: int;
+    {
+        tmp = x * x;
+        result = result + tmp;
+        print("square", tmp);
+    }
+];
+
+void countdown(k: int) [{
+    while (k > 0) do {
+        square(k);
+        k = k - 1;
+    };
+    if (k != 0) { print("never"); } else { print("done"); };
+}];
+
+void scaled(f: float) [{
+    scale = f * 2.5 + 1.0;
+}];
+
+main {
+    n = 3;
+    result = 0;
+    countdown(n);
+    scaled(4.0);
+    print(result, scale, "ok");
+}
+end
+"""
+
+
+def build_and_run(builder, source, capsys) -> str:
+    image = builder.build(source)
+    assert image == compile_source(source).to_image()
+    VirtualMachine.from_image(image).run()
+    return capsys.readouterr().out
+
+
+# ────────────────────────────────────────────────────────────────────
+# The layout finds globals, functions, signatures and calls
+# ────────────────────────────────────────────────────────────────────
+def test_split_program():
+    layout = split_program(SOURCE)
+
+    assert "var n, result: int;" in layout.globals_text
+    assert [f.name for f in layout.functions] == ["square", "countdown", "scaled"]
+    assert [f.signature for f in layout.functions] == [["int"], ["int"], ["float"]]
+    assert layout.functions[1].calls == ["square"]
+    assert layout.main.calls == ["countdown", "scaled"]
+    assert layout.main.text.strip().endswith("end")
+
+
+@pytest.mark.parametrize("source", [
+    "program p; main { }",
+    "program p; void f( [ ]; main { } end",
+    "program p; main { } end extra",
+])
+def test_split_program_rejects_malformed(source):
+    with pytest.raises(ProgramLayoutError):
+        split_program(source)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Relinked units match a full compilation exactly
+# ────────────────────────────────────────────────────────────────────
+def test_first_build_matches_full_compile(capsys):
+    builder = IncrementalCompiler()
+    output = build_and_run(builder, SOURCE, capsys)
+
+    assert output.splitlines()[-4:] == ["done", "14", "11.0", "ok"]
+    assert builder.recompiled == ["square", "countdown", "scaled", "main"]
+
+
+# ────────────────────────────────────────────────────────────────────
+# Only the edited function is recompiled
+# ────────────────────────────────────────────────────────────────────
+def test_body_change_recompiles_one_function(capsys):
+    builder = IncrementalCompiler()
+    builder.build(SOURCE)
+
+    edited = SOURCE.replace("tmp = x * x;", "tmp = x * x * 10;")
+    output = build_and_run(builder, edited, capsys)
+
+    assert builder.recompiled == ["square"]
+    assert builder.reused == ["countdown", "scaled", "main"]
+    assert output.splitlines()[-3] == "140"
+
+
+def test_unchanged_source_recompiles_nothing():
+    builder = IncrementalCompiler()
+    builder.build(SOURCE)
+    builder.build(SOURCE)
+
+    assert builder.recompiled == []
+
+
+# ────────────────────────────────────────────────────────────────────
+# Signature and global changes invalidate the dependent units
+# ────────────────────────────────────────────────────────────────────
+def test_signature_change_recompiles_callers(capsys):
+    builder = IncrementalCompiler()
+    builder.build(SOURCE)
+
+    edited = SOURCE.replace("void scaled(f: float)", "void scaled(f: float, g: float)") \
+                   .replace("scaled(4.0);", "scaled(4.0, 1.0);")
+    build_and_run(builder, edited, capsys)
+
+    assert builder.recompiled == ["scaled", "main"]
+
+
+def test_globals_change_recompiles_everything(capsys):
+    builder = IncrementalCompiler()
+    builder.build(SOURCE)
+
+    build_and_run(builder, SOURCE.replace("scale: float;", "scale, unused: float;"), capsys)
+
+    assert builder.recompiled == ["square", "countdown", "scaled", "main"]
+
+
+def test_inserted_function_keeps_other_units(capsys):
+    builder = IncrementalCompiler()
+    builder.build(SOURCE)
+
+    edited = SOURCE.replace("void scaled(", "void extra() [{ print(7); }];\n\nvoid scaled(")
+    build_and_run(builder, edited, capsys)
+
+    assert builder.recompiled == ["extra"]
+
+
+# ────────────────────────────────────────────────────────────────────
+# Semantic errors are reported as in a full compilation
+# ────────────────────────────────────────────────────────────────────
+def test_errors_in_changed_units():
+    builder = IncrementalCompiler()
+    builder.build(SOURCE)
+
+    with pytest.raises(InvalidParameterTypeError):
+        builder.build(SOURCE.replace("scaled(4.0);", "scaled(4);"))
+
+    # functions can only call the ones declared before them
+    moved = SOURCE.replace("square(k);", "scaled(1.0);")
+    with pytest.raises(UndeclaredFunctionError):
+        builder.build(moved)
+
+    duplicated = SOURCE.replace("void scaled(", "void square(y: int) [{ }];\nvoid scaled(")
+    with pytest.raises(DuplicateFunctionError):
+        builder.build(duplicated)
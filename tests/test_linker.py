@@ -0,0 +1,157 @@
+import pytest
+from src.cli import main
+from src.compiler.compiler import compile_source
+from src.compiler.linker import link_modules
+from src.compiler.module_object import compile_module, write_module, load_module
+from src.errors.artifact_errors import InvalidArtifactError
+from src.errors.link_errors import LinkError, UnresolvedSymbolError, DuplicateSymbolError
+from src.errors.semantic_errors import UndeclaredFunctionError, UndeclaredVariableError
+from src.virtual_machine.artifact import load_artifact
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+LIBRARY = """
+program mathlib;
+var last: int;
+
+void square(x: int) [{
+    last = x * x;
+    print("square", last);
+}];
+
+void halve(f: float) [{
+    print(f / 2.0, 7);
+}];
+
+main { }
+end
+"""
+
+PROGRAM = """
+program app;
+var n: int;
+
+void twice(k: int) [{
+    square(k);
+    square(k + 7);
+}];
+
+main {
+    n = 3;
+    twice(n);
+    halve(5.0);
+    print(n, 7);
+}
+end
+"""
+
+EXPECTED = "square\n9\nsquare\n100\n2.5\n7\n3\n7\n"
+
+
+def run(image, capsys) -> str:
+    VirtualMachine.from_image(image).run()
+    return capsys.readouterr().out
+
+
+# ────────────────────────────────────────────────────────────────────
+# Modules export their functions and import the library ones
+# ────────────────────────────────────────────────────────────────────
+def test_module_symbols():
+    library = compile_module(LIBRARY)
+    program = compile_module(PROGRAM, [library])
+
+    assert library.name == "mathlib"
+    assert list(library.exports) == ["square", "halve"]
+    assert library.imports == {}
+    assert library.code[library.entry][0] == "END_PROG"
+    assert list(program.exports) == ["twice"]
+    assert program.imports == {"square": ["int"], "halve": ["float"]}
+    assert program.exports["twice"].initial_quad_index == 0
+
+
+def test_single_module_matches_full_compilation():
+    assert link_modules([compile_module(PROGRAM.replace("square", "print").replace("halve", "print"))]) \
+        == compile_source(PROGRAM.replace("square", "print").replace("halve", "print")).to_image()
+
+
+# ────────────────────────────────────────────────────────────────────
+# The linker relocates code, globals and deduplicated constants
+# ────────────────────────────────────────────────────────────────────
+def test_link_and_run(capsys):
+    library = compile_module(LIBRARY)
+    image = link_modules([compile_module(PROGRAM, [library]), library])
+
+    assert run(image, capsys) == EXPECTED
+    assert sorted(image.functions) == ["global", "halve", "square", "twice"]
+    assert list(image.constants.values()).count(7) == 1
+    assert len(set(image.global_addresses)) == 2
+    assert [quad.operator for quad in image.quadruples].count("END_PROG") == 1
+
+
+def test_entry_module(capsys):
+    library = compile_module(LIBRARY.replace("main { }", "main { square(4); }"))
+    program = compile_module(PROGRAM, [library])
+
+    assert run(link_modules([library, program], entry="app"), capsys) == EXPECTED
+    assert run(link_modules([program, library], entry="mathlib"), capsys) == "square\n16\n"
+
+
+# ────────────────────────────────────────────────────────────────────
+# Unresolved, duplicate and mismatched symbols are link errors
+# ────────────────────────────────────────────────────────────────────
+def test_link_errors():
+    library = compile_module(LIBRARY)
+    program = compile_module(PROGRAM, [library])
+
+    with pytest.raises(UnresolvedSymbolError, match="'square'"):
+        link_modules([program])
+    with pytest.raises(DuplicateSymbolError):
+        link_modules([program, library, library])
+    with pytest.raises(LinkError, match="square"):
+        link_modules([program, compile_module(LIBRARY.replace("x: int", "x: float"))])
+    with pytest.raises(LinkError):
+        link_modules([program, library], entry="missing")
+    with pytest.raises(LinkError):
+        link_modules([])
+
+
+def test_compile_errors_keep_their_lines():
+    library = compile_module(LIBRARY)
+
+    with pytest.raises(UndeclaredFunctionError):
+        compile_module(PROGRAM)
+    with pytest.raises(UndeclaredVariableError):
+        compile_module(PROGRAM.replace("square(k + 7);", "square(m);"), [library])
+    with pytest.raises(SyntaxError, match="line=7"):
+        compile_module(PROGRAM.replace("square(k + 7);", "square(k + );"), [library])
+
+
+# ────────────────────────────────────────────────────────────────────
+# Module objects are saved once and linked from the command line
+# ────────────────────────────────────────────────────────────────────
+def test_module_files(tmp_path, capsys):
+    (tmp_path / "mathlib.bd").write_text(LIBRARY)
+    (tmp_path / "app.bd").write_text(PROGRAM)
+
+    assert main(["compile", "--module", str(tmp_path / "mathlib.bd")]) == 0
+    library = load_module(str(tmp_path / "mathlib.bdm"))
+    assert library == compile_module(LIBRARY)
+
+    assert main(["link", str(tmp_path / "app.bd"), str(tmp_path / "mathlib.bdm")]) == 0
+    capsys.readouterr()
+    assert run(load_artifact(str(tmp_path / "app.bdo")), capsys) == EXPECTED
+
+    assert main(["link", str(tmp_path / "app.bd")]) == 1
+    assert "'square'" in capsys.readouterr().err
+
+
+def test_invalid_module_files(tmp_path):
+    path = str(tmp_path / "lib.bdm")
+    (tmp_path / "lib.bdm").write_bytes(b"not a module")
+    with pytest.raises(InvalidArtifactError):
+        load_module(path)
+
+    write_module(compile_module(LIBRARY), path)
+    data = (tmp_path / "lib.bdm").read_bytes()
+    (tmp_path / "lib.bdm").write_bytes(data[:len(data) // 2])
+    with pytest.raises(InvalidArtifactError):
+        load_module(path)
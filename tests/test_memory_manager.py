@@ -0,0 +1,48 @@
+import pytest
+from src.intermediate_generation.memory_manager import (
+    MemoryManager, BLOCK_SIZE, INDEX_BITS, SEGMENT_SHIFT, SEGMENT_CODE, TYPE_CODE,
+)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Segment, type and index live in fixed bit fields
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("segment", list(SEGMENT_CODE))
+@pytest.mark.parametrize("var_type", list(TYPE_CODE))
+@pytest.mark.parametrize("idx", [0, 1, 1999, 2000, BLOCK_SIZE - 1])
+def test_round_trip(segment, var_type, idx):
+    address = MemoryManager.get_base_addr(segment, var_type) + idx
+
+    assert address >> SEGMENT_SHIFT == SEGMENT_CODE[segment]
+    assert 0 < address < 2 ** 31
+    assert MemoryManager.decode_address(address) == (segment, var_type, idx)
+
+
+@pytest.mark.parametrize("address", [
+    -1, 0, 5 << SEGMENT_SHIFT, (1 << SEGMENT_SHIFT) | (3 << INDEX_BITS),
+])
+def test_invalid_addresses(address):
+    with pytest.raises(ValueError, match="Invalid address"):
+        MemoryManager.decode_address(address)
+
+
+# ────────────────────────────────────────────────────────────────────
+# The capacity is configurable up to the index field
+# ────────────────────────────────────────────────────────────────────
+def test_capacity():
+    manager = MemoryManager(capacity=2)
+    manager.new_addr("temp", "int")
+    manager.new_addr("temp", "int")
+    manager.new_addr("temp", "float")
+
+    with pytest.raises(RuntimeError, match="Out of memory"):
+        manager.new_addr("temp", "int")
+
+    manager.reset_segment("temp")
+    assert manager.new_addr("temp", "int") == MemoryManager.get_base_addr("temp", "int")
+
+
+@pytest.mark.parametrize("capacity", [0, BLOCK_SIZE + 1])
+def test_invalid_capacity(capacity):
+    with pytest.raises(ValueError):
+        MemoryManager(capacity)
@@ -0,0 +1,143 @@
+import pickle
+import sys
+import tracemalloc
+import pytest
+from src.compiler.compiler import compile_source
+from src.intermediate_generation.constants_table.constants_table import ConstantEntry
+from src.intermediate_generation.operands_stack.operands_stack import Operand
+from src.intermediate_generation.quadruple import Quadruple
+from src.semantic.function_dir.function_dir import Function
+from src.semantic.var_table import Var, VarTable
+from src.types import FunctionTypeEnum
+from src.virtual_machine.activation_record import ActivationRecord
+from src.virtual_machine.call_stack import CallStackEntry
+from src.virtual_machine.frame_resources import FrameResources
+from src.virtual_machine.function_runtime_info_map import FunctionRuntimeInfo
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+# a recursive function with locals of both types and temporaries
+REFERENCE_PROGRAM = """
+program deep;
+void down(n: int, acc: int) [
+    var x: int; y: float;
+    {
+        x = n * 2;
+        y = 1.5;
+        if (n > 0) {
+            down(n - 1, acc + x);
+        };
+    }
+];
+main {
+    down(DEPTH, 0);
+}
+end
+"""
+
+FRAME = FrameResources(2, 1, 3, 1)
+
+OBJECTS = {
+    "Var": Var("int", 1),
+    "Operand": Operand(1, "int"),
+    "ConstantEntry": ConstantEntry(1, "int"),
+    "Function": Function(FunctionTypeEnum.VOID, VarTable(), 0),
+    "FrameResources": FRAME,
+    "FunctionRuntimeInfo": FunctionRuntimeInfo(FRAME, ["int"], 0),
+    "CallStackEntry": CallStackEntry("f", ActivationRecord(FRAME), None),
+    "ActivationRecord": ActivationRecord(FRAME),
+    "Quadruple": Quadruple("+", 1, 2, 3),
+}
+
+
+def frame_usage(depth: int) -> tuple[int, int]:
+    """Live (bytes, blocks) when the reference program is at its deepest call."""
+    vm = VirtualMachine.from_image(compile_source(REFERENCE_PROGRAM.replace("DEPTH", str(depth))).to_image())
+    stack = vm.memory.call_stack.stack
+    push = vm.memory.push_pending_call_entry
+    deepest = []
+
+    def push_and_measure(return_index: int) -> None:
+        push(return_index)
+        if len(stack) == depth + 2:
+            deepest.append((tracemalloc.get_traced_memory()[0], sys.getallocatedblocks()))
+
+    vm.memory.push_pending_call_entry = push_and_measure
+    tracemalloc.start()
+    try:
+        vm.run()
+    finally:
+        tracemalloc.stop()
+    return deepest[0]
+
+
+# ────────────────────────────────────────────────────────────────────
+# The per-variable, per-operand and per-call objects have no __dict__
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("name", OBJECTS)
+def test_objects_are_slotted(name):
+    obj = OBJECTS[name]
+
+    assert not hasattr(obj, "__dict__")
+    assert sys.getsizeof(obj) <= 72
+
+
+@pytest.mark.parametrize("name", ["Var", "Operand", "ConstantEntry", "FrameResources",
+                                  "FunctionRuntimeInfo", "Quadruple"])
+def test_behaviour_is_kept(name):
+    obj = OBJECTS[name]
+
+    assert pickle.loads(pickle.dumps(obj)) == obj
+    assert repr(obj)
+
+
+def test_activation_record_segments():
+    record = ActivationRecord(FRAME)
+    record.set_value("local", "int", 1, 10)
+    record.set_value("local", "float", 0, 1.5)
+    record.set_value("temp", "int", 2, 7)
+    record.set_value("temp", "float", 0, 2.5)
+
+    assert record.get_value("local", "int", 1) == 10
+    assert record.get_value("temp", "int", 2) == 7
+    assert record.local_int == (None, 10)
+    assert record.local_float == (1.5,)
+    assert record.temp_int == (None, None, 7)
+    assert record.temp_float == (2.5,)
+
+
+@pytest.mark.parametrize("segment, var_type, size", [
+    ("local", "int", 2), ("local", "float", 1), ("temp", "int", 3), ("temp", "float", 1),
+])
+def test_activation_record_bounds(segment, var_type, size):
+    record = ActivationRecord(FRAME)
+
+    for idx in (size, -1):
+        with pytest.raises(IndexError):
+            record.get_value(segment, var_type, idx)
+        with pytest.raises(IndexError):
+            record.set_value(segment, var_type, idx, 1)
+    assert record.values == [None] * 7
+
+
+def test_out_of_segment_access_is_an_error(capsys):
+    # g reads a local float past the end of its frame, which must not reach the temps
+    source = """
+    program p;
+    void g(x: int, y: float) [ var t: int; { t = x + 1; print(y, t); } ];
+    main { g(1, 2.5); }
+    end
+    """
+    with pytest.raises(IndexError):
+        VirtualMachine.from_image(compile_source(source).to_image()).run()
+    assert capsys.readouterr().out == ""
+
+
+# ────────────────────────────────────────────────────────────────────
+# A call keeps a handful of small allocations alive
+# ────────────────────────────────────────────────────────────────────
+def test_per_call_footprint():
+    shallow_bytes, shallow_blocks = frame_usage(100)
+    deep_bytes, deep_blocks = frame_usage(600)
+
+    assert (deep_bytes - shallow_bytes) / 500 < 400
+    assert (deep_blocks - shallow_blocks) / 500 < 8
@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from benchmarks.program_generator import GeneratorOptions, generate_program
+from src.compiler.compiler import compile_source
+from src.compiler.parallel_compiler import ParallelCompiler
+from src.errors.semantic_errors import UndeclaredFunctionError, UndeclaredVariableError
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+SOURCE = """
+program parallel;
+var n, result: int;
+    scale: float;
+
+void square(x: int) [
+    var tmp: int;
+    {
+        tmp = x * x;
+        result = result + tmp;
+    }
+];
+
+void countdown(k: int) [{
+    while (k > 0) do {
+        square(k);
+        k = k - 1;
+    };
+    print("done");
+}];
+
+void scaled(f: float) [{
+    scale = f * 2.5 + 1.0;
+    if (f > 0.0) { scaled(f - 1.0); };
+}];
+
+main {
+    n = 3;
+    result = 0;
+    countdown(n);
+    scaled(4.0);
+    print(result, scale);
+}
+end
+"""
+
+
+# ────────────────────────────────────────────────────────────────────
+# The linked units make the same image as a full compilation
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("workers", [1, 2])
+def test_same_image(workers, capsys):
+    with ParallelCompiler(workers) as compiler:
+        image = compiler.compile(SOURCE)
+
+    assert image == compile_source(SOURCE).to_image()
+    VirtualMachine.from_image(image).run()
+    assert capsys.readouterr().out == "done\n14\n1.0\n"
+
+
+def test_generated_program():
+    source = "".join(generate_program(GeneratorOptions(seed=5, functions=30, statements=8)))
+
+    with ParallelCompiler(2) as compiler:
+        assert compiler.compile(source) == compile_source(source).to_image()
+        assert compiler.compile(source) == compile_source(source).to_image()
+
+
+# ────────────────────────────────────────────────────────────────────
+# Invalid programs are reported by the full compilation
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("source, error", [
+    (SOURCE.replace("square(k);", "cube(k);"), UndeclaredFunctionError),
+    (SOURCE.replace("tmp = x * x;", "tmp = x * ;"), SyntaxError),
+    (SOURCE.replace("main {", "main"), SyntaxError),
+    (SOURCE.replace("tmp = x * x;", "tmp = x * undeclared_var;"), UndeclaredVariableError),
+])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_errors(source, error, workers):
+    with pytest.raises(error) as expected:
+        compile_source(source)
+
+    with ParallelCompiler(workers) as compiler, pytest.raises(error) as raised:
+        compiler.compile(source)
+    assert str(raised.value) == str(expected.value)
+
+
+# ────────────────────────────────────────────────────────────────────
+# The pool is reused and only the owned one is shut down
+# ────────────────────────────────────────────────────────────────────
+def test_pool_lifetime():
+    compiler = ParallelCompiler(2)
+    compiler.compile(SOURCE)
+    pool = compiler._executor
+    compiler.compile(SOURCE)
+
+    assert compiler._executor is pool
+    compiler.close()
+    assert compiler._executor is None
+
+    with ThreadPoolExecutor(2) as executor:
+        with ParallelCompiler(2, executor=executor) as compiler:
+            compiler.compile(SOURCE)
+        assert executor.submit(int, "7").result() == 7
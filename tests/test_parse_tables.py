@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+from src.parser import build_tables
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# generous upper bound for `import src.parser.parser` in a fresh interpreter
+COLD_IMPORT_BUDGET_SECONDS = 0.5
+
+
+def run_python(code: str, cwd) -> str:
+    """Runs a snippet in a fresh interpreter and returns its stdout."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True,
+    )
+    assert result.stderr == ""  # PLY reports table problems on stderr
+    return result.stdout
+
+
+# ────────────────────────────────────────────────────────────────────
+# Shipped tables match the grammar and the token rules
+# ────────────────────────────────────────────────────────────────────
+def test_shipped_tables_are_current():
+    assert build_tables.stale_tables() == []
+
+
+# ────────────────────────────────────────────────────────────────────
+# Importing the parser does not write any file
+# ────────────────────────────────────────────────────────────────────
+def test_import_writes_no_files(tmp_path):
+    parser_dir = os.path.join(REPO_ROOT, "src", "parser")
+    before = set(os.listdir(parser_dir))
+
+    run_python("import src.parser.parser", cwd=tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+    assert set(os.listdir(parser_dir)) == before
+    assert "parser.out" not in before
+
+
+# ────────────────────────────────────────────────────────────────────
+# Cold import stays within the time budget
+# ────────────────────────────────────────────────────────────────────
+def test_cold_import_time_budget(tmp_path):
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import src.parser.parser\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    # best of a few runs to absorb scheduling noise
+    elapsed = min(float(run_python(code, cwd=tmp_path)) for _ in range(3))
+
+    assert elapsed < COLD_IMPORT_BUDGET_SECONDS
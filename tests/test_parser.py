@@ -1,4 +1,10 @@
 import pytest
+from src.intermediate_generation.intermediate_generator import IntermediateGenerator
+from src.intermediate_generation.memory_manager import MemoryManager
+from src.lexer.lexer import lexer
+from src.parser.parser import parser
+from src.semantic.function_dir.function_dir import FunctionDir
+
 
 def test_program_only_main(compiler):
     parser, lexer, _ = compiler
@@ -93,3 +99,23 @@ def test_print_strings_and_relops(compiler):
     end
     """
     assert parser.parse(code, lexer=lexer)
+
+
+# ────────────────────────────────────────────────────────────────────
+# The module-level parser can still be used directly
+# ────────────────────────────────────────────────────────────────────
+def test_global_parser():
+    memory_manager = MemoryManager()
+    function_dir = FunctionDir(memory_manager)
+    parser.memory_manager = memory_manager
+    parser.function_dir = function_dir
+    parser.intermediate_generator = IntermediateGenerator(function_dir, memory_manager)
+
+    code = """
+    program direct;
+    var a: int;
+    main { a = 1 + 2; print(a); }
+    end
+    """
+    assert parser.parse(code, lexer=lexer.clone())
+    assert len(parser.intermediate_generator.get_quadruples()) > 0
@@ -0,0 +1,31 @@
+import time
+import pytest
+from src.compiler.compiler import Compiler
+
+
+def long_program(statements: int) -> str:
+    return "program long;\nvar a: int;\nmain {\n" + "    a = 1;\n" * statements + "}\nend\n"
+
+
+def compile_time(session: Compiler, source: str) -> float:
+    start = time.perf_counter()
+    program = session.compile(source)
+    elapsed = time.perf_counter() - start
+
+    assert len(program.quadruples) == source.count("a = 1;") + 2
+    assert program.syntax_tree is not None
+    return elapsed
+
+
+# ────────────────────────────────────────────────────────────────────
+# Compile time grows linearly with the number of statements
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("parser", ["ply", "descent"])
+def test_long_body_compiles_in_linear_time(parser):
+    session = Compiler(scanner="fast", parser=parser, build_ast=True)
+    small = compile_time(session, long_program(10_000))
+    large = compile_time(session, long_program(100_000))
+
+    # 10x the statements: about 10x the time when linear, 100x when quadratic
+    assert large < 25 * small
+
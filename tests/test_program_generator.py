@@ -0,0 +1,89 @@
+import contextlib
+import io
+import pytest
+from benchmarks.program_generator import GeneratorOptions, generate_program, write_program
+from src.compiler.compiler import Compiler
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+
+def generate(**options) -> str:
+    return "".join(generate_program(GeneratorOptions(**options)))
+
+
+def compile_and_run(source: str) -> list[str]:
+    image = Compiler().compile(source).to_image()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        VirtualMachine.from_image(image).run()
+    return output.getvalue().splitlines()
+
+
+# ────────────────────────────────────────────────────────────────────
+# The same seed gives the same program
+# ────────────────────────────────────────────────────────────────────
+def test_seeded():
+    assert generate(seed=4) == generate(seed=4)
+    assert generate(seed=4) != generate(seed=5)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Generated programs compile and run to completion
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("options", [
+    {},
+    {"nesting": 4, "statements": 60, "expression_length": 8},
+    {"parameters": 0, "fan_out": 0, "variables": 1},
+    {"fan_out": 3, "call_depth": 3, "recursion": 1.0},
+    {"nesting": 0, "statements": 5},
+])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_programs_compile_and_run(options, seed):
+    source = generate(seed=seed, functions=5, **options)
+    output = compile_and_run(source)
+
+    # main prints every global at the end
+    assert len(output) >= 2 * GeneratorOptions(**options).variables
+
+
+def test_recursion_is_bounded_by_call_depth():
+    source = generate(functions=1, fan_out=2, recursion=1.0, call_depth=4, statements=0)
+    assert "f0(d - 1" in source
+    compile_and_run(source)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Long functions stay under the limit of temporaries
+# ────────────────────────────────────────────────────────────────────
+def test_long_functions_fit_the_temporaries():
+    source = generate(functions=1, statements=3000, expression_length=8, fan_out=1)
+    assert len(Compiler().compile(source).quadruples) > 3000
+
+
+# ────────────────────────────────────────────────────────────────────
+# The output is streamed and can target a size
+# ────────────────────────────────────────────────────────────────────
+def test_size_target():
+    options = GeneratorOptions(size=64 * 1024, statements=10)
+    chunks = list(generate_program(options))
+    source = "".join(chunks)
+
+    assert 64 * 1024 <= len(source) < 72 * 1024
+    assert max(len(chunk) for chunk in chunks) < 8 * 1024
+    assert len(Compiler().compile(source).quadruples) > 0
+
+
+def test_write_program(tmp_path):
+    path = tmp_path / "generated.bd"
+    with open(path, "w", encoding="utf-8") as f:
+        written = write_program(GeneratorOptions(functions=3), f)
+
+    assert path.stat().st_size == written
+    assert len(Compiler().compile_file(str(path)).quadruples) > 0
+
+
+@pytest.mark.parametrize("options", [
+    {"variables": 0}, {"functions": -1}, {"expression_length": 0}, {"recursion": 2.0}, {"fan_out": 1000},
+])
+def test_invalid_options(options):
+    with pytest.raises(ValueError):
+        generate(**options)
@@ -0,0 +1,126 @@
+import pickle
+import pytest
+from benchmarks.program_generator import GeneratorOptions, generate_program
+from src.compiler.compile_cache import cache_key
+from src.compiler.compiler import Compiler, compile_source
+from src.errors.internal_compiler_error import CompilerBug
+from src.intermediate_generation.quadruple import Quadruple
+from src.intermediate_generation.quadruple_stream import QuadrupleStream
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+SOURCE = """
+program spooled;
+var i, j, total: int;
+
+void add(k: int) [{
+    total = total + k;
+}];
+
+main {
+    total = 0;
+    i = 0;
+    while (i < 4) do {
+        j = 0;
+        while (j < 3) do {
+            if (j > 1) {
+                add(i);
+            } else {
+                add(1);
+            };
+            j = j + 1;
+        };
+        i = i + 1;
+    };
+    print(total);
+}
+end
+"""
+
+
+class WatchedStream(QuadrupleStream):
+    """Records the most quadruples held in memory at once."""
+    peak = 0
+
+    def emit(self, *fields) -> None:
+        super().emit(*fields)
+        WatchedStream.peak = max(WatchedStream.peak, len(self.opcodes))
+
+
+# ────────────────────────────────────────────────────────────────────
+# Spooled compilations generate the same code
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("window", [1, 2, 5, 1000])
+def test_same_code(window, capsys):
+    expected = [tuple(quad) for quad in compile_source(SOURCE).quadruples]
+
+    program = Compiler(spool_window=window).compile(SOURCE)
+
+    assert [tuple(quad) for quad in program.quadruples] == expected
+    assert [tuple(program.quadruples[idx]) for idx in range(len(expected))] == expected
+    assert tuple(program.quadruples[-1]) == expected[-1]
+
+    VirtualMachine.from_image(program.to_image()).run()
+    assert capsys.readouterr().out == "14\n"
+
+
+# ────────────────────────────────────────────────────────────────────
+# Memory holds at most the window, even for large programs
+# ────────────────────────────────────────────────────────────────────
+def test_window_bounds_memory(monkeypatch):
+    source = "".join(generate_program(GeneratorOptions(seed=3, functions=20, statements=12, nesting=3)))
+    monkeypatch.setattr("src.compiler.compiler.compiler.QuadrupleStream", WatchedStream)
+    WatchedStream.peak = 0
+
+    program = Compiler(spool_window=16).compile(source)
+
+    assert WatchedStream.peak <= 17
+    assert len(program.quadruples) > 1000
+    assert list(program.quadruples) == list(compile_source(source).quadruples)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Jumps patched after their quadruple was written land in the file
+# ────────────────────────────────────────────────────────────────────
+def test_patches_are_applied_on_finish(tmp_path):
+    file = open(tmp_path / "quads", "w+b")
+    file.write(b"header")
+    stream = QuadrupleStream(file, window=1)
+    stream.emit("GOTO", None, None, None)
+    stream.emit("ERA", None, None, "f")
+    stream.emit("GOSUB", None, None, "f")
+    stream.set_result(0, 2)
+
+    assert stream.patches == {0: 2}
+    assert tuple(stream[0]) == ("GOTO", None, None, 2)
+    assert tuple(stream.get_last_quadruple()) == ("GOSUB", None, None, "f")
+
+    stream.finish()
+    assert stream.patches == {}
+    assert stream.written == 3
+    assert [tuple(quad) for quad in stream] == [
+        ("GOTO", None, None, 2), ("ERA", None, None, "f"), ("GOSUB", None, None, "f"),
+    ]
+    with pytest.raises(CompilerBug):
+        stream.emit("END_PROG", None, None, None)
+    file.close()
+    assert (tmp_path / "quads").read_bytes().startswith(b"header")
+
+
+def test_invalid_uses(tmp_path):
+    with open(tmp_path / "quads", "w+b") as file:
+        with pytest.raises(ValueError):
+            QuadrupleStream(file, window=0)
+        stream = QuadrupleStream(file)
+        stream.append(Quadruple("END_PROG", None, None, None))
+        with pytest.raises(IndexError):
+            stream[1]
+        with pytest.raises(TypeError):
+            pickle.dumps(stream)
+
+
+# ────────────────────────────────────────────────────────────────────
+# The window does not change the cache key
+# ────────────────────────────────────────────────────────────────────
+def test_cache_key_ignores_the_window():
+    assert cache_key(SOURCE, {"spool_window": 8}) == cache_key(SOURCE)
+
@@ -0,0 +1,129 @@
+import pickle
+import tracemalloc
+import pytest
+from src.compiler.compiler import compile_source
+from src.errors.internal_compiler_error import CompilerBug
+from src.intermediate_generation.quadruple import Quadruple
+from src.intermediate_generation.quadruples_list import QuadruplesList, QuadrupleView
+
+SOURCE = """
+program p;
+var g: int;
+void f(n: int) [
+    {
+        g = g + n;
+    }
+];
+main {
+    g = 0;
+    while (g < 10) do {
+        f(3);
+    };
+    if (g > 5) {
+        print(g);
+    } else {
+        print("small");
+    };
+}
+end
+"""
+
+
+def filled(count: int) -> QuadruplesList:
+    quadruples = QuadruplesList()
+    for idx in range(count):
+        quadruples.append(Quadruple("+", 20_000_000 + idx, 30_000_000 + idx, 40_000_000 + idx))
+    return quadruples
+
+
+# ────────────────────────────────────────────────────────────────────
+# The compact list gives back the quadruples it was given
+# ────────────────────────────────────────────────────────────────────
+def test_round_trip():
+    quads = [
+        Quadruple("GOTO", None, None, 3),
+        Quadruple("ERA", None, None, "f"),
+        Quadruple("PARAM", 1, None, 0),
+        Quadruple("GOSUB", None, None, "f"),
+        Quadruple("ERA", None, None, "h"),
+        Quadruple("*", 5, 6, 7),
+        Quadruple("END_PROG", None, None, None),
+    ]
+    quadruples = QuadruplesList()
+    for quad in quads:
+        quadruples.append(quad)
+
+    assert list(quadruples) == quads
+    assert quadruples.to_quadruples() == quads
+    assert quadruples[-1] == quads[-1]
+    assert quadruples[1:4] == quads[1:4]
+    assert quadruples.symbols == ["f", "h"]
+    assert isinstance(quadruples[0], QuadrupleView)
+    assert quadruples.dump() == "\n" + "\n".join(f"{i:>3}: {quad}" for i, quad in enumerate(quads))
+
+    with pytest.raises(IndexError):
+        quadruples[len(quads)]
+    with pytest.raises(CompilerBug):
+        QuadruplesList().get_last_quadruple()
+
+
+# ────────────────────────────────────────────────────────────────────
+# Assigning the result of a view backpatches the stored quadruple
+# ────────────────────────────────────────────────────────────────────
+def test_backpatch_through_result():
+    quadruples = QuadruplesList()
+    quadruples.append(Quadruple("GOTOF", 5, None, None))
+    quadruples.append(Quadruple("ERA", None, None, "f"))
+
+    quadruples[0].result = 7
+    quadruples.get_last_quadruple().result = "g"
+
+    assert tuple(quadruples[0]) == ("GOTOF", 5, None, 7)
+    assert tuple(quadruples[1]) == ("ERA", None, None, "g")
+
+
+# ────────────────────────────────────────────────────────────────────
+# A compiled program keeps the same code and still runs
+# ────────────────────────────────────────────────────────────────────
+def test_compiled_program(capsys):
+    from src.virtual_machine.virtual_machine import VirtualMachine
+
+    program = compile_source(SOURCE)
+    image = program.to_image()
+
+    assert [tuple(quad) for quad in image.quadruples] == [tuple(quad) for quad in program.quadruples]
+    assert all(type(quad) is Quadruple for quad in image.quadruples)
+
+    VirtualMachine.from_image(image).run()
+    assert capsys.readouterr().out == "12\n"
+
+
+# ────────────────────────────────────────────────────────────────────
+# The columns pickle as buffers
+# ────────────────────────────────────────────────────────────────────
+def test_pickle():
+    program = compile_source(SOURCE)
+
+    restored = pickle.loads(pickle.dumps(program.quadruples))
+
+    assert list(restored) == list(program.quadruples)
+    assert restored.line_of is None
+
+
+# ────────────────────────────────────────────────────────────────────
+# The list takes a tenth of the memory of quadruple objects
+# ────────────────────────────────────────────────────────────────────
+def test_footprint():
+    count = 50_000
+
+    tracemalloc.start()
+    try:
+        compact = filled(count)
+        compact_size = tracemalloc.get_traced_memory()[0]
+        objects = compact.to_quadruples()
+        objects_size = tracemalloc.get_traced_memory()[0] - compact_size
+    finally:
+        tracemalloc.stop()
+
+    assert len(objects) == count
+    assert compact_size * 10 <= objects_size
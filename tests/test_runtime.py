@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+from benchmarks import bench_cold_start
+from src.compiler.compiler import compile_source
+from src.runtime import main
+from src.virtual_machine.artifact import write_artifact
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def write_program(tmp_path) -> str:
+    path = str(tmp_path / "hello.bdo")
+    write_artifact(compile_source(bench_cold_start.PROGRAM).to_image(), path)
+    return path
+
+
+# ────────────────────────────────────────────────────────────────────
+# The runtime runs artifacts
+# ────────────────────────────────────────────────────────────────────
+def test_run_artifacts(tmp_path, capsys):
+    path = write_program(tmp_path)
+
+    assert main([path, path]) == 0
+    assert capsys.readouterr().out == "hello\n3\n" * 2
+
+
+def test_run_as_module(tmp_path):
+    result = subprocess.run([sys.executable, "-m", "src.runtime", write_program(tmp_path)],
+                            cwd=REPO_ROOT, capture_output=True, text=True)
+
+    assert result.returncode == 0
+    assert result.stdout == "hello\n3\n"
+
+
+# ────────────────────────────────────────────────────────────────────
+# Sources, missing files and bad arguments are reported
+# ────────────────────────────────────────────────────────────────────
+def test_errors(tmp_path, capsys):
+    source = tmp_path / "hello.bd"
+    source.write_text(bench_cold_start.PROGRAM)
+
+    assert main([str(source)]) == 1
+    assert capsys.readouterr().err.startswith("baby-duck-run: error: Invalid program file")
+    assert main([str(tmp_path / "missing.bdo")]) == 1
+    assert main([]) == 2
+    capsys.readouterr()
+    assert main(["--help"]) == 0
+    assert capsys.readouterr().err.startswith("usage: baby-duck-run")
+
+
+# ────────────────────────────────────────────────────────────────────
+# Importing the runtime does not load the compiler
+# ────────────────────────────────────────────────────────────────────
+def test_runtime_does_not_import_the_compiler():
+    modules = bench_cold_start.runtime_modules()
+
+    assert "src.virtual_machine.virtual_machine" in modules
+    assert bench_cold_start.compiler_modules(modules) == []
+
+
+def test_compiler_modules_are_detected():
+    modules = ["src.parser.parser", "src.parser_tools", "ply", "src.virtual_machine.cpu", "dataclasses"]
+
+    assert bench_cold_start.compiler_modules(modules) == ["src.parser.parser", "ply", "dataclasses"]
@@ -0,0 +1,128 @@
+import pytest
+from src.compiler.compiler import Compiler
+from src.lexer.lexer import lexer as module_lexer, tokens
+from src.lexer.scanner import Scanner
+
+SOURCE = """
+program scanned;
+var i, total: int;
+    ratio: float;
+
+void show(v: int) [{
+    print("value\tof v", v);
+}];
+
+main {
+	i = 007;
+	total = 0;
+    ratio = 10.250 / 2.0;
+    while (i != 12) do {
+        if (total > i * 3 - 1) { total = total + 1; } else { show(i); };
+        i = i + 1;
+    };
+    print(total, ratio, "done", _under_score9);
+}
+end
+"""
+
+
+def ply_scan(code: str) -> list[tuple]:
+    lexer = module_lexer.clone()
+    lexer.lineno = 1
+    lexer.input(code)
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in lexer]
+
+
+def fast_scan(code: str) -> list[tuple]:
+    scanner = Scanner()
+    scanner.input(code)
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in scanner]
+
+
+def snapshot(program) -> tuple:
+    quads = [tuple(q) for q in program.quadruples]
+    return quads, program.constants_table.value_addr_map
+
+
+# ────────────────────────────────────────────────────────────────────
+# Same tokens, values, lines and positions as the PLY lexer
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("code", [
+    SOURCE,
+    "",
+    "   \t  ",
+    "\n\n\nx",
+    "1.5.2 3. .4 12ab",
+    'print("unterminated\nline") "" a!=b!c',
+    "program var int float void main if else while do print end",
+    "+ - * / < > != = ( ) { } [ ] : , ;",
+])
+def test_tokens_match_ply(code, capsys):
+    assert fast_scan(code) == ply_scan(code)
+
+
+def test_token_types_are_declared():
+    assert {tok[0] for tok in fast_scan(SOURCE)} <= set(tokens)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Illegal characters go through t_error, as with PLY
+# ────────────────────────────────────────────────────────────────────
+def test_illegal_characters(capsys):
+    code = "a @\n\nb $# c\r\n"
+    expected = ply_scan(code)
+    ply_output = capsys.readouterr().out
+
+    assert fast_scan(code) == expected
+    assert capsys.readouterr().out == ply_output
+    assert "Illegal character '$' at line 3" in ply_output
+
+
+@pytest.mark.parametrize("code", ["a  ", "x = 1 ; ", "a \n  ", " \t", "a\t\n\t \n"])
+def test_trailing_blanks_are_not_illegal(code, capsys):
+    expected = ply_scan(code)
+    ply_output = capsys.readouterr().out
+
+    assert fast_scan(code) == expected
+    assert capsys.readouterr().out == ply_output == ""
+
+
+# ────────────────────────────────────────────────────────────────────
+# Line numbers carry over between inputs, as in PLY
+# ────────────────────────────────────────────────────────────────────
+def test_lineno_is_kept_between_inputs():
+    scanner = Scanner()
+    scanner.input("a\nb\n")
+    list(scanner)
+    scanner.input("c")
+
+    assert scanner.token().lineno == 3
+    assert scanner.token() is None
+    assert scanner.lexpos == 1
+
+
+# ────────────────────────────────────────────────────────────────────
+# Compiling with the scanner gives the same program
+# ────────────────────────────────────────────────────────────────────
+def test_compile_with_fast_scanner():
+    expected = snapshot(Compiler().compile(SOURCE.replace("_under_score9", "i")))
+    session = Compiler(scanner="fast")
+
+    assert snapshot(session.compile(SOURCE.replace("_under_score9", "i"))) == expected
+    assert session.lexer.lineno == SOURCE.count("\n") + 1
+
+
+def test_syntax_error_report():
+    code = "program p;\n\nmain {\n print(1 2); } end"
+    with pytest.raises(SyntaxError) as ply_error:
+        Compiler().compile(code)
+    with pytest.raises(SyntaxError) as fast_error:
+        Compiler(scanner="fast").compile(code)
+
+    assert str(fast_error.value) == str(ply_error.value)
+    assert "line=4" in str(ply_error.value)
+
+
+def test_unknown_scanner():
+    with pytest.raises(ValueError):
+        Compiler(scanner="regex")
@@ -0,0 +1,118 @@
+import io
+import mmap
+import pytest
+from src.compiler.compiler import Compiler, compile_source
+from src.lexer.lexer import lexer as module_lexer
+from src.lexer.streaming_lexer import StreamingLexer
+
+SOURCE = """
+program stream;
+var i, total: int;
+
+
+main {
+    i = 0;
+    total = 0;
+    while (i < 10) do {
+        total = total + i * 2;
+        print("señal número", i);
+
+        i = i + 1;
+    };
+    print(total, 2.5);
+}
+end
+"""
+
+
+def scan(code: str) -> list[tuple]:
+    lexer = module_lexer.clone()
+    lexer.lineno = 1
+    lexer.input(code)
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in lexer]
+
+
+def stream_scan(code: str, chunk_size: int) -> list[tuple]:
+    lexer = StreamingLexer(io.BytesIO(code.encode("utf-8")), chunk_size=chunk_size)
+    lexer.lexer.lineno = 1
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in lexer]
+
+
+def snapshot(program) -> tuple:
+    quads = [tuple(q) for q in program.quadruples]
+    return quads, program.constants_table.value_addr_map
+
+
+# ────────────────────────────────────────────────────────────────────
+# Same tokens, lines and positions as the in-memory lexer
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 1 << 16])
+def test_tokens_match_whole_string_lexer(chunk_size):
+    assert stream_scan(SOURCE, chunk_size) == scan(SOURCE)
+
+
+def test_program_without_trailing_newline():
+    code = "program p;\n\n\nmain { print(1); } end"
+    assert stream_scan(code, 4) == scan(code)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Illegal characters report the right line across chunks
+# ────────────────────────────────────────────────────────────────────
+def test_error_line_across_chunks(capsys):
+    code = "x\n\n\n\ny @ z\n"
+    assert [t[0] for t in stream_scan(code, 2)] == ["ID", "ID", "ID"]
+    assert "Illegal character '@' at line 5" in capsys.readouterr().out
+
+
+# ────────────────────────────────────────────────────────────────────
+# Compiling from a stream, a file or an mmap matches compiling a string
+# ────────────────────────────────────────────────────────────────────
+def test_compile_stream_matches_compile():
+    expected = snapshot(compile_source(SOURCE))
+    stream = io.BytesIO(SOURCE.encode("utf-8"))
+
+    assert snapshot(Compiler().compile_stream(stream, chunk_size=5)) == expected
+
+
+def test_compile_file_and_mmap(tmp_path):
+    path = tmp_path / "program.bd"
+    path.write_text(SOURCE, encoding="utf-8")
+    expected = snapshot(compile_source(SOURCE))
+
+    assert snapshot(Compiler().compile_file(str(path), chunk_size=16)) == expected
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+        assert snapshot(Compiler().compile_stream(source, chunk_size=16)) == expected
+
+
+def test_reused_compiler_resets_line_numbers():
+    session = Compiler()
+    session.compile_stream(io.BytesIO(SOURCE.encode("utf-8")))
+    session.compile_stream(io.BytesIO(b"program p;\nvar x: int;\nmain {\n  x = 1;\n} end"))
+
+    # the line count restarted from 1 for the second program
+    assert session.lexer.lineno == 5
+
+
+# ────────────────────────────────────────────────────────────────────
+# Long lines are cut between tokens, outside string literals
+# ────────────────────────────────────────────────────────────────────
+LONG_LINE = "program long; var a: int; main { a = " + " + ".join(str(i) for i in range(500)) + \
+    '; print("a b  c", a, "d \t e", 1.5); print(" x "); } end'
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 16, 100])
+def test_long_line_matches_whole_string_lexer(chunk_size):
+    assert stream_scan(LONG_LINE, chunk_size) == scan(LONG_LINE)
+
+
+def test_long_line_is_not_buffered_whole(monkeypatch):
+    inputs = []
+    lexer = StreamingLexer(io.BytesIO(LONG_LINE.encode("utf-8")), chunk_size=64)
+    feed = lexer.lexer.input
+    monkeypatch.setattr(lexer.lexer, "input", lambda text: inputs.append(text) or feed(text))
+    list(lexer)
+
+    assert "".join(inputs) == LONG_LINE
+    assert max(len(text) for text in inputs) <= 2 * 64
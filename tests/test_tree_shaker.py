@@ -0,0 +1,139 @@
+import pytest
+from benchmarks.program_generator import GeneratorOptions, generate_program
+from src.cli import main
+from src.compiler.compiler import Compiler, compile_source
+from src.compiler.linker import link_modules
+from src.compiler.module_object import compile_module
+from src.compiler.tree_shaker import shake_image
+from src.intermediate_generation.memory_manager import MemoryManager
+from src.virtual_machine.artifact import load_artifact
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+SOURCE = """
+program shake;
+var used, written, copied: int;
+    ratio: float;
+
+void helper(x: int) [{
+    used = used + x;
+}];
+
+void unused(x: int) [{
+    print("never", x * 1000);
+    helper(x);
+}];
+
+void reached(x: int) [{
+    helper(x);
+    helper(x + 1);
+    if (x > 0) {
+        reached(x - 1);
+    };
+}];
+
+void orphan() [{
+    ratio = 3.75;
+}];
+
+main {
+    used = 0;
+    written = 41;
+    copied = written;
+    ratio = 0.5;
+    reached(2);
+    print("total", used);
+}
+end
+"""
+
+EXPECTED = "total\n9\n"
+
+
+def run(image, capsys) -> str:
+    VirtualMachine.from_image(image).run()
+    return capsys.readouterr().out
+
+
+# ────────────────────────────────────────────────────────────────────
+# Unused functions, globals and constants are removed
+# ────────────────────────────────────────────────────────────────────
+def test_removes_what_main_never_uses(capsys):
+    image = compile_source(SOURCE).to_image()
+    shaken = shake_image(image)
+
+    assert run(shaken, capsys) == run(image, capsys) == EXPECTED
+    assert sorted(shaken.functions) == ["global", "helper", "reached"]
+    assert len(shaken.global_addresses) == 1
+    assert sorted(map(str, shaken.constants.values())) == ["0", "1", "2", "total"]
+    assert len(shaken.quadruples) < len(image.quadruples)
+
+
+def test_addresses_and_indexes_are_compacted():
+    shaken = shake_image(compile_source(SOURCE).to_image())
+
+    for addresses in (shaken.global_addresses, list(shaken.constants)):
+        indexes = {}
+        for address in addresses:
+            segment, var_type, index = MemoryManager.decode_address(address)
+            indexes.setdefault((segment, var_type), []).append(index)
+        assert all(sorted(found) == list(range(len(found))) for found in indexes.values())
+
+    starts = [info.initial_quad_index for name, info in shaken.functions.items() if name != "global"]
+    assert all(shaken.quadruples[start - 1].operator in ("GOTO", "END_FUNC") for start in starts)
+    assert shaken.quadruples[shaken.quadruples[0].result - 1].operator == "END_FUNC"
+
+
+def test_line_table_follows_the_code():
+    image = Compiler(record_lines=True).compile(SOURCE).to_image()
+    shaken = shake_image(image)
+
+    kept = [tuple(quad) for quad in shaken.quadruples]
+    assert len(shaken.line_table) == len(kept)
+    assert shaken.line_table[-1] == image.line_table[-1]
+
+
+# ────────────────────────────────────────────────────────────────────
+# Programs that use everything do not change
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("seed", [0, 1])
+def test_used_programs_are_kept(seed):
+    source = "".join(generate_program(GeneratorOptions(seed=seed, functions=12, statements=8)))
+    image = compile_source(source).to_image()
+
+    assert shake_image(image) == image
+    assert shake_image(shake_image(image)) == shake_image(image)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Linked libraries only keep the routines the program calls
+# ────────────────────────────────────────────────────────────────────
+LIBRARY = """
+program lib;
+var calls: int;
+void one(x: int) [{ print("one", x); }];
+void two(x: int) [{ one(x); calls = x; print("two", calls); }];
+void three(x: int) [{ print("three", x * 3); }];
+main { }
+end
+"""
+
+PROGRAM = """
+program app;
+main { one(5); }
+end
+"""
+
+
+def test_linked_library(tmp_path, capsys):
+    library = compile_module(LIBRARY)
+    image = link_modules([compile_module(PROGRAM, [library]), library])
+    shaken = shake_image(image)
+
+    assert run(shaken, capsys) == run(image, capsys) == "one\n5\n"
+    assert sorted(shaken.functions) == ["global", "one"]
+    assert shaken.global_addresses == []
+
+    (tmp_path / "app.bd").write_text(PROGRAM)
+    (tmp_path / "lib.bd").write_text(LIBRARY)
+    assert main(["link", "--shake", str(tmp_path / "app.bd"), str(tmp_path / "lib.bd")]) == 0
+    assert load_artifact(str(tmp_path / "app.bdo")) == shaken
@@ -0,0 +1,148 @@
+import os
+import struct
+import subprocess
+import sys
+import pytest
+from src.compiler.compiler import Compiler, compile_source
+from src.errors.artifact_errors import InvalidArtifactError
+from src.virtual_machine.artifact import (
+    encode_image, decode_image, write_artifact, load_artifact, run_artifact, is_artifact,
+)
+from src.virtual_machine.artifact.artifact import HEADER, QUAD_RECORD
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SOURCE = """
+program artifact;
+var n, result: int;
+    ratio: float;
+
+void factorialTR(n: int, acc: int) [{
+    if (n > 1) {
+        factorialTR(n - 1, acc * n);
+    } else {
+        result = acc;
+    };
+}];
+
+main {
+    n = 6;
+    ratio = 1.5 * -2.0;
+    factorialTR(n, 1);
+    print("Factorial: ", result, ratio);
+}
+end
+"""
+
+
+# ────────────────────────────────────────────────────────────────────
+# Encoding and decoding round-trips the image
+# ────────────────────────────────────────────────────────────────────
+def test_round_trip():
+    image = compile_source(SOURCE).to_image()
+    image.line_table = list(range(len(image.quadruples)))
+
+    assert decode_image(encode_image(image)) == image
+
+
+def test_recorded_lines_round_trip(tmp_path):
+    program = Compiler(record_lines=True).compile(SOURCE)
+    image = program.to_image()
+
+    assert image.line_table == list(program.quadruples.lines)
+    assert len(image.line_table) == len(image.quadruples)
+    assert compile_source(SOURCE).to_image().line_table is None
+
+    path = tmp_path / "program.bdo"
+    write_artifact(image, str(path))
+    assert load_artifact(str(path)).line_table == image.line_table
+
+
+# ────────────────────────────────────────────────────────────────────
+# Quadruples are stored as fixed-width records
+# ────────────────────────────────────────────────────────────────────
+def test_quadruples_are_fixed_width():
+    small = compile_source("program p; main { print(1); } end").to_image()
+    large = compile_source(SOURCE).to_image()
+
+    growth = len(encode_image(large)) - len(encode_image(small))
+    assert len(encode_image(small)) < 300
+    assert growth > 16 * (len(large.quadruples) - len(small.quadruples))
+
+
+# ────────────────────────────────────────────────────────────────────
+# Compile to a file and run from it
+# ────────────────────────────────────────────────────────────────────
+def test_compile_to_file_and_run(tmp_path, capsys):
+    source_path = tmp_path / "program.bd"
+    artifact_path = tmp_path / "program.bdo"
+    source_path.write_text(SOURCE)
+
+    program = Compiler().compile_to_file(str(source_path), str(artifact_path))
+
+    assert is_artifact(str(artifact_path))
+    assert not is_artifact(str(source_path))
+    assert load_artifact(str(artifact_path)) == program.to_image()
+
+    run_artifact(str(artifact_path))
+    assert capsys.readouterr().out == "Factorial: \n720\n-3.0\n"
+
+
+# ────────────────────────────────────────────────────────────────────
+# Running a file does not import PLY or the front end
+# ────────────────────────────────────────────────────────────────────
+def test_run_without_front_end(tmp_path):
+    artifact_path = tmp_path / "program.bdo"
+    write_artifact(compile_source(SOURCE).to_image(), str(artifact_path))
+
+    code = (
+        "import sys\n"
+        "from src.virtual_machine.artifact import run_artifact\n"
+        f"run_artifact({str(artifact_path)!r})\n"
+        "loaded = [m for m in ('ply', 'src.lexer.lexer', 'src.parser.parser') if m in sys.modules]\n"
+        "print(loaded)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    result = subprocess.run([sys.executable, "-c", code], env=env,
+                            capture_output=True, text=True, check=True)
+
+    assert result.stdout.splitlines()[-1] == "[]"
+
+
+# ────────────────────────────────────────────────────────────────────
+# Invalid files are rejected
+# ────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("content", [b"", b"BDUCK", b"program p; main { } end", b"BDUCKOBJ\x63\x00\x00\x00"])
+def test_invalid_files(tmp_path, content):
+    path = tmp_path / "broken.bdo"
+    path.write_bytes(content)
+
+    with pytest.raises(InvalidArtifactError):
+        load_artifact(str(path))
+
+
+def test_truncated_file(tmp_path):
+    path = tmp_path / "truncated.bdo"
+    path.write_bytes(encode_image(compile_source(SOURCE).to_image())[:-10])
+
+    with pytest.raises(InvalidArtifactError):
+        load_artifact(str(path))
+
+
+def test_function_index_out_of_range():
+    image = compile_source(SOURCE).to_image()
+    data = bytearray(encode_image(image))
+    era = next(i for i, quad in enumerate(image.quadruples) if quad.operator == "ERA")
+    (quads_offset,) = struct.unpack_from("<Q", data, HEADER.size + 4)
+    struct.pack_into("<i", data, quads_offset + era * QUAD_RECORD.size + 12, -1)
+
+    with pytest.raises(InvalidArtifactError, match="function index -1"):
+        decode_image(bytes(data))
+
+
+def test_line_table_must_match_the_quadruples():
+    image = compile_source(SOURCE).to_image()
+    image.line_table = [1, 2]
+
+    with pytest.raises(InvalidArtifactError, match="line table"):
+        decode_image(encode_image(image))
@@ -0,0 +1,75 @@
+from src.compiler.compiler import Compiler, compile_source
+from src.virtual_machine.profiler import profile_image, function_of_quadruples
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+SOURCE = """
+program profiled;
+var i, total: int;
+
+void add(v: int) [{
+    total = total + v;
+}];
+
+void twice(v: int) [{
+    add(v);
+    add(v);
+}];
+
+main {
+    i = 0;
+    total = 0;
+    while (i < 5) do {
+        twice(i);
+        i = i + 1;
+    };
+    print(total);
+}
+end
+"""
+
+
+# ────────────────────────────────────────────────────────────────────
+# Counts match the instructions executed by a plain run
+# ────────────────────────────────────────────────────────────────────
+def test_counts_match_run(capsys):
+    image = compile_source(SOURCE).to_image()
+    profile = profile_image(image)
+
+    assert profile.instructions == VirtualMachine.from_image(image).run()
+    assert capsys.readouterr().out == "20\n20\n"
+
+
+# ────────────────────────────────────────────────────────────────────
+# Quadruples are attributed to the function that contains them
+# ────────────────────────────────────────────────────────────────────
+def test_function_attribution():
+    image = compile_source(SOURCE).to_image()
+    owners = function_of_quadruples(image)
+
+    assert owners[0] == "global"
+    assert owners[image.functions["add"].initial_quad_index] == "add"
+    assert owners[image.functions["twice"].initial_quad_index] == "twice"
+    assert owners[image.quadruples[0].result] == "main"
+    assert owners[-1] == "main"
+
+
+def test_calls_and_hot_quadruples(capsys):
+    profile = profile_image(compile_source(SOURCE).to_image())
+
+    assert profile.function_calls() == {"twice": 5, "add": 10}
+    instructions = profile.function_instructions()
+    assert instructions["add"] == 10 * 3
+    assert sum(instructions.values()) == profile.instructions
+
+    index, count = profile.hot_quadruples(1)[0]
+    assert count == max(profile.quadruple_counts)
+    assert "add" in profile.report()
+
+
+def test_report_shows_source_lines(capsys):
+    program = Compiler(record_lines=True).compile(SOURCE)
+    profile = profile_image(program.to_image())
+    index, _ = profile.hot_quadruples(1)[0]
+
+    hot_line = profile.report(1).splitlines()[4]
+    assert hot_line.split()[3] == str(program.quadruples.lines[index])
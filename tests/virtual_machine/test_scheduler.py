@@ -0,0 +1,150 @@
+import asyncio
+import contextlib
+import io
+import pytest
+from src.compiler.compiler import compile_source
+from src.errors.execution_errors import BudgetExceededError
+from src.virtual_machine.scheduler import Scheduler, run_async
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+SUM = compile_source("""
+program sum;
+var i, total: int;
+main {
+    i = 0;
+    total = 0;
+    while (i < 100) do {
+        total = total + i;
+        i = i + 1;
+    };
+    print("total", total);
+}
+end
+""").to_image()
+
+FOREVER = compile_source("""
+program forever;
+var i: int;
+main {
+    i = 0;
+    while (i < 1) do {
+        i = i * 1;
+    };
+}
+end
+""").to_image()
+
+
+def instructions_of(image) -> int:
+    """Instructions of a complete blocking run."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return VirtualMachine.from_image(image).run()
+
+
+# ────────────────────────────────────────────────────────────────────
+# Programs can be run a few instructions at a time
+# ────────────────────────────────────────────────────────────────────
+def test_step_resumes(capsys):
+    total = instructions_of(SUM)
+    vm = VirtualMachine.from_image(SUM)
+
+    assert vm.step(10) == 10
+    assert not vm.finished
+    steps = 1
+    while not vm.finished:
+        vm.step(7)
+        steps += 1
+
+    assert vm.instructions_executed == total
+    assert steps == 1 + -(-(total - 10) // 7)
+    assert vm.step(5) == 0
+    assert capsys.readouterr().out == "total\n4950\n"
+
+
+def test_run_after_step(capsys):
+    vm = VirtualMachine.from_image(SUM)
+    vm.step(50)
+    rest = vm.run()
+
+    assert vm.finished
+    assert vm.instructions_executed == 50 + rest == instructions_of(SUM)
+    assert capsys.readouterr().out == "total\n4950\n"
+
+
+def test_run_profiled_after_step(capsys):
+    vm = VirtualMachine.from_image(SUM)
+    vm.step(50)
+    counts = vm.run_profiled()
+
+    assert vm.finished
+    assert vm.instructions_executed == 50 + sum(counts) == instructions_of(SUM)
+    assert capsys.readouterr().out == "total\n4950\n"
+
+
+# ────────────────────────────────────────────────────────────────────
+# A program that never ends does not starve the others
+# ────────────────────────────────────────────────────────────────────
+def test_fair_time_slicing():
+    async def scenario():
+        scheduler = Scheduler(slice_size=50)
+        hog = scheduler.submit(FOREVER, name="hog")
+        outputs = [io.StringIO() for _ in range(100)]
+        tasks = [scheduler.submit(SUM, output=output) for output in outputs]
+
+        counts = await asyncio.gather(*tasks)
+        assert not hog.done()
+        hog.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await hog
+        await scheduler.join()
+        assert not scheduler.tasks
+        return counts, outputs
+
+    counts, outputs = asyncio.run(scenario())
+    assert counts == [instructions_of(SUM)] * 100
+    assert all(output.getvalue() == "total\n4950\n" for output in outputs)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Budgets, deadlines and cancellation stop a program
+# ────────────────────────────────────────────────────────────────────
+def test_budget():
+    exact = instructions_of(SUM)
+
+    async def scenario():
+        scheduler = Scheduler(slice_size=64)
+        over = scheduler.submit(FOREVER, budget=1000)
+        enough = scheduler.submit(SUM, budget=exact, output=io.StringIO())
+        with pytest.raises(BudgetExceededError):
+            await over
+        return await enough
+
+    count = asyncio.run(scenario())
+    assert count == exact
+
+
+def test_deadline_and_cancel_all():
+    async def scenario():
+        scheduler = Scheduler()
+        late = scheduler.submit(FOREVER, timeout=0.05)
+        with pytest.raises(TimeoutError):
+            await late
+
+        vm = VirtualMachine.from_image(FOREVER)
+        running = [scheduler.submit(vm), scheduler.submit(FOREVER)]
+        await asyncio.sleep(0.01)
+        scheduler.cancel_all()
+        await scheduler.join()
+        assert all(task.cancelled() for task in running)
+        return vm
+
+    vm = asyncio.run(scenario())
+    assert vm.instructions_executed > 0
+    assert not vm.finished
+
+
+def test_invalid_slice_size():
+    with pytest.raises(ValueError):
+        Scheduler(slice_size=0)
+    with pytest.raises(ValueError):
+        asyncio.run(run_async(VirtualMachine.from_image(SUM), slice_size=0))
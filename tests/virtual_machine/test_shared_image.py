@@ -0,0 +1,122 @@
+import contextlib
+import io
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from src.compiler.compiler import compile_source
+from src.errors.artifact_errors import InvalidArtifactError
+from src.virtual_machine.artifact import QuadrupleRecords, encode_image, decode_image
+from src.virtual_machine.shared_image import SharedImage
+from src.virtual_machine.virtual_machine import VirtualMachine
+
+SOURCE = """
+program shared;
+var n, result: int;
+
+void unused(x: int) [{
+    print("never", x * 2, x + 3);
+}];
+
+void factorialTR(n: int, acc: int) [{
+    if (n > 1) {
+        factorialTR(n - 1, acc * n);
+    } else {
+        result = acc;
+    };
+}];
+
+main {
+    n = 6;
+    factorialTR(n, 1);
+    print("Factorial: ", result);
+}
+end
+"""
+
+EXPECTED = "Factorial: \n720\n"
+
+
+def run_attached(name: str) -> str:
+    out = io.StringIO()
+    with SharedImage.attach(name) as shared, contextlib.redirect_stdout(out):
+        VirtualMachine.from_image(shared.image).run()
+    return out.getvalue()
+
+
+# ────────────────────────────────────────────────────────────────────
+# An attached image runs like the original one
+# ────────────────────────────────────────────────────────────────────
+def test_attach_and_run(capsys):
+    image = compile_source(SOURCE).to_image()
+
+    with SharedImage.publish(image) as published:
+        with SharedImage.attach(published.name) as attached:
+            assert list(attached.image.quadruples) == image.quadruples
+            assert attached.image.constants == image.constants
+            assert attached.image.functions == image.functions
+
+            VirtualMachine.from_image(attached.image).run()
+            VirtualMachine.from_image(attached.image).run()
+
+    assert capsys.readouterr().out == EXPECTED * 2
+
+
+# ────────────────────────────────────────────────────────────────────
+# Workers share one copy of the code
+# ────────────────────────────────────────────────────────────────────
+def test_workers_attach_by_name():
+    with SharedImage.publish(compile_source(SOURCE).to_image()) as published:
+        with ProcessPoolExecutor(max_workers=3) as pool:
+            outputs = list(pool.map(run_attached, [published.name] * 6))
+
+    assert outputs == [EXPECTED] * 6
+
+
+# ────────────────────────────────────────────────────────────────────
+# The view is read-only and only the executed code is decoded
+# ────────────────────────────────────────────────────────────────────
+def test_read_only_and_lazy(capsys):
+    image = compile_source(SOURCE).to_image()
+    unused_start = image.functions["unused"].initial_quad_index
+
+    with SharedImage.publish(image) as shared:
+        assert shared.buffer.readonly
+        with pytest.raises(TypeError):
+            shared.buffer[0] = 0
+
+        quadruples = shared.image.quadruples
+        assert isinstance(quadruples, QuadrupleRecords)
+        assert quadruples.decoded_count() == 0
+
+        VirtualMachine.from_image(shared.image).run()
+        assert 0 < quadruples.decoded_count() < len(quadruples)
+        assert quadruples._decoded[unused_start] is None
+    capsys.readouterr()
+
+
+# ────────────────────────────────────────────────────────────────────
+# Closing the publisher removes the block
+# ────────────────────────────────────────────────────────────────────
+def test_close_unlinks():
+    shared = SharedImage.publish(compile_source(SOURCE).to_image())
+    name = shared.name
+    first = shared.image.quadruples[0]
+    shared.close()
+    shared.close()
+
+    assert shared.image.quadruples[0] is first
+    with pytest.raises(FileNotFoundError):
+        SharedImage.attach(name)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Corrupt records are reported when they are decoded
+# ────────────────────────────────────────────────────────────────────
+def test_lazy_decoding_reports_corrupt_records():
+    image = compile_source(SOURCE).to_image()
+    era = next(i for i, quad in enumerate(image.quadruples) if quad.operator == "ERA")
+
+    records = decode_image(encode_image(image), lazy=True).quadruples
+    records._function_names = []
+    with pytest.raises(InvalidArtifactError, match="function index"):
+        records[era]
+    records.release()